@@ -23,6 +23,8 @@ from linker.steps.program_linker_utils import (
     XStoreMoveMapEntry,
     get_instruction_lat,
     get_instruction_tp,
+    index_cloads_by_register,
+    index_minstrs_by_spad,
     proc_seq_bloads,
     remove_csyncm,
     search_cinstrs_back,
@@ -411,6 +413,7 @@ class LinkedProgram:  # pylint: disable=too-many-instance-attributes
             return
 
         syncm_idx: int = 0  # Last sync point to minst
+        mload_index, minstr_index = index_minstrs_by_spad(kernel.minstrs_map)
 
         idx: int = 0
         while idx < len(kernel.cinstrs):
@@ -424,7 +427,7 @@ class LinkedProgram:  # pylint: disable=too-many-instance-attributes
             elif isinstance(cinstr, (cinst.CLoad, cinst.BLoad, cinst.BOnes)):
                 # Update CLoad/BLoad/BOnes SPAD addresses to new minst
                 if kernel.cinstrs_map[idx].action != InstrAct.SKIP:
-                    minstr_idx = search_minstrs_back(kernel.minstrs_map, syncm_idx, cinstr.spad_address)
+                    minstr_idx = search_minstrs_back(kernel.minstrs_map, syncm_idx, cinstr.spad_address, mload_index)
                     minstr = kernel.minstrs_map[minstr_idx].minstr
                     cinstr.var_name = minstr.var_name
                     # If variable already in tracker, use that SPAD address
@@ -440,7 +443,7 @@ class LinkedProgram:  # pylint: disable=too-many-instance-attributes
             elif isinstance(cinstr, cinst.CStore):
                 # Update CStore SPAD addresses to new minst
                 if kernel.cinstrs_map[idx].action != InstrAct.SKIP:
-                    minstr_idx = search_minstrs_forward(kernel.minstrs_map, syncm_idx, int(cinstr.spad_address))
+                    minstr_idx = search_minstrs_forward(kernel.minstrs_map, syncm_idx, int(cinstr.spad_address), minstr_index)
                     minstr = kernel.minstrs_map[minstr_idx].minstr
                     cinstr.var_name = minstr.var_name
                     cinstr.spad_address = minstr.spad_address
@@ -973,6 +976,7 @@ class LinkedProgram:  # pylint: disable=too-many-instance-attributes
         bundle_idx: int = -1  # Current bundle index
         ifetch_idx: int = -1  # Last ifetch index
         cstore_vars: list[str] = []  # List of cstore variable names in the current bundle
+        mload_index, minstr_index = index_minstrs_by_spad(kernel.minstrs_map) if GlobalConfig.hasHBM else ({}, {})
 
         idx: int = 0
         while idx < len(kernel.cinstrs):
@@ -994,10 +998,10 @@ class LinkedProgram:  # pylint: disable=too-many-instance-attributes
             elif GlobalConfig.hasHBM:
                 # Find var names from minst instruction by using last sync point and SPAD address
                 if isinstance(cinstr, (cinst.BLoad, cinst.BOnes, cinst.CLoad)):
-                    minstr_idx = search_minstrs_back(kernel.minstrs_map, syncm_idx, int(cinstr.spad_address))
+                    minstr_idx = search_minstrs_back(kernel.minstrs_map, syncm_idx, int(cinstr.spad_address), mload_index)
                     cinstr.var_name = kernel.minstrs_map[minstr_idx].minstr.var_name
                 elif isinstance(cinstr, cinst.CStore):
-                    minstr_idx = search_minstrs_forward(kernel.minstrs_map, syncm_idx, int(cinstr.spad_address))
+                    minstr_idx = search_minstrs_forward(kernel.minstrs_map, syncm_idx, int(cinstr.spad_address), minstr_index)
                     cinstr.var_name = kernel.minstrs_map[minstr_idx].minstr.var_name
                     # Map needed to later match xstores with cstores's var_name
                     cstore_vars.append(cinstr.var_name)
@@ -1020,6 +1024,7 @@ class LinkedProgram:  # pylint: disable=too-many-instance-attributes
 
         prev_bundle: int = -1  # Previous bundle index
         xstore_count: int = 0  # Count of XStore instructions in the current bundle
+        cload_index = index_cloads_by_register(kernel.cinstrs_map)  # Resolves Move sources to variable names
 
         idx: int = 0
         while idx < len(kernel.xinstrs):
@@ -1046,7 +1051,7 @@ class LinkedProgram:  # pylint: disable=too-many-instance-attributes
             elif isinstance(xinstr, xinst.Move):
                 # Find variable name from CStore map using bundle index
                 fetch_idx, _ = kernel.fetch_cstores_map[bundle_idx]
-                var_name = search_cinstrs_back(kernel.cinstrs_map, fetch_idx, xinstr.source)
+                var_name = search_cinstrs_back(kernel.cinstrs_map, fetch_idx, xinstr.source, cload_index)
 
                 # If move for intermediate var and var is tracked
                 if var_name in self._intermediate_vars and var_name in self._xstores_map:
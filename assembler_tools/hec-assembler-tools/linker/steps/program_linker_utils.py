@@ -6,6 +6,8 @@
 
 """@brief This module provides functionality to link kernels into a program."""
 
+from bisect import bisect_left, bisect_right
+
 from assembler.instructions import cinst as ISACInst
 from assembler.instructions import xinst as ISAXInst
 
@@ -85,6 +87,54 @@ class XStoreMoveMapEntry:
         self._action = action
 
 
+# Map linker instruction classes to their assembler counterparts. The getters are
+# resolved on the assembler class at call time so patched methods are honored.
+_TP_ISA_CLASSES = {
+    cinst.BLoad: ISACInst.BLoad,
+    cinst.BOnes: ISACInst.BOnes,
+    cinst.NLoad: ISACInst.NLoad,
+    cinst.XInstFetch: ISACInst.XInstFetch,
+    cinst.CLoad: ISACInst.CLoad,
+}
+
+_LAT_ISA_CLASSES = {
+    xinst.Add: ISAXInst.Add,
+    xinst.Sub: ISAXInst.Sub,
+    xinst.Mul: ISAXInst.Mul,
+    xinst.Muli: ISAXInst.Muli,
+    xinst.Mac: ISAXInst.Mac,
+    xinst.Maci: ISAXInst.Maci,
+    xinst.INTT: ISAXInst.iNTT,
+    xinst.NTT: ISAXInst.NTT,
+    xinst.TwNTT: ISAXInst.twNTT,
+    xinst.TwiNTT: ISAXInst.twiNTT,
+    xinst.XStore: ISAXInst.XStore,
+    xinst.Move: ISAXInst.Move,
+    xinst.Nop: ISAXInst.Nop,
+    xinst.RShuffle: ISAXInst.rShuffle,
+    xinst.Exit: ISAXInst.Exit,
+}
+
+
+def _lookup_isa_class(instr, isa_classes: dict):
+    """
+    @brief Finds the assembler class matching a linker instruction.
+
+    Exact types are resolved with a single dict lookup; subclasses and spec'd
+    objects fall back to an isinstance scan in table order.
+
+    @param instr The linker instruction.
+    @param isa_classes Map from linker instruction class to assembler class.
+    @return The matching assembler class, or None if there is none.
+    """
+    isa_cls = isa_classes.get(type(instr))
+    if isa_cls is None:
+        for cls, candidate in isa_classes.items():
+            if isinstance(instr, cls):
+                return candidate
+    return isa_cls
+
+
 def get_instruction_tp(cinstr) -> int:
     """
     @brief Get the latency for different instruction types.
@@ -92,17 +142,10 @@ def get_instruction_tp(cinstr) -> int:
     @param cinstr The instruction to calculate latency for.
     @return int The latency value.
     """
-    if isinstance(cinstr, cinst.BLoad):
-        return ISACInst.BLoad.get_throughput()
-    if isinstance(cinstr, cinst.BOnes):
-        return ISACInst.BOnes.get_throughput()
-    if isinstance(cinstr, cinst.NLoad):
-        return ISACInst.NLoad.get_throughput()
-    if isinstance(cinstr, cinst.XInstFetch):
-        return ISACInst.XInstFetch.get_throughput()
-    if isinstance(cinstr, cinst.CLoad):
-        return ISACInst.CLoad.get_throughput()
-    return 0
+    isa_cls = _lookup_isa_class(cinstr, _TP_ISA_CLASSES)
+    if isa_cls is None:
+        return 0
+    return isa_cls.get_throughput()
 
 
 def get_instruction_lat(xinstr) -> int:
@@ -112,32 +155,13 @@ def get_instruction_lat(xinstr) -> int:
     @param xinstr The instruction to calculate latency for.
     @return int The latency value.
     """
-    # Map xinstr classes to their corresponding assembler latency getter.
-    _lat_getters = {
-        xinst.Add: ISAXInst.Add.get_latency,
-        xinst.Sub: ISAXInst.Sub.get_latency,
-        xinst.Mul: ISAXInst.Mul.get_latency,
-        xinst.Muli: ISAXInst.Muli.get_latency,
-        xinst.Mac: ISAXInst.Mac.get_latency,
-        xinst.Maci: ISAXInst.Maci.get_latency,
-        xinst.INTT: ISAXInst.iNTT.get_latency,
-        xinst.NTT: ISAXInst.NTT.get_latency,
-        xinst.TwNTT: ISAXInst.twNTT.get_latency,
-        xinst.TwiNTT: ISAXInst.twiNTT.get_latency,
-        xinst.XStore: ISAXInst.XStore.get_latency,
-        xinst.Move: ISAXInst.Move.get_latency,
-        xinst.Nop: ISAXInst.Nop.get_latency,
-        xinst.RShuffle: ISAXInst.rShuffle.get_latency,
-        xinst.Exit: ISAXInst.Exit.get_latency,
-    }
-
-    for cls, getter in _lat_getters.items():
-        if isinstance(xinstr, cls):
-            try:
-                return getter()
-            except (TypeError, AttributeError, ValueError):
-                return 0
-    return 0
+    isa_cls = _lookup_isa_class(xinstr, _LAT_ISA_CLASSES)
+    if isa_cls is None:
+        return 0
+    try:
+        return isa_cls.get_latency()
+    except (TypeError, AttributeError, ValueError):
+        return 0
 
 
 def proc_seq_bloads(kernel_cinstrs, kernel_cinstrs_map, cinst_in_var_tracker, start_idx):
@@ -150,16 +174,21 @@ def proc_seq_bloads(kernel_cinstrs, kernel_cinstrs_map, cinst_in_var_tracker, st
     @param start_idx Starting index for processing.
     @return int The last processed index.
     """
+    n_cinstrs = len(kernel_cinstrs)
+    n_loaded = 0
     idx = start_idx
-    tp = 0
     # Look ahead and process all consecutive BLoad instructions
-    while idx < len(kernel_cinstrs) and isinstance(kernel_cinstrs[idx], cinst.BLoad):
-        if kernel_cinstrs[idx].var_name in cinst_in_var_tracker:
+    while idx < n_cinstrs:
+        cinstr = kernel_cinstrs[idx]
+        if not isinstance(cinstr, cinst.BLoad):
+            break
+        if cinstr.var_name in cinst_in_var_tracker:
             kernel_cinstrs_map[idx].action = InstrAct.SKIP
         else:
-            tp += ISACInst.BLoad.get_throughput()
+            n_loaded += 1
         idx += 1
 
+    tp = n_loaded * ISACInst.BLoad.get_throughput() if n_loaded else 0
     # Adjust index since the calling loop will increment it again
     return (tp, idx - 1)
 
@@ -188,7 +217,31 @@ def remove_csyncm(kernel_cinstrs, kernel_cinstrs_map, idx):
     return adjust_idx, adjust_cycles
 
 
-def search_minstrs_back(minstrs_map: list, idx: int, spad_address: int) -> int:
+def index_minstrs_by_spad(minstrs_map: list) -> tuple[dict[int, list[int]], dict[int, list[int]]]:
+    """
+    @brief Indexes the MLoad/MStore entries of an MInstruction map by SPAD address.
+
+    The returned indices let search_minstrs_back and search_minstrs_forward answer
+    each query with a binary search instead of a linear scan of the map.
+
+    @param minstrs_map Map with MInstructions to index.
+
+    @return tuple (mload_index, minstr_index) Dictionaries from SPAD address to the
+            ascending map indices of the MLoads, and of the MLoads and MStores, respectively.
+    """
+    mload_index: dict[int, list[int]] = {}
+    minstr_index: dict[int, list[int]] = {}
+    for i, entry in enumerate(minstrs_map):
+        minstr = entry.minstr
+        if isinstance(minstr, minst.MLoad):
+            mload_index.setdefault(entry.spad_addr, []).append(i)
+        elif not isinstance(minstr, minst.MStore):
+            continue
+        minstr_index.setdefault(entry.spad_addr, []).append(i)
+    return mload_index, minstr_index
+
+
+def search_minstrs_back(minstrs_map: list, idx: int, spad_address: int, mload_index: dict[int, list[int]] | None = None) -> int:
     """
     @brief Searches for an MLoad based on its SPAD address.
 
@@ -198,6 +251,7 @@ def search_minstrs_back(minstrs_map: list, idx: int, spad_address: int) -> int:
     @param minstrs_map Map with MInstructions to search.
     @param idx Index to start searching from (inclusive, backwards).
     @param spad_address The SPAD address to search for.
+    @param mload_index Optional MLoad index of minstrs_map, as returned by index_minstrs_by_spad.
 
     @return int Index for the MLoad instruction associated with the SPAD address.
     """
@@ -205,15 +259,21 @@ def search_minstrs_back(minstrs_map: list, idx: int, spad_address: int) -> int:
     if idx < 0 or idx >= len(minstrs_map):
         raise IndexError(f"Index {idx} is out of bounds for minstrs_map of length {len(minstrs_map)}.")
 
-    for i in range(idx, -1, -1):
-        minstr = minstrs_map[i].minstr
-        if isinstance(minstr, minst.MLoad) and minstrs_map[i].spad_addr == spad_address:
-            return i
+    if mload_index is not None:
+        indices = mload_index.get(spad_address, [])
+        pos = bisect_right(indices, idx)
+        if pos > 0:
+            return indices[pos - 1]
+    else:
+        for i in range(idx, -1, -1):
+            minstr = minstrs_map[i].minstr
+            if isinstance(minstr, minst.MLoad) and minstrs_map[i].spad_addr == spad_address:
+                return i
 
     raise RuntimeError(f"Could not find MLoad with SPAD address {spad_address} in kernel MInsts.")
 
 
-def search_minstrs_forward(minstrs_map: list, idx: int, spad_address: int) -> int:
+def search_minstrs_forward(minstrs_map: list, idx: int, spad_address: int, minstr_index: dict[int, list[int]] | None = None) -> int:
     """
     @brief Searches for an MStore/MLoad based on its SPAD address
 
@@ -223,19 +283,45 @@ def search_minstrs_forward(minstrs_map: list, idx: int, spad_address: int) -> in
     @param minstrs_map Map with MInstructions to search.
     @param idx Index to start searching from (inclusive, forwards).
     @param spad_address The SPAD address to search for.
+    @param minstr_index Optional MLoad/MStore index of minstrs_map, as returned by index_minstrs_by_spad.
 
     @return int Index for the MInstruction associated with the SPAD address.
     """
-    # Traverse forwards from idx, including idx
-    for i in range(idx, len(minstrs_map)):
-        minstr = minstrs_map[i].minstr
-        if isinstance(minstr, (minst.MStore, minst.MLoad)) and minstrs_map[i].spad_addr == spad_address:
-            return i
+    if minstr_index is not None:
+        indices = minstr_index.get(spad_address, [])
+        pos = bisect_left(indices, idx)
+        if pos < len(indices):
+            return indices[pos]
+    else:
+        # Traverse forwards from idx, including idx
+        for i in range(idx, len(minstrs_map)):
+            minstr = minstrs_map[i].minstr
+            if isinstance(minstr, (minst.MStore, minst.MLoad)) and minstrs_map[i].spad_addr == spad_address:
+                return i
 
     raise RuntimeError(f"Could not find MStore with SPAD address {spad_address} in kernel MInsts.")
 
 
-def search_cinstrs_back(cinstrs_map: list, idx: int, reg_name: str) -> str:
+def index_cloads_by_register(cinstrs_map: list) -> dict[str, list[int]]:
+    """
+    @brief Indexes the CLoad entries of a CInstruction map by destination register.
+
+    The returned index lets search_cinstrs_back answer each query with a binary
+    search instead of a linear scan of the map.
+
+    @param cinstrs_map Map with CInstructions to index.
+
+    @return dict Dictionary from register name to the ascending map indices of the CLoads writing it.
+    """
+    cload_index: dict[str, list[int]] = {}
+    for i, entry in enumerate(cinstrs_map):
+        cinstr = entry.cinstr
+        if isinstance(cinstr, cinst.CLoad):
+            cload_index.setdefault(cinstr.register, []).append(i)
+    return cload_index
+
+
+def search_cinstrs_back(cinstrs_map: list, idx: int, reg_name: str, cload_index: dict[str, list[int]] | None = None) -> str:
     """
     @brief Searches for a CInstruction that writes to a specific register.
 
@@ -245,6 +331,7 @@ def search_cinstrs_back(cinstrs_map: list, idx: int, reg_name: str) -> str:
     @param cinstrs_map Map with CInstructions to search.
     @param idx Index to start searching from (inclusive, backwards).
     @param reg_name The register name to search for.
+    @param cload_index Optional CLoad index of cinstrs_map, as returned by index_cloads_by_register.
 
     @return str The variable name associated with the register.
     """
@@ -252,6 +339,12 @@ def search_cinstrs_back(cinstrs_map: list, idx: int, reg_name: str) -> str:
     if idx < 0 or idx >= len(cinstrs_map):
         raise IndexError(f"Index {idx} is out of bounds for cinstrs_map of length {len(cinstrs_map)}.")
 
+    if cload_index is not None:
+        indices = cload_index.get(reg_name, [])
+        pos = bisect_right(indices, idx)
+        # Variable names are read from the map since they may be updated after indexing
+        return cinstrs_map[indices[pos - 1]].cinstr.var_name if pos > 0 else ""
+
     for i in range(idx, -1, -1):
         cinstr = cinstrs_map[i].cinstr
         if isinstance(cinstr, cinst.CLoad) and cinstr.register == reg_name:
@@ -17,6 +17,11 @@ from linker.instructions.minst.minstruction import MInstruction
 from linker.kern_trace import KernelInfo
 from linker.steps.program_linker import LinkedProgram
 
+# Instruction types that reference a variable. Exact types are matched with a set
+# lookup; anything else (e.g. subclasses) goes through an isinstance check on the same types.
+_CINST_VAR_TYPES = frozenset((cinst.BLoad, cinst.CLoad, cinst.BOnes, cinst.NLoad, cinst.CStore))
+_MINST_VAR_TYPES = frozenset((minst.MLoad, minst.MStore))
+
 
 def discover_variables_spad(cinstrs: list):
     """
@@ -28,18 +33,17 @@ def discover_variables_spad(cinstrs: list):
     @return Yields an iterable over variable names identified in the listing
             of CInstructions specified.
     """
+    validate_name = Variable.validateName
     for idx, cinstr in enumerate(cinstrs):
-        if not isinstance(cinstr, CInstruction):
-            raise TypeError(f"Item {idx} in list of CInstructions is not a valid CInstruction.")
-        retval = None
-        # TODO: Implement variable counting for CInst
-        ###############
-        # Raise NotImplementedError("Implement variable counting for CInst")
-        if isinstance(cinstr, (cinst.BLoad, cinst.CLoad, cinst.BOnes, cinst.NLoad, cinst.CStore)):
+        if type(cinstr) in _CINST_VAR_TYPES:
             retval = cinstr.var_name
+        else:
+            if not isinstance(cinstr, CInstruction):
+                raise TypeError(f"Item {idx} in list of CInstructions is not a valid CInstruction.")
+            retval = cinstr.var_name if isinstance(cinstr, tuple(_CINST_VAR_TYPES)) else None
 
         if retval is not None:
-            if not Variable.validateName(retval):
+            if not validate_name(retval):
                 raise RuntimeError(f'Invalid Variable name "{retval}" detected in instruction "{idx}, {cinstr.to_line()}"')
             yield retval
 
@@ -54,15 +58,17 @@ def discover_variables(minstrs: list):
     @return Yields an iterable over variable names identified in the listing
             of MInstructions specified.
     """
+    validate_name = Variable.validateName
     for idx, minstr in enumerate(minstrs):
-        if not isinstance(minstr, MInstruction):
-            raise TypeError(f"Item {idx} in list of MInstructions is not a valid MInstruction.")
-        retval = None
-        if isinstance(minstr, (minst.MLoad, minst.MStore)):
+        if type(minstr) in _MINST_VAR_TYPES:
             retval = minstr.var_name
+        else:
+            if not isinstance(minstr, MInstruction):
+                raise TypeError(f"Item {idx} in list of MInstructions is not a valid MInstruction.")
+            retval = minstr.var_name if isinstance(minstr, tuple(_MINST_VAR_TYPES)) else None
 
         if retval is not None:
-            if not Variable.validateName(retval):
+            if not validate_name(retval):
                 raise RuntimeError(f'Invalid Variable name "{retval}" detected in instruction "{idx}, {minstr.to_line()}"')
             yield retval
 
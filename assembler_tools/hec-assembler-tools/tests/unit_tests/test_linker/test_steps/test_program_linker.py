@@ -8,25 +8,79 @@
 @brief Unit tests for the program_linker module.
 """
 
+import copy
 import io
-import unittest
 from unittest.mock import MagicMock, call, mock_open, patch
 
 import pytest
 from assembler.common import dinst
 from assembler.common.config import GlobalConfig
 from assembler.instructions import cinst as ISACInst
-from linker import MemoryModel
 from linker.instructions import cinst, minst, xinst
 from linker.kern_trace import InstrAct
 from linker.steps.program_linker import LinkedProgram
+from linker.steps.program_linker_utils import index_minstrs_by_spad
+
+# Module-level aliases for the instruction classes and actions used throughout these tests
+_MLoad = minst.MLoad
+_MStore = minst.MStore
+_MSyncc = minst.MSyncc
+_BLoad = cinst.BLoad
+_CLoad = cinst.CLoad
+_CSyncm = cinst.CSyncm
+_SKIP = InstrAct.SKIP
+_KEEP_SPAD = InstrAct.KEEP_SPAD
+
+
+class _FakeMInstr:
+    """@brief Plain-attribute stand-in for MInstructions that skips token parsing."""
+
+    __slots__ = ()
+
+    def __init__(self, **attrs):  # pylint: disable=super-init-not-called
+        for name, value in attrs.items():
+            setattr(self, name, value)
+
+    def clone(self, **attrs):
+        """@brief Returns a shallow copy of this fake with the given attributes overridden."""
+        new = copy.copy(self)
+        for name, value in attrs.items():
+            setattr(new, name, value)
+        return new
+
+
+class _FakeMLoad(_FakeMInstr, _MLoad):
+    """@brief Lightweight MLoad that still satisfies isinstance checks."""
+
+    __slots__ = ("var_name", "spad_address", "comment", "idx")
+
+
+class _FakeMStore(_FakeMInstr, _MStore):
+    """@brief Lightweight MStore that still satisfies isinstance checks."""
+
+    __slots__ = ("var_name", "spad_address", "comment", "idx")
+
+
+class _FakeMSyncc(_FakeMInstr, _MSyncc):
+    """@brief Lightweight MSyncc that still satisfies isinstance checks."""
+
+    __slots__ = ("comment", "idx")
 
 
 # pylint: disable=protected-access
-class TestLinkedProgram(unittest.TestCase):
+class _MapEntry:
+    """@brief Minimal instruction map entry exposing only a writable action."""
+
+    __slots__ = ("action",)
+
+    def __init__(self):
+        self.action = None
+
+
+class TestLinkedProgram:
     """@brief Tests for the LinkedProgram class."""
 
-    def setUp(self):
+    def setup_method(self):
         """@brief Set up test fixtures."""
         # Group related stream objects into a dictionary
         self.streams = {
@@ -34,7 +88,7 @@ class TestLinkedProgram(unittest.TestCase):
             "cinst": io.StringIO(),
             "xinst": io.StringIO(),
         }
-        self.mem_model = MagicMock(spec=MemoryModel)
+        self.mem_model = MagicMock()
 
         # Mock the hasHBM property to return True by default
         self.has_hbm_patcher = patch.object(GlobalConfig, "hasHBM", True)
@@ -53,7 +107,7 @@ class TestLinkedProgram(unittest.TestCase):
             self.mem_model,
         )
 
-    def tearDown(self):
+    def teardown_method(self):
         """@brief Tear down test fixtures."""
         self.has_hbm_patcher.stop()
         self.suppress_comments_patcher.stop()
@@ -63,24 +117,24 @@ class TestLinkedProgram(unittest.TestCase):
 
         @test Verifies that all instance variables are correctly initialized
         """
-        self.assertEqual(self.program._minst_ostream, self.streams["minst"])
-        self.assertEqual(self.program._cinst_ostream, self.streams["cinst"])
-        self.assertEqual(self.program._xinst_ostream, self.streams["xinst"])
-        self.assertEqual(self.program._LinkedProgram__mem_model, self.mem_model)
-        self.assertEqual(self.program._bundle_offset, 0)
-        self.assertEqual(self.program._minst_line_offset, 0)
-        self.assertEqual(self.program._cinst_line_offset, 0)
-        self.assertEqual(self.program._kernel_count, 0)
-        self.assertTrue(self.program.is_open)
+        assert self.program._minst_ostream == self.streams["minst"]
+        assert self.program._cinst_ostream == self.streams["cinst"]
+        assert self.program._xinst_ostream == self.streams["xinst"]
+        assert self.program._LinkedProgram__mem_model == self.mem_model
+        assert self.program._bundle_offset == 0
+        assert self.program._minst_line_offset == 0
+        assert self.program._cinst_line_offset == 0
+        assert self.program._kernel_count == 0
+        assert self.program.is_open
 
     def test_is_open_property(self):
         """@brief Test the is_open property.
 
         @test Verifies that the is_open property reflects the internal state
         """
-        self.assertTrue(self.program.is_open)
+        assert self.program.is_open
         self.program._is_open = False
-        self.assertFalse(self.program.is_open)
+        assert not self.program.is_open
 
     def test_close(self):
         """@brief Test closing the program.
@@ -90,12 +144,12 @@ class TestLinkedProgram(unittest.TestCase):
         self.program.close()
 
         # Verify cexit and msyncc were added
-        self.assertIn("cexit", self.streams["cinst"].getvalue().lower())
-        self.assertIn("msyncc", self.streams["minst"].getvalue().lower())
-        self.assertFalse(self.program.is_open)
+        assert "cexit" in self.streams["cinst"].getvalue().lower()
+        assert "msyncc" in self.streams["minst"].getvalue().lower()
+        assert not self.program.is_open
 
         # Test that closing an already closed program raises RuntimeError
-        with self.assertRaises(RuntimeError):
+        with pytest.raises(RuntimeError):
             self.program.close()
 
         # Clean the StringIO object properly
@@ -118,7 +172,7 @@ class TestLinkedProgram(unittest.TestCase):
             program.close()
 
         # Should not contain "terminating MInstQ" comment
-        self.assertNotIn("terminating MInstQ", self.streams["minst"].getvalue())
+        assert "terminating MInstQ" not in self.streams["minst"].getvalue()
 
     def test_update_minsts_no_mem_model(self):
         """@brief Test updating MInsts when no memory model is available.
@@ -126,7 +180,7 @@ class TestLinkedProgram(unittest.TestCase):
         @test Verifies that RuntimeError is raised when memory model is None
         """
         # Create mock MInstructions
-        mock_mload = MagicMock(spec=minst.MLoad)
+        mock_mload = MagicMock(spec=_MLoad)
         mock_mload.var_name = "input_var"
         mock_mload.hbm_address = 0
         mock_mload.comment = "original comment"
@@ -152,23 +206,23 @@ class TestLinkedProgram(unittest.TestCase):
         self.program._cinst_line_offset = 10  # Set initial offset
 
         # Create mock MInstructions with initial SPAD addresses
-        mock_msyncc = MagicMock(spec=minst.MSyncc)
+        mock_msyncc = MagicMock(spec=_MSyncc)
         mock_msyncc.comment = ""
         mock_msyncc.target = 1
 
-        mock_mload1 = MagicMock(spec=minst.MLoad)
+        mock_mload1 = MagicMock(spec=_MLoad)
         mock_mload1.var_name = "input_var1"
         mock_mload1.hbm_address = 0
         mock_mload1.spad_address = 5
         mock_mload1.comment = "original comment"
 
-        mock_mstore1 = MagicMock(spec=minst.MStore)
+        mock_mstore1 = MagicMock(spec=_MStore)
         mock_mstore1.var_name = "output_var1"
         mock_mstore1.hbm_address = 0
         mock_mstore1.spad_address = 10
         mock_mstore1.comment = "Storing output_var1"
 
-        mock_mload2 = MagicMock(spec=minst.MLoad)
+        mock_mload2 = MagicMock(spec=_MLoad)
         mock_mload2.var_name = "input_var2"
         mock_mload2.hbm_address = 0
         mock_mload2.spad_address = 15
@@ -208,24 +262,24 @@ class TestLinkedProgram(unittest.TestCase):
         self.program._update_minsts(mock_kernel_info)
 
         # Verify MSyncc target was updated with _cinst_line_offset
-        self.assertEqual(mock_msyncc.target, 16)  # 5 + 10
+        assert mock_msyncc.target == 16  # 5 + 10
 
         # Verify SPAD addresses were updated with _spad_offset
-        self.assertEqual(mock_mload1.spad_address, 55)  # 5 + 50
-        self.assertEqual(mock_mstore1.spad_address, 60)  # 10 + 50
-        self.assertEqual(mock_mload2.spad_address, 65)  # 15 + 50
+        assert mock_mload1.spad_address == 55  # 5 + 50
+        assert mock_mstore1.spad_address == 60  # 10 + 50
+        assert mock_mload2.spad_address == 65  # 15 + 50
 
         # Verify HBM addresses were updated with memory model addresses
-        self.assertEqual(mock_mload1.hbm_address, 100)
-        self.assertEqual(mock_mstore1.hbm_address, 200)
-        self.assertEqual(mock_mload2.hbm_address, 300)
+        assert mock_mload1.hbm_address == 100
+        assert mock_mstore1.hbm_address == 200
+        assert mock_mload2.hbm_address == 300
 
         # Verify comments were updated with variable names
-        self.assertIn("input_var1", mock_mload1.comment)
-        self.assertIn("original comment", mock_mload1.comment)
-        self.assertIn("output_var1", mock_mstore1.comment)
-        self.assertIn("input_var2", mock_mload2.comment)
-        self.assertIn("another comment", mock_mload2.comment)
+        assert "input_var1" in mock_mload1.comment
+        assert "original comment" in mock_mload1.comment
+        assert "output_var1" in mock_mstore1.comment
+        assert "input_var2" in mock_mload2.comment
+        assert "another comment" in mock_mload2.comment
 
         # Verify the memory model was called with correct parameters
         expected_calls = [
@@ -246,7 +300,7 @@ class TestLinkedProgram(unittest.TestCase):
         mock_ifetch.tokens = [0]
         mock_ifetch.comment = "ifetch comment"
 
-        mock_csyncm1 = MagicMock(spec=cinst.CSyncm)
+        mock_csyncm1 = MagicMock(spec=_CSyncm)
         mock_csyncm1.tokens = [0]
         mock_csyncm1.comment = "sync comment"
 
@@ -255,7 +309,7 @@ class TestLinkedProgram(unittest.TestCase):
         mock_cnop1.tokens = [0]
         mock_cnop1.comment = "nop comment"
 
-        mock_csyncm2 = MagicMock(spec=cinst.CSyncm)
+        mock_csyncm2 = MagicMock(spec=_CSyncm)
         mock_csyncm2.tokens = [0]
         mock_csyncm2.comment = "sync comment"
 
@@ -289,16 +343,16 @@ class TestLinkedProgram(unittest.TestCase):
 
             # Verify CSyncm instructions' actions were marked as SKIP
             # CSyncm1 is at index 1, CSyncm2 is at index 3
-            self.assertEqual(mock_kernel_info.cinstrs_map[1].action, InstrAct.SKIP)
-            self.assertEqual(mock_kernel_info.cinstrs_map[3].action, InstrAct.SKIP)
+            assert mock_kernel_info.cinstrs_map[1].action == _SKIP
+            assert mock_kernel_info.cinstrs_map[3].action == _SKIP
 
             # Verify CNop cycles were updated (should have added 2 for each CSyncm)
             # First CNop gets 2 cycles added from first CSyncm
-            self.assertEqual(mock_cnop1.cycles, 4)  # 2 + 2
+            assert mock_cnop1.cycles == 4  # 2 + 2
 
             # Verify the line numbers were updated
             for i, instr in enumerate(mock_kernel_info.cinstrs):
-                self.assertEqual(instr.idx, str(i))
+                assert instr.idx == str(i)
 
     def test_update_cinsts_addresses_and_offsets(self):
         """@brief Test updating CInst addresses and offsets.
@@ -309,13 +363,13 @@ class TestLinkedProgram(unittest.TestCase):
         mock_ifetch = MagicMock(spec=cinst.IFetch)
         mock_ifetch.bundle = 1
 
-        mock_csyncm = MagicMock(spec=cinst.CSyncm)
+        mock_csyncm = MagicMock(spec=_CSyncm)
         mock_csyncm.target = 5
 
         mock_xinstfetch = MagicMock(spec=cinst.XInstFetch)
 
         # Create SPAD instructions for no-HBM case
-        mock_bload = MagicMock(spec=cinst.BLoad)
+        mock_bload = MagicMock(spec=_BLoad)
         mock_bload.var_name = "var1"
         mock_bload.spad_address = 0
         mock_bload.comment = "original comment"
@@ -332,8 +386,8 @@ class TestLinkedProgram(unittest.TestCase):
         self.program._update_cinsts_addresses_and_offsets(kernel_cinstrs)
 
         # Verify results with HBM enabled
-        self.assertEqual(mock_ifetch.bundle, 11)  # 1 + 10
-        self.assertEqual(mock_csyncm.target, 25)  # 5 + 20
+        assert mock_ifetch.bundle == 11  # 1 + 10
+        assert mock_csyncm.target == 25  # 5 + 20
 
         # Test with HBM disabled
         with patch.object(GlobalConfig, "hasHBM", False):
@@ -348,17 +402,17 @@ class TestLinkedProgram(unittest.TestCase):
             self.program._update_cinsts_addresses_and_offsets(kernel_cinstrs)
 
             # Verify SPAD instructions were updated
-            self.assertEqual(mock_bload.spad_address, 30)
-            self.assertIn("var1", mock_bload.comment)
-            self.assertIn("original comment", mock_bload.comment)
+            assert mock_bload.spad_address == 30
+            assert "var1" in mock_bload.comment
+            assert "original comment" in mock_bload.comment
 
-            self.assertEqual(mock_cstore.spad_address, 40)
+            assert mock_cstore.spad_address == 40
 
             # Verify the memory model was used correctly
             self.mem_model.use_variable.assert_has_calls([call("var1", 2), call("var2", 2)])
 
         # Test that XInstFetch raises NotImplementedError
-        with self.assertRaises(NotImplementedError):
+        with pytest.raises(NotImplementedError):
             self.program._update_cinsts_addresses_and_offsets([mock_xinstfetch])
 
     def test_update_cinsts(self):
@@ -403,11 +457,11 @@ class TestLinkedProgram(unittest.TestCase):
         and SPAD address mappings in HBM mode
         """
         # Create mock CInstructions
-        mock_csyncm = MagicMock(spec=cinst.CSyncm)
+        mock_csyncm = MagicMock(spec=_CSyncm)
         mock_csyncm.target = 2
         mock_csyncm.comment = "sync comment"
 
-        mock_cload = MagicMock(spec=cinst.CLoad)
+        mock_cload = MagicMock(spec=_CLoad)
         mock_cload.var_name = "input_var"
         mock_cload.spad_address = 10
         mock_cload.comment = "load input variable"
@@ -423,19 +477,19 @@ class TestLinkedProgram(unittest.TestCase):
         mock_nload.spad_address = 15
 
         # Create mock MInstructions
-        mock_mload = MagicMock(spec=minst.MLoad)
+        mock_mload = MagicMock(spec=_MLoad)
         mock_mload.var_name = "input_var"
         mock_mload.spad_address = 100
         mock_mload.comment = "load input variable"
         mock_mload.idx = 0
 
-        mock_mstore = MagicMock(spec=minst.MStore)
+        mock_mstore = MagicMock(spec=_MStore)
         mock_mstore.var_name = "output_var"
         mock_mstore.spad_address = 200
         mock_mstore.comment = ""
         mock_mstore.idx = 1
 
-        mock_nload_minstr = MagicMock(spec=minst.MLoad)
+        mock_nload_minstr = MagicMock(spec=_MLoad)
         mock_nload_minstr.var_name = "nload_var"
         mock_nload_minstr.spad_address = 150
         mock_nload_minstr.comment = "nload comment"
@@ -449,7 +503,7 @@ class TestLinkedProgram(unittest.TestCase):
         # Create mock cinstrs_map
         mock_kernel.cinstrs_map = [MagicMock(), MagicMock(), MagicMock(), MagicMock()]
         for entry in mock_kernel.cinstrs_map:
-            entry.action = InstrAct.KEEP_SPAD
+            entry.action = _KEEP_SPAD
 
         # Create mock minstrs_map
         mock_mload_entry = MagicMock()
@@ -475,25 +529,26 @@ class TestLinkedProgram(unittest.TestCase):
                 self.program._update_cinst_kernel_hbm(mock_kernel)
 
                 # Verify CSyncm target was updated to MInst idx
-                self.assertEqual(mock_csyncm.target, 1)  # Should be set to mstore.idx
+                assert mock_csyncm.target == 1  # Should be set to mstore.idx
 
                 # Verify CLoad was updated with correct variable name and SPAD address
-                self.assertEqual(mock_cload.var_name, "input_var")
-                self.assertEqual(mock_cload.spad_address, 100)
+                assert mock_cload.var_name == "input_var"
+                assert mock_cload.spad_address == 100
 
                 # Verify CStore was updated with correct variable name and SPAD address
-                self.assertEqual(mock_cstore.var_name, "output_var")
-                self.assertEqual(mock_cstore.spad_address, 200)
+                assert mock_cstore.var_name == "output_var"
+                assert mock_cstore.spad_address == 200
 
                 # Verify variable was added to tracker
-                self.assertEqual(self.program._cinst_in_var_tracker["output_var"], 200)
+                assert self.program._cinst_in_var_tracker["output_var"] == 200
 
                 # Verify NLoad was updated with correct variable name
-                self.assertEqual(mock_nload.var_name, "nload_var")
+                assert mock_nload.var_name == "nload_var"
 
                 # Verify search functions were called correctly
-                mock_search_back.assert_called_with(mock_kernel.minstrs_map, 2, 10)
-                mock_search_forward.assert_any_call(mock_kernel.minstrs_map, 2, 20)
+                mload_index, minstr_index = index_minstrs_by_spad(mock_kernel.minstrs_map)
+                mock_search_back.assert_called_with(mock_kernel.minstrs_map, 2, 10, mload_index)
+                mock_search_forward.assert_any_call(mock_kernel.minstrs_map, 2, 20, minstr_index)
 
     def test_update_xinsts(self):
         """@brief Test updating XInsts.
@@ -516,16 +571,16 @@ class TestLinkedProgram(unittest.TestCase):
         last_bundle = self.program._update_xinsts(kernel_xinstrs)
 
         # Verify results
-        self.assertEqual(mock_xinst1.bundle, 11)  # 1 + 10
-        self.assertEqual(mock_xinst2.bundle, 12)  # 2 + 10
-        self.assertEqual(last_bundle, 12)
+        assert mock_xinst1.bundle == 11  # 1 + 10
+        assert mock_xinst2.bundle == 12  # 2 + 10
+        assert last_bundle == 12
 
         # Test that an invalid bundle sequence raises RuntimeError
         kernel_xinstrs = [
             mock_xinst2,
             mock_xinst3,
         ]  # xinst3 has lower bundle than xinst2
-        with self.assertRaises(RuntimeError):
+        with pytest.raises(RuntimeError):
             self.program._update_xinsts(kernel_xinstrs)
 
     def test_link_kernel(self):
@@ -571,7 +626,7 @@ class TestLinkedProgram(unittest.TestCase):
                 cinstr.comment = f"cinst_comment{i}"
                 cinstr_map_entry = MagicMock()
                 cinstr_map_entry.cinstr = cinstr
-                cinstr_map_entry.action = InstrAct.KEEP_SPAD
+                cinstr_map_entry.action = _KEEP_SPAD
                 mock_kernel_info.cinstrs_map.append(cinstr_map_entry)
 
             # Execute the method
@@ -583,28 +638,28 @@ class TestLinkedProgram(unittest.TestCase):
             mock_update_xinsts.assert_called_once_with(mock_kernel_info.xinstrs)
 
             # Verify bundle offset was updated
-            self.assertEqual(self.program._bundle_offset, 6)  # 5 + 1
+            assert self.program._bundle_offset == 6  # 5 + 1
 
             # Verify line offsets were updated
-            self.assertEqual(self.program._minst_line_offset, 1)  # len(kernel_minstrs) - 1
-            self.assertEqual(self.program._cinst_line_offset, 1)  # len(kernel_cinstrs) - 1
+            assert self.program._minst_line_offset == 1  # len(kernel_minstrs) - 1
+            assert self.program._cinst_line_offset == 1  # len(kernel_cinstrs) - 1
 
             # Verify kernel count was incremented
-            self.assertEqual(self.program._kernel_count, 1)
+            assert self.program._kernel_count == 1
 
             # Verify output streams contain the instructions
             xinst_output = self.streams["xinst"].getvalue()
             cinst_output = self.streams["cinst"].getvalue()
             minst_output = self.streams["minst"].getvalue()
 
-            self.assertIn("xinst0", xinst_output)
-            self.assertIn("xinst1", xinst_output)
+            assert "xinst0" in xinst_output
+            assert "xinst1" in xinst_output
 
-            self.assertIn("0, cinst0", cinst_output)
-            self.assertIn("cinst_comment0", cinst_output)
+            assert "0, cinst0" in cinst_output
+            assert "cinst_comment0" in cinst_output
 
-            self.assertIn("0, minst0", minst_output)
-            self.assertIn("minst_comment0", minst_output)
+            assert "0, minst0" in minst_output
+            assert "minst_comment0" in minst_output
 
     def test_link_kernel_with_no_hbm(self):
         """@brief Test linking a kernel with HBM disabled.
@@ -652,11 +707,11 @@ class TestLinkedProgram(unittest.TestCase):
                 mock_update_xinsts.assert_called_once_with(kernel_xinstrs)
 
                 # Verify bundle offset was updated
-                self.assertEqual(self.program._bundle_offset, 6)  # 5 + 1
+                assert self.program._bundle_offset == 6  # 5 + 1
 
                 # No MInst output when HBM is disabled
                 minst_output = self.streams["minst"].getvalue()
-                self.assertEqual(minst_output, "")
+                assert minst_output == ""
 
     def test_link_kernel_with_closed_program(self):
         """@brief Test linking a kernel with a closed program.
@@ -667,7 +722,7 @@ class TestLinkedProgram(unittest.TestCase):
         self.program._is_open = False
 
         # Try to link a kernel
-        with self.assertRaises(RuntimeError):
+        with pytest.raises(RuntimeError):
             self.program.link_kernel([])
 
     def test_link_kernel_with_suppress_comments(self):
@@ -714,9 +769,9 @@ class TestLinkedProgram(unittest.TestCase):
                 cinst_output = self.streams["cinst"].getvalue()
                 minst_output = self.streams["minst"].getvalue()
 
-                self.assertNotIn("xinst_comment", xinst_output)
-                self.assertNotIn("cinst_comment", cinst_output)
-                self.assertNotIn("minst_comment", minst_output)
+                assert "xinst_comment" not in xinst_output
+                assert "cinst_comment" not in cinst_output
+                assert "minst_comment" not in minst_output
 
     def test_link_kernels_to_files(self):
         """
@@ -789,11 +844,11 @@ class TestLinkedProgram(unittest.TestCase):
         self.program.flush_buffers()
 
         # Verify that all trackers are cleared
-        self.assertEqual(self.program._cinst_in_var_tracker, {})
-        self.assertEqual(self.program._minst_in_var_tracker, {})
+        assert self.program._cinst_in_var_tracker == {}
+        assert self.program._minst_in_var_tracker == {}
 
         # Verify that SPAD offset is reset to 0
-        self.assertEqual(self.program._spad_offset, 0)
+        assert self.program._spad_offset == 0
 
     def test_boundary_properties(self):
         """@brief Test both boundary properties together.
@@ -802,28 +857,28 @@ class TestLinkedProgram(unittest.TestCase):
         """
         # Test both False (default)
         program = LinkedProgram()
-        self.assertFalse(program.keep_hbm_boundary)
-        self.assertFalse(program.keep_spad_boundary)
+        assert not program.keep_hbm_boundary
+        assert not program.keep_spad_boundary
 
         # Test both True
         program = LinkedProgram(keep_hbm_boundary=True, keep_spad_boundary=True)
-        self.assertTrue(program.keep_hbm_boundary)
-        self.assertTrue(program.keep_spad_boundary)
+        assert program.keep_hbm_boundary
+        assert program.keep_spad_boundary
 
         # Test mixed values
         program = LinkedProgram(keep_hbm_boundary=True, keep_spad_boundary=False)
-        self.assertTrue(program.keep_hbm_boundary)
-        self.assertFalse(program.keep_spad_boundary)
+        assert program.keep_hbm_boundary
+        assert not program.keep_spad_boundary
 
         program = LinkedProgram(keep_hbm_boundary=False, keep_spad_boundary=True)
-        self.assertFalse(program.keep_hbm_boundary)
-        self.assertTrue(program.keep_spad_boundary)
+        assert not program.keep_hbm_boundary
+        assert program.keep_spad_boundary
 
 
-class TestLinkedProgramValidation(unittest.TestCase):
+class TestLinkedProgramValidation:
     """@brief Tests for the validation methods of the LinkedProgram class."""
 
-    def setUp(self):
+    def setup_method(self):
         """@brief Set up test fixtures."""
         # Group related stream objects into a dictionary
         self.streams = {
@@ -831,7 +886,7 @@ class TestLinkedProgramValidation(unittest.TestCase):
             "cinst": io.StringIO(),
             "xinst": io.StringIO(),
         }
-        self.mem_model = MagicMock(spec=MemoryModel)
+        self.mem_model = MagicMock()
 
         # Mock the hasHBM property to return True by default
         self.has_hbm_patcher = patch.object(GlobalConfig, "hasHBM", True)
@@ -849,7 +904,7 @@ class TestLinkedProgramValidation(unittest.TestCase):
             self.mem_model,
         )
 
-    def tearDown(self):
+    def teardown_method(self):
         """@brief Tear down test fixtures."""
         self.has_hbm_patcher.stop()
         self.suppress_comments_patcher.stop()
@@ -866,7 +921,7 @@ class TestLinkedProgramValidation(unittest.TestCase):
         # No exception should be raised
 
         # Test validating a negative HBM address
-        with self.assertRaises(RuntimeError):
+        with pytest.raises(RuntimeError):
             self.program._validate_hbm_address("test_var", -1)
 
     def test_validate_hbm_address_mismatch(self):
@@ -878,7 +933,7 @@ class TestLinkedProgramValidation(unittest.TestCase):
         mock_var.hbm_address = 5
         self.mem_model.mem_info_vars = {"test_var": mock_var}
 
-        with self.assertRaises(RuntimeError):
+        with pytest.raises(RuntimeError):
             self.program._validate_hbm_address("test_var", 10)
 
     def test_validate_spad_address_valid(self):
@@ -896,7 +951,7 @@ class TestLinkedProgramValidation(unittest.TestCase):
 
         @test Verifies that an AssertionError is raised when HBM is enabled
         """
-        with self.assertRaises(AssertionError):
+        with pytest.raises(AssertionError):
             self.program._validate_spad_address("test_var", 10)
 
     def test_validate_spad_address_negative(self):
@@ -905,7 +960,7 @@ class TestLinkedProgramValidation(unittest.TestCase):
         @test Verifies that a RuntimeError is raised for negative addresses
         """
         with patch.object(GlobalConfig, "hasHBM", False):
-            with self.assertRaises(RuntimeError):
+            with pytest.raises(RuntimeError):
                 self.program._validate_spad_address("test_var", -1)
 
     def test_validate_spad_address_mismatch(self):
@@ -918,11 +973,11 @@ class TestLinkedProgramValidation(unittest.TestCase):
             mock_var.hbm_address = 5
             self.mem_model.mem_info_vars = {"test_var": mock_var}
 
-            with self.assertRaises(RuntimeError):
+            with pytest.raises(RuntimeError):
                 self.program._validate_spad_address("test_var", 10)
 
 
-class TestJoinDinstKernels(unittest.TestCase):
+class TestJoinDinstKernels:
     """@brief Tests for the join_n_prune_dinst_kernels static method."""
 
     def test_join_dinst_kernels_empty(self):
@@ -931,7 +986,7 @@ class TestJoinDinstKernels(unittest.TestCase):
         @test Verifies that a ValueError is raised for an empty list
         """
         program = LinkedProgram()
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             program.join_n_prune_dinst_kernels([])
 
     def test_join_dinst_kernels_single_kernel(self):
@@ -952,13 +1007,13 @@ class TestJoinDinstKernels(unittest.TestCase):
         result = program.join_n_prune_dinst_kernels([[mock_dload, mock_dstore]])
 
         # Verify result
-        self.assertEqual(len(result), 2)
-        self.assertEqual(result[0], mock_dload)
-        self.assertEqual(result[1], mock_dstore)
+        assert len(result) == 2
+        assert result[0] == mock_dload
+        assert result[1] == mock_dstore
 
         # Verify address was set
-        self.assertEqual(mock_dload.address, 0)
-        self.assertEqual(mock_dstore.address, 1)
+        assert mock_dload.address == 0
+        assert mock_dstore.address == 1
 
     def test_join_dinst_kernels_multiple_kernels(self):
         """@brief Test joining multiple DInst kernels.
@@ -989,16 +1044,16 @@ class TestJoinDinstKernels(unittest.TestCase):
 
         # Verify result - should contain load1, store1 (output), keygen, store2 (output)
         # dload2 should be skipped since it loads var2 which is already an output from kernel1
-        self.assertEqual(len(result), 3)
-        self.assertIn(mock_dload1, result)
-        self.assertNotIn(mock_dload2, result)  # Should be skipped
-        self.assertIn(mock_dkeygen, result)
-        self.assertIn(mock_dstore2, result)
+        assert len(result) == 3
+        assert mock_dload1 in result
+        assert mock_dload2 not in result  # Should be skipped
+        assert mock_dkeygen in result
+        assert mock_dstore2 in result
 
         # Verify addresses were set correctly and sequentially
         # Note: exact order depends on dictionary iteration which is not guaranteed
         used_addresses = {dinst.address for dinst in result}
-        self.assertEqual(used_addresses, {0, 1, 2})  # Three consecutive addresses
+        assert used_addresses == {0, 1, 2}  # Three consecutive addresses
 
     def test_join_dinst_kernels_with_carry_over_vars(self):
         """@brief Test joining DInst kernels with carry-over variables.
@@ -1027,24 +1082,24 @@ class TestJoinDinstKernels(unittest.TestCase):
 
         # Verify result - should contain load1, store2
         # Both dload2 and dstore1 should be skipped since var2 is carried over
-        self.assertEqual(len(result), 2)
-        self.assertIn(mock_dload1, result)
-        self.assertNotIn(mock_dload2, result)  # Should be skipped
-        self.assertNotIn(mock_dstore1, result)  # Should be skipped
-        self.assertIn(mock_dstore2, result)  # Final output for var2
+        assert len(result) == 2
+        assert mock_dload1 in result
+        assert mock_dload2 not in result  # Should be skipped
+        assert mock_dstore1 not in result  # Should be skipped
+        assert mock_dstore2 in result  # Final output for var2
 
 
-class TestPruneCinstKernel(unittest.TestCase):
+class TestPruneCinstKernel:
     """@brief Tests for the prune_cinst_kernel methods."""
 
-    def setUp(self):
+    def setup_method(self):
         """@brief Set up test fixtures."""
         self.streams = {
             "minst": io.StringIO(),
             "cinst": io.StringIO(),
             "xinst": io.StringIO(),
         }
-        self.mem_model = MagicMock(spec=MemoryModel)
+        self.mem_model = MagicMock()
 
         # Mock the hasHBM property to return True by default
         self.has_hbm_patcher = patch.object(GlobalConfig, "hasHBM", True)
@@ -1058,7 +1113,7 @@ class TestPruneCinstKernel(unittest.TestCase):
             self.mem_model,
         )
 
-    def tearDown(self):
+    def teardown_method(self):
         """@brief Tear down test fixtures."""
         self.has_hbm_patcher.stop()
 
@@ -1079,7 +1134,7 @@ class TestPruneCinstKernel(unittest.TestCase):
         self.program.prune_cinst_kernel_hbm(mock_kernel, None)
 
         # CNop cycles should remain unchanged since adjust_cycles is reset by IFetch
-        self.assertEqual(mock_cnop.cycles, 5)
+        assert mock_cnop.cycles == 5
 
     def test_prune_cinst_kernel_hbm_cnop_adds_cycles(self):
         """@brief Test that CNop adds adjust_cycles in HBM mode."""
@@ -1097,7 +1152,7 @@ class TestPruneCinstKernel(unittest.TestCase):
         # Set up program to have some adjust_cycles
         with patch.object(self.program, "_intermediate_vars", ["var1"]):
             # Mock a CLoad that would be skipped to create adjust_cycles
-            mock_cload = MagicMock(spec=cinst.CLoad)
+            mock_cload = MagicMock(spec=_CLoad)
             mock_cload.spad_address = 10
             mock_cload.comment = ""
             mock_cload.var_name = "test_var"
@@ -1110,7 +1165,7 @@ class TestPruneCinstKernel(unittest.TestCase):
             mock_minstr.var_name = "test_var"
             mock_minstr_entry = MagicMock()
             mock_minstr_entry.minstr = mock_minstr
-            mock_minstr_entry.action = InstrAct.SKIP
+            mock_minstr_entry.action = _SKIP
             mock_kernel.minstrs_map = [mock_minstr_entry]
 
             with patch("linker.steps.program_linker.search_minstrs_back", return_value=0):
@@ -1118,15 +1173,15 @@ class TestPruneCinstKernel(unittest.TestCase):
                     self.program.prune_cinst_kernel_hbm(mock_kernel, None)
 
             # CNop should have added the adjustment cycles
-            self.assertEqual(mock_cnop.cycles, 5)  # 3 + 2
+            assert mock_cnop.cycles == 5  # 3 + 2
 
     def test_prune_cinst_kernel_hbm_csyncm_tracks_index(self):
         """@brief Test that CSyncm tracks minst index in HBM mode."""
         # Create mock instructions
-        mock_csyncm = MagicMock(spec=cinst.CSyncm)
+        mock_csyncm = MagicMock(spec=_CSyncm)
         mock_csyncm.comment = ""
         mock_csyncm.target = 1
-        mock_cload = MagicMock(spec=cinst.CLoad)
+        mock_cload = MagicMock(spec=_CLoad)
         mock_cload.spad_address = 10
         mock_cload.comment = ""
         mock_cload.var_name = "test_var"
@@ -1135,7 +1190,7 @@ class TestPruneCinstKernel(unittest.TestCase):
         mock_kernel = MagicMock()
         mock_kernel.cinstrs = [mock_csyncm, mock_cload]
         mock_kernel.cinstrs_map = [MagicMock(), MagicMock()]
-        mock_kernel.cinstrs_map[1].action = InstrAct.KEEP_SPAD
+        mock_kernel.cinstrs_map[1].action = _KEEP_SPAD
 
         # Mock minstr
         mock_minstr = MagicMock()
@@ -1154,7 +1209,7 @@ class TestPruneCinstKernel(unittest.TestCase):
     def test_prune_cinst_kernel_hbm_cload_with_skipped_minstr(self):
         """@brief Test CLoad handling when corresponding minstr is skipped in HBM mode."""
         # Create mock CLoad
-        mock_cload = MagicMock(spec=cinst.CLoad)
+        mock_cload = MagicMock(spec=_CLoad)
         mock_cload.spad_address = 10
         mock_cload.comment = ""
         mock_cload.var_name = "test_var"
@@ -1169,7 +1224,7 @@ class TestPruneCinstKernel(unittest.TestCase):
         mock_minstr.var_name = "test_var"
         mock_minstr_entry = MagicMock()
         mock_minstr_entry.minstr = mock_minstr
-        mock_minstr_entry.action = InstrAct.SKIP
+        mock_minstr_entry.action = _SKIP
         mock_kernel.minstrs_map = [mock_minstr_entry]
 
         with patch("linker.steps.program_linker.search_minstrs_back", return_value=0):
@@ -1178,9 +1233,9 @@ class TestPruneCinstKernel(unittest.TestCase):
                     self.program.prune_cinst_kernel_hbm(mock_kernel, None)
 
         # CLoad should be marked as SKIP
-        self.assertEqual(mock_kernel.cinstrs_map[0].action, InstrAct.SKIP)
+        assert mock_kernel.cinstrs_map[0].action == _SKIP
         # Variable name should be updated
-        self.assertEqual(mock_cload.var_name, "test_var")
+        assert mock_cload.var_name == "test_var"
 
     def test_prune_cinst_kernel_hbm_cload_with_intermediate_var(self):
         """@brief Test CLoad handling with intermediate variable in HBM mode."""
@@ -1188,7 +1243,7 @@ class TestPruneCinstKernel(unittest.TestCase):
         self.program._intermediate_vars = ["intermediate_var"]
 
         # Create mock CLoad
-        mock_cload = MagicMock(spec=cinst.CLoad)
+        mock_cload = MagicMock(spec=_CLoad)
         mock_cload.spad_address = 10
         mock_cload.comment = ""
         mock_cload.var_name = "intermediate_var"
@@ -1261,7 +1316,7 @@ class TestPruneCinstKernel(unittest.TestCase):
         program.prune_cinst_kernel_no_hbm(mock_kernel, None)
 
         # No changes should be made to the kernel
-        self.assertIsNotNone(mock_kernel.cinstrs)
+        assert mock_kernel.cinstrs is not None
 
     def test_prune_cinst_kernel_no_hbm_ifetch_resets_cycles(self):
         """@brief Test that IFetch resets adjust_cycles in no-HBM mode."""
@@ -1280,13 +1335,13 @@ class TestPruneCinstKernel(unittest.TestCase):
             self.program.prune_cinst_kernel_no_hbm(mock_kernel, None)
 
             # CNop cycles should remain unchanged since adjust_cycles is reset by IFetch
-            self.assertEqual(mock_cnop.cycles, 5)
+            assert mock_cnop.cycles == 5
 
     def test_prune_cinst_kernel_no_hbm_bload_processing(self):
         """@brief Test BLoad processing in no-HBM mode."""
         with patch.object(GlobalConfig, "hasHBM", False):
             # Create mock BLoad
-            mock_bload = MagicMock(spec=cinst.BLoad)
+            mock_bload = MagicMock(spec=_BLoad)
             mock_bload.var_name = "test_var"
 
             # Create mock kernel
@@ -1301,7 +1356,7 @@ class TestPruneCinstKernel(unittest.TestCase):
                 mock_process.assert_called_with(mock_kernel.cinstrs, mock_kernel.cinstrs_map, self.program._cinst_in_var_tracker, 0)
 
                 # Variable should be added to tracker
-                self.assertEqual(self.program._cinst_in_var_tracker["test_var"], 0)
+                assert self.program._cinst_in_var_tracker["test_var"] == 0
 
     def test_prune_cinst_kernel_no_hbm_cload_already_loaded(self):
         """@brief Test CLoad handling when variable already loaded in no-HBM mode."""
@@ -1310,7 +1365,7 @@ class TestPruneCinstKernel(unittest.TestCase):
             self.program._cinst_in_var_tracker = {"loaded_var": 5}
 
             # Create mock CLoad
-            mock_cload = MagicMock(spec=cinst.CLoad)
+            mock_cload = MagicMock(spec=_CLoad)
             mock_cload.var_name = "loaded_var"
 
             # Create mock kernel
@@ -1322,7 +1377,7 @@ class TestPruneCinstKernel(unittest.TestCase):
                 self.program.prune_cinst_kernel_no_hbm(mock_kernel, None)
 
             # CLoad should be marked as SKIP
-            self.assertEqual(mock_kernel.cinstrs_map[0].action, InstrAct.SKIP)
+            assert mock_kernel.cinstrs_map[0].action == _SKIP
 
     def test_prune_cinst_kernel_no_hbm_cload_intermediate_var(self):
         """@brief Test CLoad handling with intermediate variable in no-HBM mode."""
@@ -1331,7 +1386,7 @@ class TestPruneCinstKernel(unittest.TestCase):
             self.program._intermediate_vars = ["intermediate_var"]
 
             # Create mock CLoad
-            mock_cload = MagicMock(spec=cinst.CLoad)
+            mock_cload = MagicMock(spec=_CLoad)
             mock_cload.var_name = "intermediate_var"
 
             # Create mock kernel
@@ -1341,19 +1396,19 @@ class TestPruneCinstKernel(unittest.TestCase):
 
             # Provide corresponding _xstores_map entry on the program instance
             xstore_entry = MagicMock()
-            xstore_entry.action = InstrAct.SKIP
+            xstore_entry.action = _SKIP
             self.program._xstores_map["intermediate_var"] = xstore_entry
 
             self.program.prune_cinst_kernel_no_hbm(mock_kernel, None)
 
             # CLoad should be marked as SKIP
-            self.assertEqual(mock_kernel.cinstrs_map[0].action, InstrAct.SKIP)
+            assert mock_kernel.cinstrs_map[0].action == _SKIP
 
     def test_prune_cinst_kernel_no_hbm_cload_keep_instruction(self):
         """@brief Test CLoad when instruction should be kept in no-HBM mode."""
         with patch.object(GlobalConfig, "hasHBM", False):
             # Create mock CLoad
-            mock_cload = MagicMock(spec=cinst.CLoad)
+            mock_cload = MagicMock(spec=_CLoad)
             mock_cload.var_name = "ct_new_var"
             mock_cload.spad_address = 10
 
@@ -1365,7 +1420,7 @@ class TestPruneCinstKernel(unittest.TestCase):
             self.program.prune_cinst_kernel_no_hbm(mock_kernel, None)
 
             # Variable should be added to tracker
-            self.assertEqual(self.program._cinst_in_var_tracker["ct_new_var"], 10)
+            assert self.program._cinst_in_var_tracker["ct_new_var"] == 10
 
     def test_prune_cinst_kernel_no_hbm_bones_already_loaded(self):
         """@brief Test BOnes handling when variable already loaded in no-HBM mode."""
@@ -1386,7 +1441,7 @@ class TestPruneCinstKernel(unittest.TestCase):
                 self.program.prune_cinst_kernel_no_hbm(mock_kernel, None)
 
             # BOnes should be marked as SKIP
-            self.assertEqual(mock_kernel.cinstrs_map[0].action, InstrAct.SKIP)
+            assert mock_kernel.cinstrs_map[0].action == _SKIP
 
     def test_prune_cinst_kernel_no_hbm_cstore_intermediate_var(self):
         """@brief Test CStore handling with intermediate variable in no-HBM mode."""
@@ -1407,24 +1462,19 @@ class TestPruneCinstKernel(unittest.TestCase):
             # Provide an entry for the intermediate var so prune_cinst_kernel_no_hbm
             # can look it up on the program instance.
             xstore_entry = MagicMock()
-            xstore_entry.action = InstrAct.SKIP
+            xstore_entry.action = _SKIP
             self.program._xstores_map["intermediate_var"] = xstore_entry
             self.program.prune_cinst_kernel_no_hbm(mock_kernel, None)
 
             # CStore should be marked as SKIP
-            self.assertEqual(mock_kernel.cinstrs_map[0].action, InstrAct.SKIP)
+            assert mock_kernel.cinstrs_map[0].action == _SKIP
 
     def test_prune_cinst_kernel_no_hbm_cstore_with_spad_boundary(self):
         """@brief Test CStore with intermediate variable but keep_spad_boundary=True in no-HBM mode."""
         with patch.object(GlobalConfig, "hasHBM", False):
-            # Create program with keep_spad_boundary=True
-            program = LinkedProgram(keep_spad_boundary=True)
-            program.initialize(
-                self.streams["minst"],
-                self.streams["cinst"],
-                self.streams["xinst"],
-                self.mem_model,
-            )
+            # Toggle keep_spad_boundary on the per-test program instead of building another one
+            program = self.program
+            program._keep_spad_boundary = True
             program._intermediate_vars = ["intermediate_var"]
 
             # Create mock CStore
@@ -1439,36 +1489,51 @@ class TestPruneCinstKernel(unittest.TestCase):
             program.prune_cinst_kernel_no_hbm(mock_kernel, None)
 
             # CStore should NOT be marked as SKIP due to keep_spad_boundary
-            self.assertNotEqual(mock_kernel.cinstrs_map[0].action, InstrAct.SKIP)
+            assert mock_kernel.cinstrs_map[0].action != _SKIP
 
 
-class TestPruneMinstKernel(unittest.TestCase):
+class TestPruneMinstKernel:
     """@brief Tests for the prune_minst_kernel method."""
 
-    def setUp(self):
-        """@brief Set up test fixtures."""
-        self.streams = {
+    @classmethod
+    def setup_class(cls):
+        """@brief Set up fixtures shared by all tests in the class."""
+        cls.streams = {
             "minst": io.StringIO(),
             "cinst": io.StringIO(),
             "xinst": io.StringIO(),
         }
-        self.mem_model = MagicMock(spec=MemoryModel)
+        cls.mem_model = MagicMock()
 
         # Mock the hasHBM property to return True by default
-        self.has_hbm_patcher = patch.object(GlobalConfig, "hasHBM", True)
-        self.mock_has_hbm = self.has_hbm_patcher.start()
-
-        self.program = LinkedProgram()
-        self.program.initialize(
-            self.streams["minst"],
-            self.streams["cinst"],
-            self.streams["xinst"],
-            self.mem_model,
+        cls.has_hbm_patcher = patch.object(GlobalConfig, "hasHBM", True)
+        cls.mock_has_hbm = cls.has_hbm_patcher.start()
+
+        # prune_minst_kernel never writes to the streams, so the program can be shared
+        cls._base_program = LinkedProgram()
+        cls._base_program.initialize(
+            cls.streams["minst"],
+            cls.streams["cinst"],
+            cls.streams["xinst"],
+            cls.mem_model,
         )
 
-    def tearDown(self):
-        """@brief Tear down test fixtures."""
-        self.has_hbm_patcher.stop()
+        # Instruction templates; each test clones the ones it needs
+        cls._tpl_mload = _FakeMLoad(var_name="", spad_address=0, comment="", idx=0)
+        cls._tpl_mstore = _FakeMStore(var_name="", spad_address=0, comment="", idx=0)
+        cls._tpl_msyncc = _FakeMSyncc(comment="", idx=0)
+
+    @classmethod
+    def teardown_class(cls):
+        """@brief Tear down fixtures shared by all tests in the class."""
+        cls.has_hbm_patcher.stop()
+
+    def setup_method(self):
+        """@brief Reset the trackers prune_minst_kernel mutates."""
+        self.program = self._base_program
+        self.program._intermediate_vars = []
+        self.program._minst_in_var_tracker = {}
+        self.program._xstores_map = {}
 
     def test_prune_minst_kernel_with_keep_hbm_boundary(self):
         """@brief Test that prune_minst_kernel returns early when keep_hbm_boundary is True."""
@@ -1488,84 +1553,25 @@ class TestPruneMinstKernel(unittest.TestCase):
         program.prune_minst_kernel(mock_kernel)
 
         # No changes should be made to the kernel
-        self.assertIsNotNone(mock_kernel.minstrs)
+        assert mock_kernel.minstrs is not None
 
     def test_prune_minst_kernel_msyncc_tracking(self):
         """@brief Test that MSyncc instructions are tracked correctly."""
         # Create mock MSyncc instruction
-        mock_msyncc = MagicMock(spec=minst.MSyncc)
-        mock_msyncc.idx = 0
-        mock_msyncc.comment = ""
+        mock_msyncc = self._tpl_msyncc.clone(idx=0)
 
-        mock_mload = MagicMock(spec=minst.MLoad)
-        mock_mload.var_name = "test_var"
-        mock_mload.spad_address = 10
-        mock_mload.comment = ""
-        mock_mload.idx = 1
+        mock_mload = self._tpl_mload.clone(var_name="test_var", spad_address=10, idx=1)
 
         # Create mock kernel
         mock_kernel = MagicMock()
         mock_kernel.minstrs = [mock_msyncc, mock_mload]
-        mock_kernel.minstrs_map = [MagicMock(), MagicMock()]
+        mock_kernel.minstrs_map = [_MapEntry() for _ in range(2)]
         mock_kernel.spad_size = 0
 
         self.program.prune_minst_kernel(mock_kernel)
 
         # MSyncc should be tracked but not modified
-        self.assertIsNotNone(mock_msyncc)
-
-    def test_prune_minst_kernel_mstore_intermediate_var(self):
-        """@brief Test MStore handling with intermediate variable."""
-        # Set up intermediate variables
-        self.program._intermediate_vars = ["intermediate_var"]
-
-        # Create mock MStore
-        mock_mstore = MagicMock(spec=minst.MStore)
-        mock_mstore.var_name = "intermediate_var"
-        mock_mstore.spad_address = 20
-        mock_mstore.comment = ""
-        mock_mstore.idx = 0
-
-        # Create mock kernel
-        mock_kernel = MagicMock()
-        mock_kernel.minstrs = [mock_mstore]
-        mock_kernel.minstrs_map = [MagicMock()]
-        mock_kernel.spad_size = 0
-
-        self.program.prune_minst_kernel(mock_kernel)
-
-        # MStore should be marked as SKIP (since keep_spad_boundary is False by default)
-        self.assertEqual(mock_kernel.minstrs_map[0].action, InstrAct.SKIP)
-
-    def test_prune_minst_kernel_mstore_intermediate_var_with_spad_boundary(self):
-        """@brief Test MStore with intermediate variable but keep_spad_boundary=True."""
-        # Create program with keep_spad_boundary=True
-        program = LinkedProgram(keep_spad_boundary=True)
-        program.initialize(
-            self.streams["minst"],
-            self.streams["cinst"],
-            self.streams["xinst"],
-            self.mem_model,
-        )
-        program._intermediate_vars = ["intermediate_var"]
-
-        # Create mock MStore
-        mock_mstore = MagicMock(spec=minst.MStore)
-        mock_mstore.var_name = "intermediate_var"
-        mock_mstore.spad_address = 20
-        mock_mstore.comment = ""
-        mock_mstore.idx = 0
-
-        # Create mock kernel
-        mock_kernel = MagicMock()
-        mock_kernel.minstrs = [mock_mstore]
-        mock_kernel.minstrs_map = [MagicMock()]
-        mock_kernel.spad_size = 0
-
-        program.prune_minst_kernel(mock_kernel)
-
-        # MStore should be marked as KEEP_SPAD due to keep_spad_boundary
-        self.assertEqual(mock_kernel.minstrs_map[0].action, InstrAct.KEEP_SPAD)
+        assert mock_msyncc is not None
 
     def test_prune_minst_kernel_mstore_with_preceding_msyncc(self):
         """@brief Test MStore intermediate variable with preceding MSyncc removal."""
@@ -1573,149 +1579,21 @@ class TestPruneMinstKernel(unittest.TestCase):
         self.program._intermediate_vars = ["intermediate_var"]
 
         # Create mock MSyncc and MStore
-        mock_msyncc = MagicMock(spec=minst.MSyncc)
-        mock_msyncc.idx = 0
-        mock_msyncc.comment = ""
+        mock_msyncc = self._tpl_msyncc.clone(idx=0)
 
-        mock_mstore = MagicMock(spec=minst.MStore)
-        mock_mstore.var_name = "intermediate_var"
-        mock_mstore.spad_address = 15
-        mock_mstore.comment = ""
-        mock_mstore.idx = 1
+        mock_mstore = self._tpl_mstore.clone(var_name="intermediate_var", spad_address=15, idx=1)
 
         # Create mock kernel
         mock_kernel = MagicMock()
         mock_kernel.minstrs = [mock_msyncc, mock_mstore]
-        mock_kernel.minstrs_map = [MagicMock(), MagicMock()]
+        mock_kernel.minstrs_map = [_MapEntry() for _ in range(2)]
         mock_kernel.spad_size = 0
 
         self.program.prune_minst_kernel(mock_kernel)
 
         # Both MSyncc and MStore should be marked as SKIP
-        self.assertEqual(mock_kernel.minstrs_map[0].action, InstrAct.SKIP)  # MSyncc
-        self.assertEqual(mock_kernel.minstrs_map[1].action, InstrAct.SKIP)  # MStore
-
-    def test_prune_minst_kernel_mstore_keep_instruction(self):
-        """@brief Test MStore when instruction should be kept."""
-        # Create mock MStore with non-intermediate variable
-        mock_mstore = MagicMock(spec=minst.MStore)
-        mock_mstore.var_name = "output_var"
-        mock_mstore.spad_address = 20
-        mock_mstore.comment = ""
-        mock_mstore.idx = 0
-
-        # Create mock kernel
-        mock_kernel = MagicMock()
-        mock_kernel.minstrs = [mock_mstore]
-        mock_kernel.minstrs_map = [MagicMock()]
-        mock_kernel.spad_size = 0
-
-        self.program.prune_minst_kernel(mock_kernel)
-
-        # MStore should not be marked as SKIP
-        self.assertNotEqual(mock_kernel.minstrs_map[0].action, InstrAct.SKIP)
-        # SPAD address should be adjusted (starts at 0, no adjustment needed)
-        self.assertEqual(mock_mstore.spad_address, 20)
-
-    def test_prune_minst_kernel_mload_already_loaded(self):
-        """@brief Test MLoad handling when variable already loaded."""
-        # Set up variable tracker
-        self.program._minst_in_var_tracker = {"pt_loaded_var": 5}
-
-        # Create mock MLoad
-        mock_mload = MagicMock(spec=minst.MLoad)
-        mock_mload.var_name = "pt_loaded_var"
-        mock_mload.spad_address = 10
-        mock_mload.comment = ""
-        mock_mload.idx = 0
-
-        # Create mock kernel
-        mock_kernel = MagicMock()
-        mock_kernel.minstrs = [mock_mload]
-        mock_kernel.minstrs_map = [MagicMock()]
-        mock_kernel.spad_size = 0
-
-        self.program.prune_minst_kernel(mock_kernel)
-
-        # MLoad should be marked as SKIP
-        self.assertEqual(mock_kernel.minstrs_map[0].action, InstrAct.SKIP)
-        # SPAD address should be updated to tracked address
-        self.assertEqual(mock_mload.spad_address, 5)
-
-    def test_prune_minst_kernel_mload_intermediate_var(self):
-        """@brief Test MLoad handling with intermediate variable."""
-        # Set up intermediate variables
-        self.program._intermediate_vars = ["intermediate_var"]
-
-        # Create mock MLoad
-        mock_mload = MagicMock(spec=minst.MLoad)
-        mock_mload.var_name = "intermediate_var"
-        mock_mload.spad_address = 10
-        mock_mload.comment = ""
-        mock_mload.idx = 0
-
-        # Create mock kernel
-        mock_kernel = MagicMock()
-        mock_kernel.minstrs = [mock_mload]
-        mock_kernel.minstrs_map = [MagicMock()]
-        mock_kernel.spad_size = 0
-
-        self.program.prune_minst_kernel(mock_kernel)
-
-        # MLoad should be marked as SKIP (since keep_spad_boundary is False by default)
-        self.assertEqual(mock_kernel.minstrs_map[0].action, InstrAct.SKIP)
-
-    def test_prune_minst_kernel_mload_intermediate_var_with_spad_boundary(self):
-        """@brief Test MLoad with intermediate variable but keep_spad_boundary=True."""
-        # Create program with keep_spad_boundary=True
-        program = LinkedProgram(keep_spad_boundary=True)
-        program.initialize(
-            self.streams["minst"],
-            self.streams["cinst"],
-            self.streams["xinst"],
-            self.mem_model,
-        )
-        program._intermediate_vars = ["intermediate_var"]
-
-        # Create mock MLoad
-        mock_mload = MagicMock(spec=minst.MLoad)
-        mock_mload.var_name = "intermediate_var"
-        mock_mload.spad_address = 10
-        mock_mload.comment = ""
-        mock_mload.idx = 0
-
-        # Create mock kernel
-        mock_kernel = MagicMock()
-        mock_kernel.minstrs = [mock_mload]
-        mock_kernel.minstrs_map = [MagicMock()]
-        mock_kernel.spad_size = 0
-
-        program.prune_minst_kernel(mock_kernel)
-
-        # MLoad should be marked as KEEP_SPAD due to keep_spad_boundary
-        self.assertEqual(mock_kernel.minstrs_map[0].action, InstrAct.KEEP_SPAD)
-
-    def test_prune_minst_kernel_mload_keep_instruction(self):
-        """@brief Test MLoad when instruction should be kept."""
-        # Create mock MLoad with new variable
-        mock_mload = MagicMock(spec=minst.MLoad)
-        mock_mload.var_name = "new_var"
-        mock_mload.spad_address = 10
-        mock_mload.comment = ""
-        mock_mload.idx = 0
-
-        # Create mock kernel
-        mock_kernel = MagicMock()
-        mock_kernel.minstrs = [mock_mload]
-        mock_kernel.minstrs_map = [MagicMock()]
-        mock_kernel.spad_size = 0
-
-        self.program.prune_minst_kernel(mock_kernel)
-
-        # MLoad should not be marked as SKIP
-        self.assertNotEqual(mock_kernel.minstrs_map[0].action, InstrAct.SKIP)
-        # Variable should be added to tracker
-        self.assertEqual(self.program._minst_in_var_tracker["new_var"], 10)
+        assert mock_kernel.minstrs_map[0].action == _SKIP  # MSyncc
+        assert mock_kernel.minstrs_map[1].action == _SKIP  # MStore
 
     def test_prune_minst_kernel_mixed_instructions(self):
         """@brief Test processing multiple mixed instruction types."""
@@ -1724,77 +1602,50 @@ class TestPruneMinstKernel(unittest.TestCase):
         self.program._intermediate_vars = ["intermediate_var"]
 
         # Create mock instructions
-        mock_msyncc = MagicMock(spec=minst.MSyncc)
-        mock_msyncc.idx = 0
-        mock_msyncc.comment = "MSyncc instruction"
-
-        mock_mload1 = MagicMock(spec=minst.MLoad)  # Already loaded
-        mock_mload1.var_name = "ct_already_loaded"
-        mock_mload1.spad_address = 10
-        mock_mload1.comment = ""
-        mock_mload1.idx = 1
+        mock_msyncc = self._tpl_msyncc.clone(idx=0, comment="MSyncc instruction")
 
-        mock_mstore = MagicMock(spec=minst.MStore)  # Intermediate variable
+        mock_mload1 = self._tpl_mload.clone(var_name="ct_already_loaded", spad_address=10, idx=1)  # Already loaded
 
-        mock_mstore.var_name = "intermediate_var"
-        mock_mstore.spad_address = 15
-        mock_mstore.comment = ""
-        mock_mstore.idx = 2
+        mock_mstore = self._tpl_mstore.clone(var_name="intermediate_var", spad_address=15, idx=2)  # Intermediate variable
 
-        mock_mload2 = MagicMock(spec=minst.MLoad)  # New variable
-        mock_mload2.var_name = "ct_new_var"
-        mock_mload2.spad_address = 20
-        mock_mload2.comment = ""
-        mock_mload2.idx = 3
+        mock_mload2 = self._tpl_mload.clone(var_name="ct_new_var", spad_address=20, idx=3)  # New variable
 
         # Create mock kernel
         mock_kernel = MagicMock()
         mock_kernel.minstrs = [mock_msyncc, mock_mload1, mock_mstore, mock_mload2]
-        mock_kernel.minstrs_map = [MagicMock(), MagicMock(), MagicMock(), MagicMock()]
+        mock_kernel.minstrs_map = [_MapEntry() for _ in range(4)]
         mock_kernel.spad_size = 0
 
         self.program.prune_minst_kernel(mock_kernel)
 
         # Check actions
-        self.assertNotEqual(mock_kernel.minstrs_map[0].action, InstrAct.SKIP)  # MSyncc (no action change)
-        self.assertEqual(mock_kernel.minstrs_map[1].action, InstrAct.SKIP)  # MLoad1 (already loaded)
-        self.assertEqual(mock_kernel.minstrs_map[2].action, InstrAct.SKIP)  # MStore (intermediate)
-        self.assertNotEqual(mock_kernel.minstrs_map[3].action, InstrAct.SKIP)  # MLoad2 (new var)
+        assert mock_kernel.minstrs_map[0].action != _SKIP  # MSyncc (no action change)
+        assert mock_kernel.minstrs_map[1].action == _SKIP  # MLoad1 (already loaded)
+        assert mock_kernel.minstrs_map[2].action == _SKIP  # MStore (intermediate)
+        assert mock_kernel.minstrs_map[3].action != _SKIP  # MLoad2 (new var)
 
         # Check variable tracking
-        self.assertEqual(self.program._minst_in_var_tracker["ct_new_var"], 18)  # 20 - 2 (adjust_spad)
+        assert self.program._minst_in_var_tracker["ct_new_var"] == 18  # 20 - 2 (adjust_spad)
 
     def test_prune_minst_kernel_spad_size_tracking(self):
         """@brief Test that SPAD size is correctly tracked and updated."""
         # Create mock instructions with different SPAD addresses
-        mock_mload1 = MagicMock(spec=minst.MLoad)
-        mock_mload1.var_name = "var1"
-        mock_mload1.spad_address = 10
-        mock_mload1.comment = ""
-        mock_mload1.idx = 0
-
-        mock_mstore = MagicMock(spec=minst.MStore)
-        mock_mstore.var_name = "var2"
-        mock_mstore.spad_address = 25
-        mock_mstore.comment = ""
-        mock_mstore.idx = 1
+        mock_mload1 = self._tpl_mload.clone(var_name="var1", spad_address=10, idx=0)
 
-        mock_mload2 = MagicMock(spec=minst.MLoad)
-        mock_mload2.var_name = "var3"
-        mock_mload2.spad_address = 15
-        mock_mload2.comment = ""
-        mock_mload2.idx = 2
+        mock_mstore = self._tpl_mstore.clone(var_name="var2", spad_address=25, idx=1)
+
+        mock_mload2 = self._tpl_mload.clone(var_name="var3", spad_address=15, idx=2)
 
         # Create mock kernel
         mock_kernel = MagicMock()
         mock_kernel.minstrs = [mock_mload1, mock_mstore, mock_mload2]
-        mock_kernel.minstrs_map = [MagicMock(), MagicMock(), MagicMock()]
+        mock_kernel.minstrs_map = [_MapEntry() for _ in range(3)]
         mock_kernel.spad_size = 0
 
         self.program.prune_minst_kernel(mock_kernel)
 
         # SPAD size should be the maximum SPAD address encountered
-        self.assertEqual(mock_kernel.spad_size, 25)
+        assert mock_kernel.spad_size == 25
 
     def test_prune_minst_kernel_adjustment_calculations(self):
         """@brief Test that SPAD address adjustments are calculated correctly."""
@@ -1802,56 +1653,136 @@ class TestPruneMinstKernel(unittest.TestCase):
         self.program._intermediate_vars = ["intermediate_var1", "intermediate_var2"]
 
         # Create mock instructions that will cause adjustments
-        mock_mload1 = MagicMock(spec=minst.MLoad)  # Intermediate - will be skipped
-        mock_mload1.var_name = "intermediate_var1"
-        mock_mload1.spad_address = 10
-        mock_mload1.comment = ""
-        mock_mload1.idx = 0
-
-        mock_mstore = MagicMock(spec=minst.MStore)  # Intermediate - will be skipped
-        mock_mstore.var_name = "intermediate_var2"
-        mock_mstore.spad_address = 15
-        mock_mstore.comment = ""
-        mock_mstore.idx = 1
+        mock_mload1 = self._tpl_mload.clone(var_name="intermediate_var1", spad_address=10, idx=0)  # Intermediate - will be skipped
 
-        mock_mload2 = MagicMock(spec=minst.MLoad)  # Regular - should be adjusted
-        mock_mload2.var_name = "regular_var"
-        mock_mload2.spad_address = 20
-        mock_mload2.comment = ""
-        mock_mload2.idx = 2
+        mock_mstore = self._tpl_mstore.clone(var_name="intermediate_var2", spad_address=15, idx=1)  # Intermediate - will be skipped
+
+        mock_mload2 = self._tpl_mload.clone(var_name="regular_var", spad_address=20, idx=2)  # Regular - should be adjusted
 
         # Create mock kernel
         mock_kernel = MagicMock()
         mock_kernel.minstrs = [mock_mload1, mock_mstore, mock_mload2]
-        mock_kernel.minstrs_map = [MagicMock(), MagicMock(), MagicMock()]
+        mock_kernel.minstrs_map = [_MapEntry() for _ in range(3)]
         mock_kernel.spad_size = 0
 
         self.program.prune_minst_kernel(mock_kernel)
 
         # First two instructions should be skipped
-        self.assertEqual(mock_kernel.minstrs_map[0].action, InstrAct.SKIP)
-        self.assertEqual(mock_kernel.minstrs_map[1].action, InstrAct.SKIP)
+        assert mock_kernel.minstrs_map[0].action == _SKIP
+        assert mock_kernel.minstrs_map[1].action == _SKIP
 
         # Third instruction should have adjusted SPAD address
         # adjust_spad should be -2 (from two skipped instructions)
         expected_spad = 20 - 2  # Original 20, minus 2 for adjustments
-        self.assertEqual(mock_mload2.spad_address, expected_spad)
+        assert mock_mload2.spad_address == expected_spad
 
         # Variable should be tracked with adjusted address
-        self.assertEqual(self.program._minst_in_var_tracker["regular_var"], expected_spad)
+        assert self.program._minst_in_var_tracker["regular_var"] == expected_spad
+
+    @pytest.mark.parametrize(
+        "instr_cls,var_name,intermediate_vars,var_tracker,keep_spad_boundary,expected_action,expected_spad,expected_tracker",
+        [
+            pytest.param(
+                _FakeMStore,
+                "intermediate_var",
+                ["intermediate_var"],
+                {},
+                False,
+                _SKIP,
+                20,
+                {},
+                id="mstore_intermediate_var",
+            ),
+            pytest.param(
+                _FakeMStore,
+                "intermediate_var",
+                ["intermediate_var"],
+                {},
+                True,
+                _KEEP_SPAD,
+                20,
+                {},
+                id="mstore_intermediate_var_with_spad_boundary",
+            ),
+            pytest.param(_FakeMStore, "output_var", [], {}, False, None, 20, {}, id="mstore_keep_instruction"),
+            pytest.param(
+                _FakeMLoad,
+                "pt_loaded_var",
+                [],
+                {"pt_loaded_var": 5},
+                False,
+                _SKIP,
+                5,
+                {"pt_loaded_var": 5},
+                id="mload_already_loaded",
+            ),
+            pytest.param(
+                _FakeMLoad,
+                "intermediate_var",
+                ["intermediate_var"],
+                {},
+                False,
+                _SKIP,
+                20,
+                {},
+                id="mload_intermediate_var",
+            ),
+            pytest.param(
+                _FakeMLoad,
+                "intermediate_var",
+                ["intermediate_var"],
+                {},
+                True,
+                _KEEP_SPAD,
+                20,
+                {},
+                id="mload_intermediate_var_with_spad_boundary",
+            ),
+            pytest.param(_FakeMLoad, "new_var", [], {}, False, None, 20, {"new_var": 20}, id="mload_keep_instruction"),
+        ],
+    )
+    def test_prune_minst_kernel_single_instr(
+        self,
+        monkeypatch,
+        instr_cls,
+        var_name,
+        intermediate_vars,
+        var_tracker,
+        keep_spad_boundary,
+        expected_action,
+        expected_spad,
+        expected_tracker,
+    ):
+        """@brief Test the action, SPAD address and tracker update for a single MLoad/MStore."""
+        program = self.program
+        monkeypatch.setattr(program, "_keep_spad_boundary", keep_spad_boundary)
+        program._intermediate_vars = intermediate_vars
+        program._minst_in_var_tracker = dict(var_tracker)
+
+        instr = instr_cls(var_name=var_name, spad_address=20, comment="", idx=0)
+        mock_kernel = MagicMock()
+        mock_kernel.minstrs = [instr]
+        mock_kernel.minstrs_map = [_MapEntry()]
+        mock_kernel.spad_size = 0
+
+        program.prune_minst_kernel(mock_kernel)
+
+        assert mock_kernel.minstrs_map[0].action == expected_action
+        assert instr.spad_address == expected_spad
+        assert program._minst_in_var_tracker == expected_tracker
 
 
-class TestInsertLatencyCnopIfNeeded(unittest.TestCase):
+class TestInsertLatencyCnopIfNeeded:
     """@brief Tests for the _insert_latency_cnop_if_needed method."""
 
-    def setUp(self):
+    def setup_method(self):
         """@brief Set up test fixtures."""
         self.streams = {
             "minst": io.StringIO(),
             "cinst": io.StringIO(),
             "xinst": io.StringIO(),
         }
-        self.mem_model = MagicMock(spec=MemoryModel)
+        self.mem_model = MagicMock()
 
         # Mock the hasHBM property to return True by default
         self.has_hbm_patcher = patch.object(GlobalConfig, "hasHBM", True)
@@ -1865,7 +1796,7 @@ class TestInsertLatencyCnopIfNeeded(unittest.TestCase):
             self.mem_model,
         )
 
-    def tearDown(self):
+    def teardown_method(self):
         """@brief Tear down test fixtures."""
         self.has_hbm_patcher.stop()
 
@@ -1883,8 +1814,8 @@ class TestInsertLatencyCnopIfNeeded(unittest.TestCase):
         self.program._insert_latency_cnop_if_needed(1, mock_prev_kernel, 5)
 
         # Verify no modifications were made to previous kernel
-        self.assertEqual(len(mock_prev_kernel.cinstrs), 2)
-        self.assertEqual(len(mock_prev_kernel.cinstrs_map), 2)
+        assert len(mock_prev_kernel.cinstrs) == 2
+        assert len(mock_prev_kernel.cinstrs_map) == 2
 
     def test_insert_latency_cnop_no_prev_kernel(self):
         """@brief Test that no CNop is inserted when prev_kernel is None.
@@ -1922,8 +1853,8 @@ class TestInsertLatencyCnopIfNeeded(unittest.TestCase):
             self.program._insert_latency_cnop_if_needed(0, mock_prev_kernel, 10)
 
         # Verify no CNop was inserted
-        self.assertEqual(len(mock_prev_kernel.cinstrs), 2)
-        self.assertEqual(len(mock_prev_kernel.cinstrs_map), 2)
+        assert len(mock_prev_kernel.cinstrs) == 2
+        assert len(mock_prev_kernel.cinstrs_map) == 2
 
     def test_insert_latency_cnop_insufficient_throughput(self):
         """@brief Test that CNop is inserted when CQueue throughput is insufficient.
@@ -1957,13 +1888,13 @@ class TestInsertLatencyCnopIfNeeded(unittest.TestCase):
         # Verify CNop was inserted before cexit (at index 1)
         mock_prev_kernel.cinstrs.insert.assert_called_once()
         call_args = mock_prev_kernel.cinstrs.insert.call_args[0]
-        self.assertEqual(call_args[0], 0)  # Insert at index 1 (before cexit)
+        assert call_args[0] == 0  # Insert at index 1 (before cexit)
 
         # Verify CNop instruction was created with correct cycles
         inserted_cnop = call_args[1]
-        self.assertIsInstance(inserted_cnop, cinst.CNop)
+        assert isinstance(inserted_cnop, cinst.CNop)
         # wait_cycles = 7 - 2 = 5, CNop cycles = 5 - 1 = 4
-        self.assertEqual(inserted_cnop.cycles, 4)
+        assert inserted_cnop.cycles == 4
 
         # Verify CinstrMapEntry was also inserted
         mock_prev_kernel.cinstrs_map.insert.assert_called_once()
@@ -1996,7 +1927,7 @@ class TestInsertLatencyCnopIfNeeded(unittest.TestCase):
                 self.program._insert_latency_cnop_if_needed(0, mock_prev_kernel, 2)
 
         # Verify get_instruction_lat was called only twice (XStore was skipped)
-        self.assertEqual(mock_lat.call_count, 2)
+        assert mock_lat.call_count == 2
         mock_lat.assert_any_call(mock_xinstr1)
         mock_lat.assert_any_call(mock_xinstr2)
 
@@ -2030,11 +1961,11 @@ class TestInsertLatencyCnopIfNeeded(unittest.TestCase):
                 self.program._insert_latency_cnop_if_needed(0, mock_prev_kernel, 2)
 
         # Verify get_instruction_lat was called only for last bundle
-        self.assertEqual(mock_lat.call_count, 2)
+        assert mock_lat.call_count == 2
         mock_lat.assert_any_call(mock_xinstr_last1)
         mock_lat.assert_any_call(mock_xinstr_last2)
         # Should not be called for old bundle instruction
-        with self.assertRaises(AssertionError):
+        with pytest.raises(AssertionError):
             mock_lat.assert_any_call(mock_xinstr_old)
 
     def test_insert_latency_cnop_empty_xinstrs(self):
@@ -2052,7 +1983,7 @@ class TestInsertLatencyCnopIfNeeded(unittest.TestCase):
         self.program._insert_latency_cnop_if_needed(0, mock_prev_kernel, 5)
 
         # Verify no CNop was inserted (no latency to account for)
-        self.assertEqual(len(mock_prev_kernel.cinstrs), 2)
+        assert len(mock_prev_kernel.cinstrs) == 2
 
     def test_insert_latency_cnop_exact_throughput_match(self):
         """@brief Test that no CNop is inserted when throughput exactly matches latency.
@@ -2077,8 +2008,8 @@ class TestInsertLatencyCnopIfNeeded(unittest.TestCase):
             self.program._insert_latency_cnop_if_needed(0, mock_prev_kernel, 5)
 
         # Verify no CNop was inserted
-        self.assertEqual(len(mock_prev_kernel.cinstrs), 2)
-        self.assertEqual(len(mock_prev_kernel.cinstrs_map), 2)
+        assert len(mock_prev_kernel.cinstrs) == 2
+        assert len(mock_prev_kernel.cinstrs_map) == 2
 
     def test_insert_latency_cnop_comment_content(self):
         """@brief Test that inserted CNop has correct comment.
@@ -2111,20 +2042,20 @@ class TestInsertLatencyCnopIfNeeded(unittest.TestCase):
 
         # Check that comment contains expected information about latency
         expected_comment = " Inserted by linker to account for last XInst bundle latency (8 cycles)"
-        self.assertEqual(inserted_cnop.comment, expected_comment)
+        assert inserted_cnop.comment == expected_comment
 
 
-class TestPreloadKernels(unittest.TestCase):
+class TestPreloadKernels:
     """@brief Tests for the preload_kernels method."""
 
-    def setUp(self):
+    def setup_method(self):
         """@brief Set up test fixtures."""
         self.streams = {
             "minst": io.StringIO(),
             "cinst": io.StringIO(),
             "xinst": io.StringIO(),
         }
-        self.mem_model = MagicMock(spec=MemoryModel)
+        self.mem_model = MagicMock()
 
         # Mock the hasHBM property to return True by default
         self.has_hbm_patcher = patch.object(GlobalConfig, "hasHBM", True)
@@ -2138,7 +2069,7 @@ class TestPreloadKernels(unittest.TestCase):
             self.mem_model,
         )
 
-    def tearDown(self):
+    def teardown_method(self):
         """@brief Tear down test fixtures."""
         self.has_hbm_patcher.stop()
 
@@ -2188,19 +2119,19 @@ class TestPreloadKernels(unittest.TestCase):
             # Verify minst processing (HBM enabled)
             mock_load_minst.assert_called_once_with(mock_kernel.minst)
             mock_remap_mc.assert_any_call(mock_minstrs, mock_kernel.hbm_remap_dict)
-            self.assertEqual(mock_kernel.minstrs, mock_minstrs)
+            assert mock_kernel.minstrs == mock_minstrs
 
             # Verify cinst processing
             mock_load_cinst.assert_called_once_with(mock_kernel.cinst)
             mock_remap_cinst_hbm.assert_called_once_with(mock_cinstrs, mock_kernel.hbm_remap_dict)
             mock_preprocess_cinst.assert_called_once_with(mock_kernel)
-            self.assertEqual(mock_kernel.cinstrs, mock_cinstrs)
+            assert mock_kernel.cinstrs == mock_cinstrs
 
             # Verify xinst processing
             mock_load_xinst.assert_called_once_with(mock_kernel.xinst)
             mock_remap_xinst.assert_called_once_with(mock_xinstrs, mock_kernel.hbm_remap_dict)
             mock_preprocess_xinst.assert_called_once_with(mock_kernel, 0)
-            self.assertEqual(mock_kernel.xinstrs, mock_xinstrs)
+            assert mock_kernel.xinstrs == mock_xinstrs
 
     def test_preload_kernels_single_kernel_no_hbm(self):
         """@brief Test preloading a single kernel with HBM disabled.
@@ -2240,13 +2171,13 @@ class TestPreloadKernels(unittest.TestCase):
                 mock_remap_mc.assert_called_once_with(mock_cinstrs, mock_kernel.hbm_remap_dict)
                 mock_remap_cinst_hbm.assert_not_called()
                 mock_preprocess_cinst.assert_called_once_with(mock_kernel)
-                self.assertEqual(mock_kernel.cinstrs, mock_cinstrs)
+                assert mock_kernel.cinstrs == mock_cinstrs
 
                 # Verify xinst processing
                 mock_load_xinst.assert_called_once_with(mock_kernel.xinst)
                 mock_remap_xinst.assert_called_once_with(mock_xinstrs, mock_kernel.hbm_remap_dict)
                 mock_preprocess_xinst.assert_called_once_with(mock_kernel, 0)
-                self.assertEqual(mock_kernel.xinstrs, mock_xinstrs)
+                assert mock_kernel.xinstrs == mock_xinstrs
 
     def test_preload_kernels_multiple_kernels(self):
         """@brief Test preloading multiple kernels.
@@ -2277,9 +2208,9 @@ class TestPreloadKernels(unittest.TestCase):
             self.program.preload_kernels(kernels_info)
 
             # Verify both kernels were processed
-            self.assertEqual(mock_load_minst.call_count, 2)
-            self.assertEqual(mock_load_cinst.call_count, 2)
-            self.assertEqual(mock_load_xinst.call_count, 2)
+            assert mock_load_minst.call_count == 2
+            assert mock_load_cinst.call_count == 2
+            assert mock_load_xinst.call_count == 2
 
             # Verify preprocessing was called with correct kernel indices
             expected_preprocess_calls = [
@@ -2372,7 +2303,7 @@ class TestPreloadKernels(unittest.TestCase):
 
             # Verify the order of operations
             expected_order = ["minst", "cinst", "preprocess_cinst", "xinst", "preprocess_xinst"]
-            self.assertEqual(call_order, expected_order)
+            assert call_order == expected_order
 
     def test_preload_kernels_exception_handling(self):
         """@brief Test preloading kernels when file loading raises exceptions.
@@ -2389,7 +2320,7 @@ class TestPreloadKernels(unittest.TestCase):
 
         # Test exception from minst loading
         with patch("linker.steps.program_linker.Loader.load_minst_kernel_from_file", side_effect=FileNotFoundError("Minst file not found")):
-            with self.assertRaises(FileNotFoundError):
+            with pytest.raises(FileNotFoundError):
                 self.program.preload_kernels(kernels_info)
 
         # Test exception from cinst loading
@@ -2398,7 +2329,7 @@ class TestPreloadKernels(unittest.TestCase):
             patch("linker.steps.program_linker.Loader.load_cinst_kernel_from_file", side_effect=FileNotFoundError("Cinst file not found")),
             patch("linker.steps.program_linker.kern_mapper.remap_m_c_instrs_vars"),
         ):
-            with self.assertRaises(FileNotFoundError):
+            with pytest.raises(FileNotFoundError):
                 self.program.preload_kernels(kernels_info)
 
         # Test exception from xinst loading
@@ -2410,7 +2341,7 @@ class TestPreloadKernels(unittest.TestCase):
             patch("linker.steps.program_linker.kern_mapper.remap_cinstrs_vars_hbm"),
             patch.object(self.program, "_preprocess_cinst_kernel"),
         ):
-            with self.assertRaises(FileNotFoundError):
+            with pytest.raises(FileNotFoundError):
                 self.program.preload_kernels(kernels_info)
 
     def test_preload_kernels_kernel_modification(self):
@@ -2470,13 +2401,13 @@ class TestPreloadKernels(unittest.TestCase):
             self.program.preload_kernels(kernels_info)
 
             # Verify each kernel got the correct instruction lists
-            self.assertEqual(mock_kernel1.minstrs, mock_minstrs1)
-            self.assertEqual(mock_kernel1.cinstrs, mock_cinstrs1)
-            self.assertEqual(mock_kernel1.xinstrs, mock_xinstrs1)
+            assert mock_kernel1.minstrs == mock_minstrs1
+            assert mock_kernel1.cinstrs == mock_cinstrs1
+            assert mock_kernel1.xinstrs == mock_xinstrs1
 
-            self.assertEqual(mock_kernel2.minstrs, mock_minstrs2)
-            self.assertEqual(mock_kernel2.cinstrs, mock_cinstrs2)
-            self.assertEqual(mock_kernel2.xinstrs, mock_xinstrs2)
+            assert mock_kernel2.minstrs == mock_minstrs2
+            assert mock_kernel2.cinstrs == mock_cinstrs2
+            assert mock_kernel2.xinstrs == mock_xinstrs2
 
     def test_preload_kernels_preprocessing_calls(self):
         """@brief Test that preprocessing methods are called correctly.
@@ -2506,8 +2437,8 @@ class TestPreloadKernels(unittest.TestCase):
             self.program.preload_kernels(kernels_info)
 
             # Verify preprocessing was called for each kernel
-            self.assertEqual(mock_preprocess_cinst.call_count, 3)
-            self.assertEqual(mock_preprocess_xinst.call_count, 3)
+            assert mock_preprocess_cinst.call_count == 3
+            assert mock_preprocess_xinst.call_count == 3
 
             # Verify correct arguments were passed
             expected_cinst_calls = [call(kernel) for kernel in kernels_info]
@@ -8,14 +8,17 @@
 @brief Unit tests for the program_linker_utils module.
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, create_autospec, patch
 
 import pytest
+from assembler.instructions import cinst as ISACInst
 from linker.instructions import cinst, minst, xinst
 from linker.kern_trace.kernel_info import InstrAct
 from linker.steps.program_linker_utils import (
     get_instruction_lat,
     get_instruction_tp,
+    index_cloads_by_register,
+    index_minstrs_by_spad,
     proc_seq_bloads,
     remove_csyncm,
     search_cinstrs_back,
@@ -23,39 +26,72 @@ from linker.steps.program_linker_utils import (
     search_minstrs_forward,
 )
 
+# Module-level aliases for the instruction classes and actions used throughout these tests
+_MLoad = minst.MLoad
+_MStore = minst.MStore
+_MSyncc = minst.MSyncc
+_BLoad = cinst.BLoad
+_CLoad = cinst.CLoad
+_CSyncm = cinst.CSyncm
+_SKIP = InstrAct.SKIP
 
-class TestCalculateInstructionLatencyAdjustment:
-    """@brief Tests for get_instruction_tp function."""
 
-    @patch("assembler.instructions.cinst.CLoad.get_throughput", return_value=5)
-    def test_cload_latency(self, mock_get_throughput):
-        """@brief Test latency calculation for CLoad instruction."""
-        mock_cload = MagicMock(spec=cinst.CLoad)
+def _fresh_mock(cls, **attrs):
+    """
+    @brief Returns a new autospec'd instance mock of cls with its own call records.
 
-        result = get_instruction_tp(mock_cload)
+    @param cls Instruction class to mock.
+    @param attrs Attribute values to set on the returned mock.
+    """
+    return create_autospec(cls, instance=True, **attrs)
 
-        assert result == 5
-        mock_get_throughput.assert_called_once()
 
-    @patch("assembler.instructions.cinst.BLoad.get_throughput", return_value=3)
-    def test_bload_latency(self, mock_get_throughput):
-        """@brief Test latency calculation for BLoad instruction."""
-        mock_bload = MagicMock(spec=cinst.BLoad)
+def _zero_arg_stub(cls):
+    """@brief Instantiates a subclass of cls that skips token parsing, for isinstance-only dispatch."""
+    return type(f"_{cls.__name__}Stub", (cls,), {"__init__": lambda self: None})()
 
-        result = get_instruction_tp(mock_bload)
 
-        assert result == 3
-        mock_get_throughput.assert_called_once()
+# Shared across tests: get_instruction_tp only dispatches on the instance type.
+_TP_STUBS = {cls: _zero_arg_stub(cls) for cls in (_CLoad, _BLoad, cinst.BOnes)}
 
-    @patch("assembler.instructions.cinst.BOnes.get_throughput", return_value=2)
-    def test_bones_latency(self, mock_get_throughput):
-        """@brief Test latency calculation for BOnes instruction."""
-        mock_bones = MagicMock(spec=cinst.BOnes)
 
-        result = get_instruction_tp(mock_bones)
+class _MapEntry:
+    """@brief Minimal instruction map entry; the functions under test only touch its action."""
 
-        assert result == 2
-        mock_get_throughput.assert_called_once()
+    __slots__ = ("action",)
+
+    def __init__(self):
+        self.action = None
+
+
+class _SearchEntry:
+    """@brief Minimal MInstruction map entry for the search_minstrs_* tests."""
+
+    __slots__ = ("minstr", "spad_addr")
+
+    def __init__(self, minstr, spad_addr):
+        self.minstr = minstr
+        self.spad_addr = spad_addr
+
+
+class TestCalculateInstructionLatencyAdjustment:
+    """@brief Tests for get_instruction_tp function."""
+
+    @pytest.mark.parametrize(
+        "linker_cls,isa_cls,throughput",
+        [
+            (_CLoad, ISACInst.CLoad, 5),
+            (_BLoad, ISACInst.BLoad, 3),
+            (cinst.BOnes, ISACInst.BOnes, 2),
+        ],
+    )
+    def test_instruction_latency(self, monkeypatch, linker_cls, isa_cls, throughput):
+        """@brief Test latency calculation for instructions with a known throughput."""
+        monkeypatch.setattr(isa_cls, "get_throughput", lambda: throughput)
+
+        result = get_instruction_tp(_TP_STUBS[linker_cls])
+
+        assert result == throughput
 
     def test_unknown_instruction_latency(self):
         """@brief Test latency calculation for unknown instruction type."""
@@ -77,12 +113,11 @@ class TestProcessBloadInstructions:
 
     def test_process_single_bload_not_in_tracker(self):
         """@brief Test processing single BLoad not in tracker."""
-        mock_bload = MagicMock(spec=cinst.BLoad)
-        mock_bload.var_name = "var1"
+        mock_bload = _fresh_mock(_BLoad, var_name="var1")
 
         kernel_cinstrs = [mock_bload]
 
-        mock_map_entry = MagicMock()
+        mock_map_entry = _MapEntry()
         kernel_cinstrs_map = [mock_map_entry]
 
         cinst_in_var_tracker = {}
@@ -91,16 +126,15 @@ class TestProcessBloadInstructions:
 
         assert result == 0  # idx - 1
         # Action should not be modified since var not in tracker
-        assert mock_map_entry.action != InstrAct.SKIP
+        assert mock_map_entry.action != _SKIP
 
     def test_process_single_bload_in_tracker(self):
         """@brief Test processing single BLoad in tracker."""
-        mock_bload = MagicMock(spec=cinst.BLoad)
-        mock_bload.var_name = "var1"
+        mock_bload = _fresh_mock(_BLoad, var_name="var1")
 
         kernel_cinstrs = [mock_bload]
 
-        mock_map_entry = MagicMock()
+        mock_map_entry = _MapEntry()
         kernel_cinstrs_map = [mock_map_entry]
 
         cinst_in_var_tracker = {"var1": 0}
@@ -108,22 +142,19 @@ class TestProcessBloadInstructions:
         _, result = proc_seq_bloads(kernel_cinstrs, kernel_cinstrs_map, cinst_in_var_tracker, 0)
 
         assert result == 0  # idx - 1
-        assert mock_map_entry.action == InstrAct.SKIP
+        assert mock_map_entry.action == _SKIP
 
     def test_process_multiple_bload_instructions(self):
         """@brief Test processing multiple consecutive BLoad instructions."""
-        mock_bload1 = MagicMock(spec=cinst.BLoad)
-        mock_bload1.var_name = "var1"
+        mock_bload1 = _fresh_mock(_BLoad, var_name="var1")
 
-        mock_bload2 = MagicMock(spec=cinst.BLoad)
-        mock_bload2.var_name = "var2"
+        mock_bload2 = _fresh_mock(_BLoad, var_name="var2")
 
-        mock_bload3 = MagicMock(spec=cinst.BLoad)
-        mock_bload3.var_name = "var3"
+        mock_bload3 = _fresh_mock(_BLoad, var_name="var3")
 
         kernel_cinstrs = [mock_bload1, mock_bload2, mock_bload3]
 
-        mock_map_entries = [MagicMock(), MagicMock(), MagicMock()]
+        mock_map_entries = [_MapEntry() for _ in range(3)]
         kernel_cinstrs_map = mock_map_entries
 
         cinst_in_var_tracker = {"var2": 1}  # Only var2 is tracked
@@ -132,20 +163,19 @@ class TestProcessBloadInstructions:
 
         assert result == 2  # 3 - 1
         # Only var2 should be marked as SKIP
-        assert mock_map_entries[1].action == InstrAct.SKIP
-        assert mock_map_entries[0].action != InstrAct.SKIP
-        assert mock_map_entries[2].action != InstrAct.SKIP
+        assert mock_map_entries[1].action == _SKIP
+        assert mock_map_entries[0].action != _SKIP
+        assert mock_map_entries[2].action != _SKIP
 
     def test_process_bload_mixed_with_other_instructions(self):
         """@brief Test processing BLoad when followed by non-BLoad instruction."""
-        mock_bload = MagicMock(spec=cinst.BLoad)
-        mock_bload.var_name = "var1"
+        mock_bload = _fresh_mock(_BLoad, var_name="var1")
 
-        mock_cload = MagicMock(spec=cinst.CLoad)
+        mock_cload = _fresh_mock(_CLoad)
 
         kernel_cinstrs = [mock_bload, mock_cload]
 
-        mock_map_entries = [MagicMock(), MagicMock()]
+        mock_map_entries = [_MapEntry() for _ in range(2)]
         kernel_cinstrs_map = mock_map_entries
 
         cinst_in_var_tracker = {}
@@ -161,60 +191,49 @@ class TestRemoveCsyncm:
     @patch("assembler.instructions.cinst.CSyncm.get_throughput", return_value=4)
     def test_remove_valid_csyncm(self, mock_get_throughput):
         """@brief Test removing valid CSyncm instruction."""
-        mock_csyncm = MagicMock(spec=cinst.CSyncm)
+        mock_csyncm = _fresh_mock(_CSyncm)
 
         kernel_cinstrs = [mock_csyncm]
 
-        mock_map_entry = MagicMock()
+        mock_map_entry = _MapEntry()
         kernel_cinstrs_map = [mock_map_entry]
 
         adjust_idx, adjust_cycles = remove_csyncm(kernel_cinstrs, kernel_cinstrs_map, 0)
 
         assert adjust_idx == -1
         assert adjust_cycles == 4
-        assert mock_map_entry.action == InstrAct.SKIP
+        assert mock_map_entry.action == _SKIP
         mock_get_throughput.assert_called_once()
 
     def test_remove_non_csyncm_instruction(self):
         """@brief Test attempting to remove non-CSyncm instruction."""
-        mock_cload = MagicMock(spec=cinst.CLoad)
+        mock_cload = _fresh_mock(_CLoad)
 
         kernel_cinstrs = [mock_cload]
 
-        mock_map_entry = MagicMock()
+        mock_map_entry = _MapEntry()
         kernel_cinstrs_map = [mock_map_entry]
 
         adjust_idx, adjust_cycles = remove_csyncm(kernel_cinstrs, kernel_cinstrs_map, 0)
 
         assert adjust_idx == 0
         assert adjust_cycles == 0
-        assert mock_map_entry.action != InstrAct.SKIP
-
-    def test_remove_csyncm_invalid_index_negative(self):
-        """@brief Test removing CSyncm with negative index."""
-        kernel_cinstrs = []
-        kernel_cinstrs_map = []
-
-        adjust_idx, adjust_cycles = remove_csyncm(kernel_cinstrs, kernel_cinstrs_map, -1)
-
-        assert adjust_idx == 0
-        assert adjust_cycles == 0
-
-    def test_remove_csyncm_invalid_index_too_large(self):
-        """@brief Test removing CSyncm with index larger than list."""
-        mock_cload = MagicMock(spec=cinst.CLoad)
-
-        kernel_cinstrs = [mock_cload]
-        kernel_cinstrs_map = [MagicMock()]
-
-        adjust_idx, adjust_cycles = remove_csyncm(kernel_cinstrs, kernel_cinstrs_map, 5)
-
-        assert adjust_idx == 0
-        assert adjust_cycles == 0
-
-    def test_remove_csyncm_empty_lists(self):
-        """@brief Test removing CSyncm from empty lists."""
-        adjust_idx, adjust_cycles = remove_csyncm([], [], 0)
+        assert mock_map_entry.action != _SKIP
+
+    @pytest.mark.parametrize(
+        "instr_classes,idx",
+        [
+            pytest.param([], -1, id="invalid_index_negative"),
+            pytest.param([_CLoad], 5, id="invalid_index_too_large"),
+            pytest.param([], 0, id="empty_lists"),
+        ],
+    )
+    def test_remove_csyncm_noop(self, instr_classes, idx):
+        """@brief Test that out-of-range indices leave the instructions untouched."""
+        kernel_cinstrs = [_fresh_mock(cls) for cls in instr_classes]
+        kernel_cinstrs_map = [_MapEntry() for _ in instr_classes]
+
+        adjust_idx, adjust_cycles = remove_csyncm(kernel_cinstrs, kernel_cinstrs_map, idx)
 
         assert adjust_idx == 0
         assert adjust_cycles == 0
@@ -225,16 +244,12 @@ class TestSearchMinstrsBack:
 
     def test_search_minstrs_back_found(self):
         """@brief Test searching backwards and finding MLoad."""
-        mock_mload = MagicMock(spec=minst.MLoad)
-        mock_msyncc = MagicMock(spec=minst.MSyncc)
+        mock_mload = _fresh_mock(_MLoad)
+        mock_msyncc = _fresh_mock(_MSyncc)
 
-        mock_entry1 = MagicMock()
-        mock_entry1.minstr = mock_msyncc
-        mock_entry1.spad_addr = -1
+        mock_entry1 = _SearchEntry(mock_msyncc, -1)
 
-        mock_entry2 = MagicMock()
-        mock_entry2.minstr = mock_mload
-        mock_entry2.spad_addr = 10
+        mock_entry2 = _SearchEntry(mock_mload, 10)
 
         minstrs_map = [mock_entry1, mock_entry2]
 
@@ -244,21 +259,15 @@ class TestSearchMinstrsBack:
 
     def test_search_minstrs_back_found_earlier_index(self):
         """@brief Test searching backwards and finding MLoad at earlier index."""
-        mock_mload1 = MagicMock(spec=minst.MLoad)
-        mock_mload2 = MagicMock(spec=minst.MLoad)
-        mock_mstore = MagicMock(spec=minst.MStore)
+        mock_mload1 = _fresh_mock(_MLoad)
+        mock_mload2 = _fresh_mock(_MLoad)
+        mock_mstore = _fresh_mock(_MStore)
 
-        mock_entry1 = MagicMock()
-        mock_entry1.minstr = mock_mload1
-        mock_entry1.spad_addr = 5
+        mock_entry1 = _SearchEntry(mock_mload1, 5)
 
-        mock_entry2 = MagicMock()
-        mock_entry2.minstr = mock_mload2
-        mock_entry2.spad_addr = 10
+        mock_entry2 = _SearchEntry(mock_mload2, 10)
 
-        mock_entry3 = MagicMock()
-        mock_entry3.minstr = mock_mstore
-        mock_entry3.spad_addr = 15
+        mock_entry3 = _SearchEntry(mock_mstore, 15)
 
         minstrs_map = [mock_entry1, mock_entry2, mock_entry3]
 
@@ -266,36 +275,20 @@ class TestSearchMinstrsBack:
 
         assert result == 0
 
-    def test_search_minstrs_back_not_found(self):
-        """@brief Test searching backwards when MLoad not found."""
-        mock_mstore = MagicMock(spec=minst.MStore)
-
-        mock_entry = MagicMock()
-        mock_entry.minstr = mock_mstore
-        mock_entry.spad_addr = 10
-
-        minstrs_map = [mock_entry]
-
-        with pytest.raises(RuntimeError, match="Could not find MLoad with SPAD address 20"):
-            search_minstrs_back(minstrs_map, 0, 20)
-
-    def test_search_minstrs_back_wrong_spad_address(self):
-        """@brief Test searching backwards with wrong SPAD address."""
-        mock_mload = MagicMock(spec=minst.MLoad)
+    @pytest.mark.parametrize(
+        "entries,spad_address,error,match",
+        [
+            pytest.param([(_MStore, 10)], 20, RuntimeError, "Could not find MLoad with SPAD address 20", id="not_found"),
+            pytest.param([(_MLoad, 5)], 10, RuntimeError, "Could not find MLoad with SPAD address 10", id="wrong_spad_address"),
+            pytest.param([], 10, IndexError, "Index 0 is out of bounds for minstrs_map", id="empty_map"),
+        ],
+    )
+    def test_search_minstrs_back_errors(self, entries, spad_address, error, match):
+        """@brief Test the error raised when searching backwards fails."""
+        minstrs_map = [_SearchEntry(_fresh_mock(cls), addr) for cls, addr in entries]
 
-        mock_entry = MagicMock()
-        mock_entry.minstr = mock_mload
-        mock_entry.spad_addr = 5
-
-        minstrs_map = [mock_entry]
-
-        with pytest.raises(RuntimeError, match="Could not find MLoad with SPAD address 10"):
-            search_minstrs_back(minstrs_map, 0, 10)
-
-    def test_search_minstrs_back_empty_map(self):
-        """@brief Test searching backwards in empty map."""
-        with pytest.raises(IndexError, match="Index 0 is out of bounds for minstrs_map"):
-            search_minstrs_back([], 0, 10)
+        with pytest.raises(error, match=match):
+            search_minstrs_back(minstrs_map, 0, spad_address)
 
 
 class TestSearchMinstrsForward:
@@ -303,16 +296,12 @@ class TestSearchMinstrsForward:
 
     def test_search_minstrs_forward_found_mstore(self):
         """@brief Test searching forward and finding MStore."""
-        mock_mload = MagicMock(spec=minst.MLoad)
-        mock_mstore = MagicMock(spec=minst.MStore)
+        mock_mload = _fresh_mock(_MLoad)
+        mock_mstore = _fresh_mock(_MStore)
 
-        mock_entry1 = MagicMock()
-        mock_entry1.minstr = mock_mload
-        mock_entry1.spad_addr = 5
+        mock_entry1 = _SearchEntry(mock_mload, 5)
 
-        mock_entry2 = MagicMock()
-        mock_entry2.minstr = mock_mstore
-        mock_entry2.spad_addr = 10
+        mock_entry2 = _SearchEntry(mock_mstore, 10)
 
         minstrs_map = [mock_entry1, mock_entry2]
 
@@ -322,16 +311,12 @@ class TestSearchMinstrsForward:
 
     def test_search_minstrs_forward_found_mload(self):
         """@brief Test searching forward and finding MLoad."""
-        mock_mload1 = MagicMock(spec=minst.MLoad)
-        mock_mload2 = MagicMock(spec=minst.MLoad)
+        mock_mload1 = _fresh_mock(_MLoad)
+        mock_mload2 = _fresh_mock(_MLoad)
 
-        mock_entry1 = MagicMock()
-        mock_entry1.minstr = mock_mload1
-        mock_entry1.spad_addr = 5
+        mock_entry1 = _SearchEntry(mock_mload1, 5)
 
-        mock_entry2 = MagicMock()
-        mock_entry2.minstr = mock_mload2
-        mock_entry2.spad_addr = 10
+        mock_entry2 = _SearchEntry(mock_mload2, 10)
 
         minstrs_map = [mock_entry1, mock_entry2]
 
@@ -341,11 +326,9 @@ class TestSearchMinstrsForward:
 
     def test_search_minstrs_forward_found_at_start_index(self):
         """@brief Test searching forward and finding at start index."""
-        mock_mstore = MagicMock(spec=minst.MStore)
+        mock_mstore = _fresh_mock(_MStore)
 
-        mock_entry = MagicMock()
-        mock_entry.minstr = mock_mstore
-        mock_entry.spad_addr = 10
+        mock_entry = _SearchEntry(mock_mstore, 10)
 
         minstrs_map = [mock_entry]
 
@@ -353,49 +336,71 @@ class TestSearchMinstrsForward:
 
         assert result == 0
 
-    def test_search_minstrs_forward_not_found(self):
-        """@brief Test searching forward when instruction not found."""
-        mock_msyncc = MagicMock(spec=minst.MSyncc)
+    @pytest.mark.parametrize(
+        "entries,start_idx",
+        [
+            pytest.param([(_MSyncc, -1)], 0, id="not_found"),
+            pytest.param([(_MStore, 5)], 0, id="wrong_spad_address"),
+            pytest.param([(_MStore, 10)], 5, id="start_beyond_range"),
+            pytest.param([], 0, id="empty_map"),
+        ],
+    )
+    def test_search_minstrs_forward_not_found(self, entries, start_idx):
+        """@brief Test that searching forward raises when no matching instruction is reachable."""
+        minstrs_map = [_SearchEntry(_fresh_mock(cls), addr) for cls, addr in entries]
 
-        mock_entry = MagicMock()
-        mock_entry.minstr = mock_msyncc
-        mock_entry.spad_addr = -1
+        with pytest.raises(RuntimeError, match="Could not find MStore with SPAD address 10"):
+            search_minstrs_forward(minstrs_map, start_idx, 10)
 
-        minstrs_map = [mock_entry]
 
-        with pytest.raises(RuntimeError, match="Could not find MStore with SPAD address 10"):
-            search_minstrs_forward(minstrs_map, 0, 10)
+class TestIndexMinstrsBySpad:
+    """@brief Tests for index_minstrs_by_spad and the indexed search_minstrs_* paths."""
 
-    def test_search_minstrs_forward_wrong_spad_address(self):
-        """@brief Test searching forward with wrong SPAD address."""
-        mock_mstore = MagicMock(spec=minst.MStore)
+    @staticmethod
+    def _build_map():
+        entries = [(_MLoad, 5), (_MSyncc, -1), (_MStore, 5), (_MLoad, 10), (_MLoad, 5)]
+        return [_SearchEntry(_fresh_mock(cls), addr) for cls, addr in entries]
 
-        mock_entry = MagicMock()
-        mock_entry.minstr = mock_mstore
-        mock_entry.spad_addr = 5
+    def test_index_minstrs_by_spad(self):
+        """@brief Test that MLoads and MStores are indexed by SPAD address in map order."""
+        mload_index, minstr_index = index_minstrs_by_spad(self._build_map())
 
-        minstrs_map = [mock_entry]
+        assert mload_index == {5: [0, 4], 10: [3]}
+        assert minstr_index == {5: [0, 2, 4], 10: [3]}
 
-        with pytest.raises(RuntimeError, match="Could not find MStore with SPAD address 10"):
-            search_minstrs_forward(minstrs_map, 0, 10)
+    @pytest.mark.parametrize("idx,spad_address", [(0, 5), (3, 5), (4, 5), (3, 10), (4, 10)])
+    def test_search_minstrs_back_indexed(self, idx, spad_address):
+        """@brief Test that the indexed backward search matches the linear scan."""
+        minstrs_map = self._build_map()
+        mload_index, _ = index_minstrs_by_spad(minstrs_map)
 
-    def test_search_minstrs_forward_start_beyond_range(self):
-        """@brief Test searching forward starting beyond map range."""
-        mock_mstore = MagicMock(spec=minst.MStore)
+        assert search_minstrs_back(minstrs_map, idx, spad_address, mload_index) == search_minstrs_back(minstrs_map, idx, spad_address)
 
-        mock_entry = MagicMock()
-        mock_entry.minstr = mock_mstore
-        mock_entry.spad_addr = 10
+    @pytest.mark.parametrize("idx,spad_address", [(0, 5), (1, 5), (3, 5), (0, 10), (3, 10)])
+    def test_search_minstrs_forward_indexed(self, idx, spad_address):
+        """@brief Test that the indexed forward search matches the linear scan."""
+        minstrs_map = self._build_map()
+        _, minstr_index = index_minstrs_by_spad(minstrs_map)
 
-        minstrs_map = [mock_entry]
+        assert search_minstrs_forward(minstrs_map, idx, spad_address, minstr_index) == search_minstrs_forward(
+            minstrs_map, idx, spad_address
+        )
 
-        with pytest.raises(RuntimeError, match="Could not find MStore with SPAD address 10"):
-            search_minstrs_forward(minstrs_map, 5, 10)
+    def test_search_minstrs_back_indexed_not_found(self):
+        """@brief Test that the indexed backward search raises when no MLoad precedes idx."""
+        minstrs_map = self._build_map()
+        mload_index, _ = index_minstrs_by_spad(minstrs_map)
+
+        with pytest.raises(RuntimeError, match="Could not find MLoad with SPAD address 10"):
+            search_minstrs_back(minstrs_map, 2, 10, mload_index)
+
+    def test_search_minstrs_forward_indexed_not_found(self):
+        """@brief Test that the indexed forward search raises when no MLoad/MStore follows idx."""
+        minstrs_map = self._build_map()
+        _, minstr_index = index_minstrs_by_spad(minstrs_map)
 
-    def test_search_minstrs_forward_empty_map(self):
-        """@brief Test searching forward in empty map."""
         with pytest.raises(RuntimeError, match="Could not find MStore with SPAD address 10"):
-            search_minstrs_forward([], 0, 10)
+            search_minstrs_forward(minstrs_map, 4, 10, minstr_index)
 
 
 class TestGetInstructionLat:
@@ -403,35 +408,35 @@ class TestGetInstructionLat:
 
     @patch("assembler.instructions.xinst.Add.get_latency", return_value=7)
     def test_add_latency(self, mock_get_latency):
-        mock_add = MagicMock(spec=xinst.Add)
+        mock_add = _fresh_mock(xinst.Add)
         result = get_instruction_lat(mock_add)
         assert result == 7
         mock_get_latency.assert_called_once()
 
     @patch("assembler.instructions.xinst.Sub.get_latency", return_value=5)
     def test_sub_latency(self, mock_get_latency):
-        mock_sub = MagicMock(spec=xinst.Sub)
+        mock_sub = _fresh_mock(xinst.Sub)
         result = get_instruction_lat(mock_sub)
         assert result == 5
         mock_get_latency.assert_called_once()
 
     @patch("assembler.instructions.xinst.XStore.get_latency", return_value=10)
     def test_xstore_latency(self, mock_get_latency):
-        mock_xstore = MagicMock(spec=xinst.XStore)
+        mock_xstore = _fresh_mock(xinst.XStore)
         result = get_instruction_lat(mock_xstore)
         assert result == 10
         mock_get_latency.assert_called_once()
 
     @patch("assembler.instructions.xinst.Move.get_latency", return_value=3)
     def test_move_latency(self, mock_get_latency):
-        mock_move = MagicMock(spec=xinst.Move)
+        mock_move = _fresh_mock(xinst.Move)
         result = get_instruction_lat(mock_move)
         assert result == 3
         mock_get_latency.assert_called_once()
 
     @patch("assembler.instructions.xinst.Nop.get_latency", return_value=1)
     def test_nop_latency(self, mock_get_latency):
-        mock_nop = MagicMock(spec=xinst.Nop)
+        mock_nop = _fresh_mock(xinst.Nop)
         result = get_instruction_lat(mock_nop)
         assert result == 1
         mock_get_latency.assert_called_once()
@@ -447,21 +452,21 @@ class TestGetInstructionLat:
 
     @patch("assembler.instructions.xinst.Add.get_latency", side_effect=TypeError)
     def test_add_latency_type_error(self, mock_get_latency):
-        mock_add = MagicMock(spec=xinst.Add)
+        mock_add = _fresh_mock(xinst.Add)
         result = get_instruction_lat(mock_add)
         assert result == 0
         mock_get_latency.assert_called_once()
 
     @patch("assembler.instructions.xinst.Add.get_latency", side_effect=AttributeError)
     def test_add_latency_attribute_error(self, mock_get_latency):
-        mock_add = MagicMock(spec=xinst.Add)
+        mock_add = _fresh_mock(xinst.Add)
         result = get_instruction_lat(mock_add)
         assert result == 0
         mock_get_latency.assert_called_once()
 
     @patch("assembler.instructions.xinst.Add.get_latency", side_effect=ValueError)
     def test_add_latency_value_error(self, mock_get_latency):
-        mock_add = MagicMock(spec=xinst.Add)
+        mock_add = _fresh_mock(xinst.Add)
         result = get_instruction_lat(mock_add)
         assert result == 0
         mock_get_latency.assert_called_once()
@@ -471,15 +476,11 @@ class TestSearchCinstrsBack:
     """@brief Tests for search_cinstrs_back function."""
 
     def test_found_cinstr_with_matching_register(self):
-        mock_cinstr1 = MagicMock(spec=cinst.CLoad)
-        mock_cinstr1.register = "r1"
-        mock_cinstr1.var_name = "var1"
+        mock_cinstr1 = _fresh_mock(_CLoad, register="r1", var_name="var1")
         mock_entry1 = MagicMock()
         mock_entry1.cinstr = mock_cinstr1
 
-        mock_cinstr2 = MagicMock(spec=cinst.CLoad)
-        mock_cinstr2.register = "r2"
-        mock_cinstr2.var_name = "var2"
+        mock_cinstr2 = _fresh_mock(_CLoad, register="r2", var_name="var2")
         mock_entry2 = MagicMock()
         mock_entry2.cinstr = mock_cinstr2
 
@@ -489,9 +490,7 @@ class TestSearchCinstrsBack:
         assert result == "var2"
 
     def test_found_cinstr_at_start_index(self):
-        mock_cinstr = MagicMock(spec=cinst.CLoad)
-        mock_cinstr.register = "r1"
-        mock_cinstr.var_name = "var1"
+        mock_cinstr = _fresh_mock(_CLoad, register="r1", var_name="var1")
         mock_entry = MagicMock()
         mock_entry.cinstr = mock_cinstr
 
@@ -501,9 +500,7 @@ class TestSearchCinstrsBack:
         assert result == "var1"
 
     def test_not_found_returns_empty_string(self):
-        mock_cinstr = MagicMock(spec=cinst.CLoad)
-        mock_cinstr.register = "r1"
-        mock_cinstr.var_name = "var1"
+        mock_cinstr = _fresh_mock(_CLoad, register="r1", var_name="var1")
         mock_entry = MagicMock()
         mock_entry.cinstr = mock_cinstr
 
@@ -530,12 +527,48 @@ class TestSearchCinstrsBack:
             search_cinstrs_back(cinstrs_map, -1, "r1")
 
     def test_index_out_of_bounds_too_large(self):
-        mock_cinstr = MagicMock(spec=cinst.CLoad)
-        mock_cinstr.register = "r1"
-        mock_cinstr.var_name = "var1"
+        mock_cinstr = _fresh_mock(_CLoad, register="r1", var_name="var1")
         mock_entry = MagicMock()
         mock_entry.cinstr = mock_cinstr
 
         cinstrs_map = [mock_entry]
         with pytest.raises(IndexError, match="Index 2 is out of bounds for cinstrs_map"):
             search_cinstrs_back(cinstrs_map, 2, "r1")
+
+
+class TestIndexCloadsByRegister:
+    """@brief Tests for index_cloads_by_register and the indexed search_cinstrs_back path."""
+
+    @staticmethod
+    def _build_map():
+        cinstrs = [
+            _fresh_mock(_CLoad, register="r1", var_name="var1"),
+            _fresh_mock(_BLoad, register="r2", var_name="var2"),
+            _fresh_mock(_CLoad, register="r2", var_name="var3"),
+            _fresh_mock(_CLoad, register="r1", var_name="var4"),
+        ]
+        return [MagicMock(cinstr=cinstr) for cinstr in cinstrs]
+
+    def test_index_cloads_by_register(self):
+        """@brief Test that only CLoads are indexed, by register in map order."""
+        assert index_cloads_by_register(self._build_map()) == {"r1": [0, 3], "r2": [2]}
+
+    @pytest.mark.parametrize(
+        "idx,reg_name,expected",
+        [(0, "r1", "var1"), (2, "r1", "var1"), (3, "r1", "var4"), (1, "r2", ""), (3, "r2", "var3"), (3, "r3", "")],
+    )
+    def test_search_cinstrs_back_indexed(self, idx, reg_name, expected):
+        """@brief Test that the indexed backward search matches the linear scan."""
+        cinstrs_map = self._build_map()
+        cload_index = index_cloads_by_register(cinstrs_map)
+
+        assert search_cinstrs_back(cinstrs_map, idx, reg_name, cload_index) == expected
+        assert search_cinstrs_back(cinstrs_map, idx, reg_name) == expected
+
+    def test_search_cinstrs_back_indexed_reads_current_var_name(self):
+        """@brief Test that variable names renamed after indexing are returned."""
+        cinstrs_map = self._build_map()
+        cload_index = index_cloads_by_register(cinstrs_map)
+        cinstrs_map[3].cinstr.var_name = "renamed"
+
+        assert search_cinstrs_back(cinstrs_map, 3, "r1", cload_index) == "renamed"
@@ -8,11 +8,14 @@
 @brief Unit tests for the variable discovery module.
 """
 
-import unittest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 from assembler.common.config import GlobalConfig
+from assembler.memory_model.variable import Variable
+from linker.instructions import cinst, minst
+from linker.steps import variable_discovery
 from linker.steps.variable_discovery import (
     check_unused_variables,
     discover_variables,
@@ -20,325 +23,327 @@ from linker.steps.variable_discovery import (
     scan_variables,
 )
 
+# The mocks in this module are deliberately un-spec'd: the code under test only reads
+# plain attributes and dispatches through the (swapped) isinstance. Should a spec ever
+# be needed, use create_autospec(cls, instance=True) as in test_program_linker_utils.py.
+
+
+@pytest.fixture(autouse=True)
+def _reset_global_config(monkeypatch):
+    """@brief Starts every test from the default hasHBM and restores the previous value afterwards."""
+    monkeypatch.setattr(GlobalConfig, "hasHBM", True)
+
+
+# Names of the instruction classes that reference a variable, per instruction module
+_VAR_TYPE_NAMES = {
+    "minst": ("MLoad", "MStore"),
+    "cinst": ("BLoad", "CLoad", "BOnes", "NLoad", "CStore"),
+}
+
+
+def _fake_instr(var_name=None):
+    """@brief Attribute-only instruction stand-in exposing var_name and to_line()."""
+    return SimpleNamespace(var_name=var_name, to_line=lambda: f"instr {var_name}")
+
+
+def _never_instance(obj, cls):
+    """@brief isinstance replacement that rejects every object."""
+    return False
+
+
+# Instruction stand-ins shared by all tests; they are only read, never modified.
+# MInstructions grouped in a dictionary
+_M_INSTRS = {
+    "load": _fake_instr("var1"),
+    "store": _fake_instr("var2"),
+    "other": _fake_instr(),  # MInstruction that's neither MLoad nor MStore
+}
+
+# CInstructions grouped in a dictionary
+_C_INSTRS = {
+    "bload": _fake_instr("var3"),
+    "cload": _fake_instr("var4"),
+    "bones": _fake_instr("var5"),
+    "nload": _fake_instr("var6"),
+    "cstore": _fake_instr("var7"),
+    "other": _fake_instr(),  # CInstruction that's none of the above
+}
+
+
+def _create_is_instance_mock(mock_minst_class=None, mock_cinst_class=None, mock_minst=None, mock_cinst=None):
+    """@brief Create a mock for isinstance that handles tuples of classes."""
+    # Map each (mocked) class to a predicate on the object, built once per mock
+    class_checks = {}
+
+    # Only add cinst-related checks if mock_cinst is not None
+    if mock_cinst is not None and mock_cinst_class is not None:
+        class_checks.update(
+            {
+                mock_cinst_class: lambda obj: any(obj is instr for instr in _C_INSTRS.values()),
+                mock_cinst.BLoad: lambda obj: obj is _C_INSTRS["bload"],
+                mock_cinst.CLoad: lambda obj: obj is _C_INSTRS["cload"],
+                mock_cinst.BOnes: lambda obj: obj is _C_INSTRS["bones"],
+                mock_cinst.NLoad: lambda obj: obj is _C_INSTRS["nload"],
+                mock_cinst.CStore: lambda obj: obj is _C_INSTRS["cstore"],
+            }
+        )
 
-class TestVariableDiscovery(unittest.TestCase):
-    """@brief Tests for the variable discovery functions."""
-
-    def setUp(self):
-        """@brief Set up test fixtures."""
-        # Group MInstructions in a dictionary
-        self.m_instrs = {
-            "load": MagicMock(var_name="var1"),
-            "store": MagicMock(var_name="var2"),
-            "other": MagicMock(),  # MInstruction that's neither MLoad nor MStore
-        }
-
-        # Group CInstructions in a dictionary
-        self.c_instrs = {
-            "bload": MagicMock(var_name="var3"),
-            "cload": MagicMock(var_name="var4"),
-            "bones": MagicMock(var_name="var5"),
-            "nload": MagicMock(var_name="var6"),
-            "cstore": MagicMock(var_name="var7"),
-            "other": MagicMock(),  # CInstruction that's none of the above
-        }
-
-    def _create_is_instance_mock(
-        self,
-        mock_minst_class=None,
-        mock_cinst_class=None,
-        mock_minst=None,
-        mock_cinst=None,
+    # Only add minst-related checks if mock_minst is not None
+    if mock_minst is not None and mock_minst_class is not None:
+        class_checks.update(
+            {
+                mock_minst_class: lambda obj: any(obj is instr for instr in _M_INSTRS.values()),
+                mock_minst.MLoad: lambda obj: obj is _M_INSTRS["load"],
+                mock_minst.MStore: lambda obj: obj is _M_INSTRS["store"],
+            }
+        )
+
+    # Improved mock for isinstance that handles tuples of classes
+    def mock_isinstance(obj, cls):
+        # Handle tuple case first
+        if isinstance(cls, tuple):
+            return any(mock_isinstance(obj, c) for c in cls)
+
+        # Check if cls is in our mapping and return the result of its check function
+        check = class_checks.get(cls)
+        return check is not None and check(obj)
+
+    return mock_isinstance
+
+
+@pytest.fixture(name="patch_discovery")
+def fixture_patch_discovery(monkeypatch):
+    """
+    @brief Returns a function that patches Variable.validateName, the instruction base class and the
+    variable-referencing types seen by variable_discovery, as well as the isinstance it calls.
+
+    The function takes the name of the instruction module whose types are mocked ("minst" or "cinst")
+    and the name of the instruction base class to patch ("MInstruction" or "CInstruction"). It returns
+    the tuple (mock_validate, mock_module), where mock_module holds the mocked classes.
+    """
+
+    def _patch(module_name, base_class_name):
+        mock_validate = MagicMock()
+        mock_base_class = MagicMock()
+        mock_module = SimpleNamespace(**{class_name: MagicMock() for class_name in _VAR_TYPE_NAMES[module_name]})
+        monkeypatch.setattr(Variable, "validateName", mock_validate)
+        monkeypatch.setattr(variable_discovery, base_class_name, mock_base_class)
+        monkeypatch.setattr(variable_discovery, f"_{module_name.upper()}_VAR_TYPES", frozenset(vars(mock_module).values()))
+        mock_isinstance = _create_is_instance_mock(**{f"mock_{module_name}_class": mock_base_class, f"mock_{module_name}": mock_module})
+        # Swap the isinstance builtin seen by the module under test
+        monkeypatch.setattr(variable_discovery, "isinstance", mock_isinstance, raising=False)
+        return mock_validate, mock_module
+
+    return _patch
+
+
+def test_discover_variables_valid(patch_discovery):
+    """@brief Test discovering variables from valid MInstructions.
+
+    @test Verifies that variables are correctly discovered from MLoad and MStore instructions
+    """
+    mock_validate, _ = patch_discovery("minst", "MInstruction")
+    # Configure validateName to return True
+    mock_validate.return_value = True
+
+    # Test with a list containing both MLoad and MStore
+    minstrs = [_M_INSTRS["load"], _M_INSTRS["store"], _M_INSTRS["other"]]
+
+    result = list(discover_variables(minstrs))
+
+    # Verify results
+    assert result == ["var1", "var2"]
+    mock_validate.assert_any_call("var1")
+    mock_validate.assert_any_call("var2")
+
+
+def test_discover_variables_real_instructions():
+    """@brief Test discovering variables from unpatched MInstruction instances.
+
+    @test Verifies that exact MLoad/MStore types are discovered and other MInstructions are skipped
+    """
+    minstrs = [
+        minst.MLoad(["0", "mload", "1", "var1"]),
+        minst.MStore(["1", "mstore", "var2", "2"]),
+        minst.MSyncc(["2", "msyncc", "0"]),
+    ]
+
+    result = list(discover_variables(minstrs))
+
+    assert result == ["var1", "var2"]
+
+
+def test_discover_variables_empty_list():
+    """@brief Test discovering variables from an empty list of MInstructions.
+
+    @test Verifies that an empty list is returned when no instructions are provided
+    """
+    # No need to patch isinstance for an empty list
+    result = list(discover_variables([]))
+
+    # Verify results - should be an empty list
+    assert result == []
+
+
+def test_discover_variables_invalid_type(monkeypatch):
+    """@brief Test discovering variables with invalid types in the list.
+
+    @test Verifies that a TypeError is raised when an invalid object is in the list
+    """
+    # Setup mock to fail the isinstance check
+    monkeypatch.setattr(variable_discovery, "isinstance", _never_instance, raising=False)
+
+    # Call the function with a list containing an invalid type
+    with pytest.raises(TypeError, match="not a valid MInstruction"):
+        next(discover_variables([object()]))
+
+
+def test_discover_variables_hbm_invalid(patch_discovery):
+    """@brief Test discovering variables with an invalid variable name.
+
+    @test Verifies that a RuntimeError is raised when a variable name is invalid
+    """
+    mock_validate, _ = patch_discovery("minst", "MInstruction")
+    # Configure validateName to return False
+    mock_validate.return_value = False
+
+    with pytest.raises(RuntimeError, match="Invalid Variable name"):
+        next(discover_variables([_M_INSTRS["load"]]))
+
+
+def test_discover_variables_spad_valid(patch_discovery):
+    """@brief Test discovering variables from valid CInstructions.
+
+    @test Verifies that variables are correctly discovered from all relevant CInstruction types
+    """
+    mock_validate, _ = patch_discovery("cinst", "CInstruction")
+    # Configure validateName to return True
+    mock_validate.return_value = True
+
+    # Test with a list containing all types of CInstructions
+    cinstrs = [
+        _C_INSTRS["bload"],
+        _C_INSTRS["cload"],
+        _C_INSTRS["bones"],
+        _C_INSTRS["nload"],
+        _C_INSTRS["cstore"],
+        _C_INSTRS["other"],
+    ]
+
+    result = list(discover_variables_spad(cinstrs))
+
+    # Verify results
+    assert result == ["var3", "var4", "var5", "var6", "var7"]
+    for var_name in result:
+        mock_validate.assert_any_call(var_name)
+
+
+def test_discover_variables_spad_real_instructions():
+    """@brief Test discovering variables from unpatched CInstruction instances.
+
+    @test Verifies that exact BLoad/CLoad/BOnes/NLoad/CStore types and their subclasses are discovered and other
+          CInstructions are skipped
+    """
+    cload_subclass = type("_CLoadSubclass", (cinst.CLoad,), {})
+    cinstrs = [
+        cinst.BLoad(["0", "bload", "0", "var1", "0"]),
+        cinst.CLoad(["1", "cload", "r0", "var2"]),
+        cinst.BOnes(["2", "bones", "var3", "0"]),
+        cinst.NLoad(["3", "nload", "0", "var4"]),
+        cinst.CStore(["4", "cstore", "var5"]),
+        cinst.CNop(["5", "cnop", "0"]),
+        cload_subclass(["6", "cload", "r1", "var6"]),
+    ]
+
+    result = list(discover_variables_spad(cinstrs))
+
+    assert result == ["var1", "var2", "var3", "var4", "var5", "var6"]
+
+
+def test_discover_variables_spad_empty_list():
+    """@brief Test discovering variables from an empty list of CInstructions.
+
+    @test Verifies that an empty list is returned when no instructions are provided
+    """
+    # Call the function with an empty list
+    result = list(discover_variables_spad([]))
+
+    # Verify results - should be an empty list
+    assert result == []
+
+
+def test_discover_variables_spad_invalid_type(monkeypatch):
+    """@brief Test discovering variables with invalid types in the list.
+
+    @test Verifies that a TypeError is raised when an invalid object is in the list
+    """
+    # Setup mock to fail the isinstance check
+    monkeypatch.setattr(variable_discovery, "isinstance", _never_instance, raising=False)
+
+    # Call the function with a list containing an invalid type
+    with pytest.raises(TypeError, match="not a valid CInstruction"):
+        next(discover_variables_spad([object()]))
+
+
+def test_discover_variables_spad_invalid_variable_name(patch_discovery):
+    """@brief Test discovering variables with an invalid variable name.
+
+    @test Verifies that a RuntimeError is raised when a variable name is invalid
+    """
+    mock_validate, _ = patch_discovery("cinst", "CInstruction")
+    # Configure validateName to return False
+    mock_validate.return_value = False
+
+    with pytest.raises(RuntimeError, match="Invalid Variable name"):
+        next(discover_variables_spad([_C_INSTRS["bload"]]))
+
+
+def test_check_unused_variables():
+    """
+    @brief Test check_unused_variables function
+    """
+    # Arrange
+    mock_mem_model = MagicMock()
+    mock_mem_model.mem_info_vars = {"var1": MagicMock(), "var2": MagicMock()}
+    mock_mem_model.variables = {"var1"}
+    mock_mem_model.mem_info_meta = {}
+
+    # Act & Assert
+    with pytest.raises(RuntimeError):
+        check_unused_variables(mock_mem_model)
+
+
+@pytest.fixture(name="scan_mocks")
+def fixture_scan_mocks():
+    """@brief Returns fresh (linker, memory model, verbose stream) mocks for scan_variables."""
+    return MagicMock(), MagicMock(), MagicMock()
+
+
+@pytest.mark.parametrize("has_hbm", [True, False])
+def test_scan_variables(monkeypatch, scan_mocks, has_hbm):
+    """
+    @brief Test scan_variables function with and without HBM
+
+    @test Verifies that scan_variables correctly processes input files and updates the memory model
+          in both HBM and non-HBM modes
+    """
+    # Arrange
+    monkeypatch.setattr(GlobalConfig, "hasHBM", has_hbm)
+    mock_linker, mock_mem_model, mock_verbose = scan_mocks
+    input_files = [MagicMock()]
+
+    # Act
+    with (
+        patch(
+            "linker.steps.variable_discovery.discover_variables",
+            return_value=["var1", "var2"],
+        ),
+        patch(
+            "linker.steps.variable_discovery.discover_variables_spad",
+            return_value=["var1", "var2"],
+        ),
     ):
-        """@brief Create a mock for isinstance that handles tuples of classes."""
-        cinstrs = [
-            self.c_instrs["bload"],
-            self.c_instrs["cload"],
-            self.c_instrs["bones"],
-            self.c_instrs["nload"],
-            self.c_instrs["cstore"],
-            self.c_instrs["other"],
-        ]
-
-        minstrs = [
-            self.m_instrs["load"],
-            self.m_instrs["store"],
-            self.m_instrs["other"],
-        ]
-
-        # Improved mock for isinstance that handles tuples of classes
-        def mock_isinstance(obj, cls):
-            # Handle tuple case first
-            if isinstance(cls, tuple):
-                return any(mock_isinstance(obj, c) for c in cls)
-
-            # Use a dictionary to map class types to their respective checks
-            class_checks = {}
-
-            # Only add cinst-related checks if mock_cinst is not None
-            if mock_cinst is not None and mock_cinst_class is not None:
-                class_checks.update(
-                    {
-                        mock_cinst_class: lambda: obj in cinstrs,
-                        mock_cinst.BLoad: lambda: obj is self.c_instrs["bload"],
-                        mock_cinst.CLoad: lambda: obj is self.c_instrs["cload"],
-                        mock_cinst.BOnes: lambda: obj is self.c_instrs["bones"],
-                        mock_cinst.NLoad: lambda: obj is self.c_instrs["nload"],
-                        mock_cinst.CStore: lambda: obj is self.c_instrs["cstore"],
-                    }
-                )
-
-            # Only add minst-related checks if mock_minst is not None
-            if mock_minst is not None and mock_minst_class is not None:
-                class_checks.update(
-                    {
-                        mock_minst_class: lambda: obj in minstrs,
-                        mock_minst.MLoad: lambda: obj is self.m_instrs["load"],
-                        mock_minst.MStore: lambda: obj is self.m_instrs["store"],
-                    }
-                )
-
-            # Check if cls is in our mapping and return the result of its check function
-            return class_checks.get(cls, lambda: False)()
-
-        return mock_isinstance
-
-    @patch("linker.steps.variable_discovery.minst")
-    @patch("linker.steps.variable_discovery.MInstruction")
-    @patch("assembler.memory_model.variable.Variable.validateName")
-    def test_discover_variables_valid(self, mock_validate, mock_minst_class, mock_minst):
-        """@brief Test discovering variables from valid MInstructions.
-
-        @test Verifies that variables are correctly discovered from MLoad and MStore instructions
-        """
-        # Setup mocks
-        mock_minst.MLoad = MagicMock()
-        mock_minst.MStore = MagicMock()
-
-        # Test with a list containing both MLoad and MStore
-        minstrs = [
-            self.m_instrs["load"],
-            self.m_instrs["store"],
-            self.m_instrs["other"],
-        ]
-
-        # Get the mock_isinstance function
-        mock_isinstance = self._create_is_instance_mock(mock_minst_class=mock_minst_class, mock_minst=mock_minst)
-
-        # Patch the isinstance calls at the module level
-        with patch("linker.steps.variable_discovery.isinstance", side_effect=mock_isinstance):
-            # Configure validateName to return True
-            mock_validate.return_value = True
-
-            # Call the function
-            result = list(discover_variables(minstrs))
-
-            # Verify results
-            self.assertEqual(result, ["var1", "var2"])
-            mock_validate.assert_any_call("var1")
-            mock_validate.assert_any_call("var2")
-
-    def test_discover_variables_empty_list(self):
-        """@brief Test discovering variables from an empty list of MInstructions.
-
-        @test Verifies that an empty list is returned when no instructions are provided
-        """
-        # No need to patch isinstance for an empty list
-        result = list(discover_variables([]))
-
-        # Verify results - should be an empty list
-        self.assertEqual(result, [])
-
-    def test_discover_variables_invalid_type(self):
-        """@brief Test discovering variables with invalid types in the list.
-
-        @test Verifies that a TypeError is raised when an invalid object is in the list
-        """
-        # Setup mock to fail the isinstance check
-        invalid_obj = MagicMock()
-
-        with patch("linker.steps.variable_discovery.isinstance", return_value=False):
-            # Call the function with a list containing an invalid type
-            with self.assertRaises(TypeError) as context:
-                list(discover_variables([invalid_obj]))
-
-            # Verify the error message
-            self.assertIn("not a valid MInstruction", str(context.exception))
-
-    @patch("linker.steps.variable_discovery.minst")
-    @patch("linker.steps.variable_discovery.MInstruction")
-    @patch("assembler.memory_model.variable.Variable.validateName")
-    def test_discover_variables_hbm_invalid(self, mock_validate, mock_minst_class, mock_minst):
-        """@brief Test discovering variables with an invalid variable name.
-
-        @test Verifies that a RuntimeError is raised when a variable name is invalid
-        """
-        # Setup mocks
-        mock_minst.MLoad = MagicMock()
-
-        # Configure validateName to return True
-        mock_validate.return_value = False
-
-        # Get the mock_isinstance function
-        mock_isinstance = self._create_is_instance_mock(mock_minst_class=mock_minst_class, mock_minst=mock_minst)
-
-        # Patch the isinstance calls at the module level
-        with patch("linker.steps.variable_discovery.isinstance", side_effect=mock_isinstance):
-            # Call the function
-            with self.assertRaises(RuntimeError) as context:
-                list(discover_variables([self.m_instrs["load"]]))
-
-            # Verify the error message
-            self.assertIn("Invalid Variable name", str(context.exception))
-
-    @patch("linker.steps.variable_discovery.cinst")
-    @patch("linker.steps.variable_discovery.CInstruction")
-    @patch("assembler.memory_model.variable.Variable.validateName")
-    def test_discover_variables_spad_valid(self, mock_validate, mock_cinst_class, mock_cinst):
-        """@brief Test discovering variables from valid CInstructions.
-
-        @test Verifies that variables are correctly discovered from all relevant CInstruction types
-        """
-        # Setup mocks
-        mock_cinst.BLoad = MagicMock()
-        mock_cinst.CLoad = MagicMock()
-        mock_cinst.BOnes = MagicMock()
-        mock_cinst.NLoad = MagicMock()
-        mock_cinst.CStore = MagicMock()
-
-        # Configure validateName to return True
-        mock_validate.return_value = True
-
-        # Test with a list containing all types of CInstructions
-        cinstrs = [
-            self.c_instrs["bload"],
-            self.c_instrs["cload"],
-            self.c_instrs["bones"],
-            self.c_instrs["nload"],
-            self.c_instrs["cstore"],
-            self.c_instrs["other"],
-        ]
-
-        # Get the mock_isinstance function
-        mock_isinstance = self._create_is_instance_mock(mock_cinst_class=mock_cinst_class, mock_cinst=mock_cinst)
-
-        # Patch the isinstance calls at the module level
-        with patch("linker.steps.variable_discovery.isinstance", side_effect=mock_isinstance):
-            # Call the function
-            result = list(discover_variables_spad(cinstrs))
-
-            # Verify results
-            self.assertEqual(result, ["var3", "var4", "var5", "var6", "var7"])
-            mock_validate.assert_any_call("var3")
-            mock_validate.assert_any_call("var4")
-            mock_validate.assert_any_call("var5")
-            mock_validate.assert_any_call("var6")
-            mock_validate.assert_any_call("var7")
-
-    def test_discover_variables_spad_empty_list(self):
-        """@brief Test discovering variables from an empty list of CInstructions.
-
-        @test Verifies that an empty list is returned when no instructions are provided
-        """
-        # Call the function with an empty list
-        result = list(discover_variables_spad([]))
-
-        # Verify results - should be an empty list
-        self.assertEqual(result, [])
-
-    def test_discover_variables_spad_invalid_type(self):
-        """@brief Test discovering variables with invalid types in the list.
-
-        @test Verifies that a TypeError is raised when an invalid object is in the list
-        """
-        # Setup mock
-        invalid_obj = MagicMock()
-
-        with patch("linker.steps.variable_discovery.isinstance", return_value=False):
-            # Call the function with a list containing an invalid type
-            with self.assertRaises(TypeError) as context:
-                list(discover_variables_spad([invalid_obj]))
-
-            # Verify the error message
-            self.assertIn("not a valid CInstruction", str(context.exception))
-
-    @patch("linker.steps.variable_discovery.cinst")
-    @patch("linker.steps.variable_discovery.CInstruction")
-    @patch("assembler.memory_model.variable.Variable.validateName")
-    def test_discover_variables_spad_invalid_variable_name(self, mock_validate, mock_cinst_class, mock_cinst):
-        """@brief Test discovering variables with an invalid variable name.
-
-        @test Verifies that a RuntimeError is raised when a variable name is invalid
-        """
-        # Setup mocks
-        mock_cinst.BLoad = MagicMock()
-
-        # Configure validateName to return True
-        mock_validate.return_value = False
-
-        # Get the mock_isinstance function
-        mock_isinstance = self._create_is_instance_mock(mock_cinst_class=mock_cinst_class, mock_cinst=mock_cinst)
-
-        # Patch the isinstance calls at the module level
-        with patch("linker.steps.variable_discovery.isinstance", side_effect=mock_isinstance):
-            # Call the function
-            with self.assertRaises(RuntimeError) as context:
-                list(discover_variables_spad([self.c_instrs["bload"]]))
-
-            # Verify the error message
-            self.assertIn("Invalid Variable name", str(context.exception))
-
-    def test_scan_variables(self):
-        """
-        @brief Test scan_variables function with and without HBM
-
-        @test Verifies that scan_variables correctly processes input files and updates the memory model
-              in both HBM and non-HBM modes
-        """
-        # Create proper mock KernelInfo objects instead of namedtuples
-        mock_kernel_info = MagicMock()
-        input_files = [mock_kernel_info]
-
-        # Test with both True and False for hasHBM
-        for has_hbm in [True, False]:
-            with self.subTest(has_hbm=has_hbm):
-                # Arrange
-                GlobalConfig.hasHBM = has_hbm
-                mock_mem_model = MagicMock()
-                mock_verbose = MagicMock()
-                mock_linker = MagicMock()
-
-                # Act
-                with (
-                    patch(
-                        "linker.steps.variable_discovery.discover_variables",
-                        return_value=["var1", "var2"],
-                    ),
-                    patch(
-                        "linker.steps.variable_discovery.discover_variables_spad",
-                        return_value=["var1", "var2"],
-                    ),
-                ):
-                    scan_variables(mock_linker, input_files, mock_mem_model, mock_verbose)
-
-                # Assert
-                self.assertEqual(mock_mem_model.add_variable.call_count, 2)
-
-    def test_check_unused_variables(self):
-        """
-        @brief Test check_unused_variables function
-        """
-        # Arrange
-        GlobalConfig.hasHBM = True
-        mock_mem_model = MagicMock()
-        mock_mem_model.mem_info_vars = {"var1": MagicMock(), "var2": MagicMock()}
-        mock_mem_model.variables = {"var1"}
-        mock_mem_model.mem_info_meta = {}
-
-        # Act & Assert
-        with pytest.raises(RuntimeError):
-            check_unused_variables(mock_mem_model)
-
-
-if __name__ == "__main__":
-    unittest.main()
+        scan_variables(mock_linker, input_files, mock_mem_model, mock_verbose)
+
+    # Assert
+    assert mock_mem_model.add_variable.call_count == 2
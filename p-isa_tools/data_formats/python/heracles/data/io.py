@@ -5,10 +5,12 @@
 # TODO: create also C++ variants of below; given how simple and stable these functions should be just in replicated form, not shared code
 
 import json
-import sys
+import warnings
 
 import heracles.proto.data_pb2 as hpd
 from google.protobuf.json_format import MessageToDict
+from google.protobuf.message import Message
+from heracles.util.io import parse_from_file
 
 # load & store functions
 # ===============================
@@ -29,14 +31,12 @@ def parse_manifest(filename: str) -> dict:
 
             if not found_first_field:
                 continue
-            cur_line_split = cur_line.split("=")
-            if len(cur_line_split) != 2:
-                print(
-                    f"Warning: ignoring incorrect format in line {linenum}",
-                    file=sys.stderr,
-                )
+            # exactly one "=" per key/value line
+            key, sep, value = cur_line.partition("=")
+            if not sep or "=" in value:
+                warnings.warn(f"ignoring incorrect format in line {linenum}", stacklevel=2)
                 continue
-            manifest[cur_field][cur_line_split[0]] = cur_line_split[1]
+            manifest[cur_field][key] = value
 
         if not found_first_field:
             raise Exception(f"Incorrect manifest file format: {filename}")
@@ -54,20 +54,14 @@ def generate_manifest(filename: str, manifest: dict):
 
 # re-check
 def store_hec_context_json(filename: str, context: hpd.FHEContext):
-    print(
-        "Warning: Dumping FHE Context data trace to json can take a long time",
-        file=sys.stderr,
-    )
+    warnings.warn("Dumping FHE Context data trace to json can take a long time", RuntimeWarning, stacklevel=2)
     with open(filename, "w") as fp:
         json.dump(MessageToDict(context), fp)
 
 
 # re-check
 def store_testvector_json(filename: str, testvector: hpd.TestVector):
-    print(
-        "Warning: Dumping TestVector data trace to json can take a long time",
-        file=sys.stderr,
-    )
+    warnings.warn("Dumping TestVector data trace to json can take a long time", RuntimeWarning, stacklevel=2)
     with open(filename, "w") as fp:
         json.dump(MessageToDict(testvector), fp)
 
@@ -76,38 +70,58 @@ def load_hec_context_from_manifest(manifest: dict) -> hpd.FHEContext:
     context_base_fn = manifest["context"]["main"]
     context_pb = hpd.FHEContext()
 
-    with open(context_base_fn, "rb") as fp:
-        context_pb.ParseFromString(fp.read())
+    parse_from_file(context_pb, context_base_fn)
 
     if "rotation_keys" in manifest:
+        # parse each key directly into its map entry rather than into a temporary that is then copied over
+        rotation_keys = context_pb.ckks_info.keys.rotation_keys
         for ge, gk_fn in manifest["rotation_keys"].items():
-            gk_pb = hpd.KeySwitch()
-            with open(gk_fn, "rb") as fp:
-                gk_pb.ParseFromString(fp.read())
-            context_pb.ckks_info.keys.rotation_keys[int(ge)].CopyFrom(gk_pb)
+            parse_from_file(rotation_keys[int(ge)], gk_fn)
 
     return context_pb
 
 
+def _copy_fields_except(dst_pb: Message, src_pb: Message, excluded: str):
+    # copy all set fields but `excluded` from src_pb into the (empty) dst_pb
+    for field, value in src_pb.ListFields():
+        if field.name == excluded:
+            continue
+        if isinstance(value, (bool, int, float, str, bytes)):
+            setattr(dst_pb, field.name, value)
+        else:
+            # sub-message, repeated or map field; merging into an empty field copies it
+            getattr(dst_pb, field.name).MergeFrom(value)
+
+
 def store_hec_context(filename: str, context_pb: hpd.FHEContext) -> dict:
     hec_context_manifest: dict = {"context": {}}
-    tmp_context = hpd.FHEContext()
-    tmp_context.CopyFrom(context_pb)
+    main_fn = f"{filename}_hec_context_part_0"
 
-    if tmp_context.ByteSize() > 1 << 30:
+    if context_pb.ByteSize() > 1 << 30:
         hec_context_manifest["rotation_keys"] = {}
-        for gkct, (ge, gk_pb) in enumerate(tmp_context.ckks_info.keys.rotation_keys.items()):
+        for gkct, (ge, gk_pb) in enumerate(context_pb.ckks_info.keys.rotation_keys.items()):
             parts_fn = f"{filename}_hec_context_part_{gkct + 1}"
             hec_context_manifest["rotation_keys"][ge] = parts_fn
             with open(parts_fn, "wb") as fp:
                 fp.write(gk_pb.SerializeToString())
-        tmp_context.ckks_info.keys.ClearField("rotation_keys")
 
-    main_fn = f"{filename}_hec_context_part_0"
-    hec_context_manifest["context"]["main"] = main_fn
-    with open(main_fn, "wb") as fp:
-        fp.write(tmp_context.SerializeToString())
+        # write the main part from a context assembled without the rotation keys rather than from a full (multi-GB)
+        # copy of context_pb, which is left untouched
+        main_pb = hpd.FHEContext()
+        _copy_fields_except(main_pb, context_pb, "ckks_info")
+        if context_pb.HasField("ckks_info"):
+            main_pb.ckks_info.SetInParent()
+            _copy_fields_except(main_pb.ckks_info, context_pb.ckks_info, "keys")
+            if context_pb.ckks_info.HasField("keys"):
+                main_pb.ckks_info.keys.SetInParent()
+                _copy_fields_except(main_pb.ckks_info.keys, context_pb.ckks_info.keys, "rotation_keys")
+        with open(main_fn, "wb") as fp:
+            fp.write(main_pb.SerializeToString())
+    else:
+        with open(main_fn, "wb") as fp:
+            fp.write(context_pb.SerializeToString())
 
+    hec_context_manifest["context"]["main"] = main_fn
     return hec_context_manifest
 
 
@@ -116,15 +130,11 @@ def load_testvector_from_manifest(manifest: dict) -> hpd.TestVector:
     testvector_pb = hpd.TestVector()
     if len(manifest["testvector"]) > 1:
         for sym, parts_fn in manifest["testvector"].items():
-            data = hpd.Data()
-            with open(parts_fn, "rb") as fp:
-                data.ParseFromString(fp.read())
-            testvector_pb.sym_data_map[sym].CopyFrom(data)
+            parse_from_file(testvector_pb.sym_data_map[sym], parts_fn)
     # whole
     else:
         full_fn = manifest["testvector"]["full"]
-        with open(full_fn, "rb") as fp:
-            testvector_pb.ParseFromString(fp.read())
+        parse_from_file(testvector_pb, full_fn)
 
     return testvector_pb
 
@@ -8,7 +8,6 @@ import heracles.proto.common_pb2 as hpc
 import heracles.proto.data_pb2 as hpd
 import heracles.proto.fhe_trace_pb2 as hpf
 import heracles.util.data as hud
-import regex_spm
 
 # SYMBOL MAPPING
 # =====================
@@ -68,65 +67,86 @@ def map_mem_sym(context: hpd.FHEContext, instr: hpf.Instruction, sym_obj_name: s
     return mapped_sym_obj_name
 
 
-def map_immediate_sym(context: hpd.FHEContext, instr: hpf.Instruction, sym_imm_name: str) -> str:
+# all immediate symbol forms handled by `map_immediate_sym` in a single alternation: one (full)match per lookup,
+# dispatch is then on the name of the outermost matching group
+immediate_sym_pattern = re.compile(
+    r"(?P<mont_adj>(?P<mont_adj_src>c|d)_mont_adjusting_factor_(?P<mont_adj_rns>\d+))"
+    r"|(?P<it>it)"
+    r"|(?P<t_inv_p>t_inverse_mod_p_(?P<t_inv_p_idx>\d+))"
+    r"|(?P<iq>iq_(?P<iq_idx>\d+))"
+    r"|(?P<t>t_(?P<t_idx>\d+))"
+    r"|(?P<pinv_q>pinv_q_(?P<pinv_q_idx>\d+))"
+    r"|(?P<corr_inv>corr-inv-target-corr-q-scalar_(?P<corr_inv_idx>\d+))"
+    r"|(?P<const_reduced>const-reduced_(?P<const_reduced_idx>\d+))"
+    r"|(?P<bcm>BaseChangeMatrix_(?P<bcm_idx>\d+_\d+))"
+    r"|(?P<ipp>InvPuncturedProd_(?P<ipp_idx>\d+))"
+)
+
+
+def map_immediate_sym(context: hpd.FHEContext, instr: hpf.Instruction, sym_imm_name: str) -> str:  # noqa: C901
     """
     Map potentially non-universal immediate symbols used in kernels with either a universal one
     or (e.g., for `add_corrected`) an actual numerical value
     """
     # TODO: Actual implementation in C++ & native code invocation here for same reasons as mentioned for `map_mem_sym`
 
-    if context.scheme == hpc.SCHEME_BGV:
-        bgv_info = context.bgv_info
-        key_rns_num = context.key_rns_num
-        # NOTE: we assume _all_ keys have same digit size!!
-        k = bgv_info.plaintext_specific[0].keys.relin_key.k
-    match regex_spm.fullmatch_in(sym_imm_name):
-        case r"^(c|d)_mont_adjusting_factor_(\d+)$" as m:
-            match m[1]:
+    # NOTE: context fields are read only in the cases needing them, most symbols are mapped from the name and instr alone
+    m = immediate_sym_pattern.fullmatch(sym_imm_name)
+    if m is None:
+        # not an immediate symbol needing mapping
+        return sym_imm_name
+    match m.lastgroup:
+        case "mont_adj":
+            match m["mont_adj_src"]:
                 case "c":
                     adj_factor = int(instr.args.params["adj_factor1"].value)
                 case "d":
                     adj_factor = int(instr.args.params["adj_factor2"].value)
                 case _:
                     raise ValueError(f"Invalid immediate symbol name: {sym_imm_name}")
-            adj_factor = hud.convert_to_montgomery(adj_factor, context.q_i[int(m[2])])
+            adj_factor = hud.convert_to_montgomery(adj_factor, context.q_i[int(m["mont_adj_rns"])])
             mapped_sym_imm_name = f"{adj_factor}"
 
-        case r"^it$" as m:
+        case "it":
             mapped_sym_imm_name = (
                 f"neg_inv_t_{instr.plaintext_index}_mod_q_i_{instr.args.srcs[0].num_rns - 1}"  # in flattening we start with 0 ..
             )
 
-        case r"^t_inverse_mod_p_(\d+)$" as m:
+        case "t_inv_p":
+            if context.scheme != hpc.SCHEME_BGV:
+                raise ValueError(f"Immediate symbol {sym_imm_name} is only supported for BGV")
+            # NOTE: we assume _all_ keys have same digit size!!
+            k = context.bgv_info.plaintext_specific[0].keys.relin_key.k
+            key_rns_num = context.key_rns_num
             mapped_sym_imm_name = (
-                f"neg_inv_t_{instr.plaintext_index}_mod_q_i_{key_rns_num - k + int(m[1])}"  # in flattening we start with 0 ..
+                f"neg_inv_t_{instr.plaintext_index}_mod_q_i_{key_rns_num - k + int(m['t_inv_p_idx'])}"  # in flattening we start with 0 ..
             )
 
-        case r"^iq_(\d+)$" as m:
-            mapped_sym_imm_name = f"inv_q_i_{instr.args.srcs[0].num_rns - 1}_mod_q_j_{m[1]}"  # in flattening we start with 0 ..
+        case "iq":
+            mapped_sym_imm_name = f"inv_q_i_{instr.args.srcs[0].num_rns - 1}_mod_q_j_{m['iq_idx']}"  # in flattening we start with 0 ..
 
-        case r"^t_(\d+)$" as m:
-            mapped_sym_imm_name = f"t_{instr.plaintext_index}_mod_q_i_{m[1]}"
+        case "t":
+            mapped_sym_imm_name = f"t_{instr.plaintext_index}_mod_q_i_{m['t_idx']}"
 
-        case r"^pinv_q_(\d+)$" as m:
-            mapped_sym_imm_name = f"inv_p_mod_q_i_{m[1]}"
+        case "pinv_q":
+            mapped_sym_imm_name = f"inv_p_mod_q_i_{m['pinv_q_idx']}"
 
-        case r"^corr-inv-target-corr-q-scalar_(\d+)$" as m:
-            mont_adj_factor = hud.convert_to_montgomery(int(instr.args.params["adj_factor1"].value), context.q_i[int(m[1])])
+        case "corr_inv":
+            mont_adj_factor = hud.convert_to_montgomery(int(instr.args.params["adj_factor1"].value), context.q_i[int(m["corr_inv_idx"])])
             mapped_sym_imm_name = f"{mont_adj_factor}"
 
-        case r"^const-reduced_(\d+)$" as m:
+        case "const_reduced":
             adj_factor = int(instr.args.params["adj_factor1"].value)
             if bool(instr.args.params["do_invert"].value):
-                adj_factor = pow(adj_factor, -1, context.q_i[int(m[1])])
-            mont_adj_factor = hud.convert_to_montgomery(adj_factor, context.q_i[int(m[1])])
+                adj_factor = pow(adj_factor, -1, context.q_i[int(m["const_reduced_idx"])])
+            mont_adj_factor = hud.convert_to_montgomery(adj_factor, context.q_i[int(m["const_reduced_idx"])])
             mapped_sym_imm_name = f"{mont_adj_factor}"
 
-        case r"^BaseChangeMatrix_(\d+_\d+)$" as m:
-            mapped_sym_imm_name = f"base_change_matrix_{instr.args.srcs[0].num_rns - 1}_{m[1]}"  # in flattening we start with 0 ..
+        case "bcm":
+            mapped_sym_imm_name = f"base_change_matrix_{instr.args.srcs[0].num_rns - 1}_{m['bcm_idx']}"  # in flattening we start with 0 ..
 
-        case r"^InvPuncturedProd_(\d+)$" as m:
-            mapped_sym_imm_name = f"inv_punctured_prod_{instr.args.srcs[0].num_rns - 1}_{m[1]}"  # in flattening we start with 0 ..
+        case "ipp":
+            mapped_sym_imm_name = f"inv_punctured_prod_{instr.args.srcs[0].num_rns - 1}_{m['ipp_idx']}"  # in flattening we start with 0 ..
 
         case _:
             mapped_sym_imm_name = sym_imm_name
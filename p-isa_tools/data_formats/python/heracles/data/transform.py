@@ -10,8 +10,10 @@ import functools as ft
 import math
 import operator as op
 
+import heracles.data.naming as hdn
 import heracles.proto.common_pb2 as hpc
 import heracles.proto.data_pb2 as hpd
+import heracles.proto.fhe_trace_pb2 as hpf
 import heracles.util.data as hud
 
 
@@ -25,9 +27,32 @@ def galois_elements_from_context(context: hpd.FHEContext) -> set:
             raise ValueError("Only BGV and CKKS schemes are supported.")
 
 
-def extract_metadata_polys(context: hpd.FHEContext) -> hpd.MetadataPolynomials:
+def galois_elements_from_trace(context: hpd.FHEContext, trace: hpf.Trace) -> set:
     """
-    Extract symbol/value map of all metadata polynomials as needed to build (after swizzling) memory images or DMA downloads
+    Galois elements actually referenced by the (rotation-type) instructions of a trace, see `map_twiddle_type`.
+    Passing them to `extract_metadata_polys` / `extract_metadata_twiddles` restricts the rotation-specific
+    metadata to what the trace needs instead of all rotation keys of the context
+    """
+    return {int(ge) for instr in trace.instructions if (ge := hdn.map_twiddle_type(context, instr)) != "default"}
+
+
+def _montgomery_pow_table(base: int, modulus: int, n: int) -> list[int]:
+    """
+    Powers base^j mod modulus for j in [0, n) in montgomery form. Built as a running product seeded with R mod modulus,
+    i.e., the montgomery form of base^0 = 1, so neither pow() nor convert_to_montgomery is needed per entry
+    """
+    acc = hud.montgomery_r % modulus
+    table = [acc] * n
+    for j in range(1, n):
+        acc = acc * base % modulus
+        table[j] = acc
+    return table
+
+
+def extract_metadata_polys(context: hpd.FHEContext, galois_elts: set | None = None) -> hpd.MetadataPolynomials:
+    """
+    Extract symbol/value map of all metadata polynomials as needed to build (after swizzling) memory images or DMA downloads.
+    Rotation-specific polynomials and keys are generated only for `galois_elts`, by default all galois elements of the context
     """
     N = context.N
     q_i = context.q_i
@@ -40,21 +65,23 @@ def extract_metadata_polys(context: hpd.FHEContext) -> hpd.MetadataPolynomials:
     meta_polys = hpd.MetadataPolynomials()
 
     # - galois_element-specific version for rotation
-    galois_elts = galois_elements_from_context(context)
+    if galois_elts is None:
+        galois_elts = galois_elements_from_context(context)
     for i in range(nQ):
         # TODO (eventually): refactor below to common naming functions
 
         # - powers of psi for negative wrapped convolusion
         #   - default version for ntt, mod-switch & relin
-        meta_polys.metadata.sym_poly_map[f"psi_default_{i}"].coeffs.extend(
-            hud.convert_to_montgomery(pow(psi[i], j, q_i[i]), q_i[i]) for j in range(N)
-        )
-        hud.poly_bit_reverse_inplace(meta_polys.metadata.sym_poly_map[f"psi_default_{i}"])
+        coeffs = _montgomery_pow_table(psi[i], q_i[i], N)
+        hud.bit_reverse_inplace(coeffs)
+        meta_polys.metadata.sym_poly_map[f"psi_default_{i}"].coeffs.extend(coeffs)
 
-        meta_polys.metadata.sym_poly_map[f"ipsi_default_{i}"].coeffs.extend(
-            hud.convert_to_montgomery(pow(psi_inv[i], j, q_i[i]), q_i[i]) for j in range(N)
-        )
-        hud.poly_bit_reverse_inplace(meta_polys.metadata.sym_poly_map[f"ipsi_default_{i}"])
+        # psi_inv is a 2N-th root of unity, so a single table of its 2N powers serves the default as well as
+        # all galois_element-specific versions below via index lookup
+        ipsi_pows = _montgomery_pow_table(psi_inv[i], q_i[i], 2 * N)
+        coeffs = ipsi_pows[:N]
+        hud.bit_reverse_inplace(coeffs)
+        meta_polys.metadata.sym_poly_map[f"ipsi_default_{i}"].coeffs.extend(coeffs)
 
         # calculate in house
         if context.scheme == hpc.SCHEME_CKKS and i < context.q_size:
@@ -83,10 +110,9 @@ def extract_metadata_polys(context: hpd.FHEContext) -> hpd.MetadataPolynomials:
             #     exp_scale = 1
             # else:
             #     exp_scale = inv_ge
-            meta_polys.metadata.sym_poly_map[f"ipsi_{str(ge)}_{i}"].coeffs.extend(
-                hud.convert_to_montgomery(pow(psi_inv[i], exp_scale * j, q_i[i]), q_i[i]) for j in range(N)
-            )
-            hud.poly_bit_reverse_inplace(meta_polys.metadata.sym_poly_map[f"ipsi_{str(ge)}_{i}"])
+            coeffs = [ipsi_pows[exp_scale * j % (2 * N)] for j in range(N)]
+            hud.bit_reverse_inplace(coeffs)
+            meta_polys.metadata.sym_poly_map[f"ipsi_{str(ge)}_{i}"].coeffs.extend(coeffs)
             # NOTE: we need only rotation-specific intt twiddles, not ntt ones but to keep logic in psim & step1
             #   simple and uniform, we still create a separate version
             # meta_polys.metadata.sym_poly_map[f"psi_{str(ge)}_{i}"].coeffs.extend(
@@ -105,6 +131,8 @@ def extract_metadata_polys(context: hpd.FHEContext) -> hpd.MetadataPolynomials:
             )
             # - rotation
             for ge, rk in pt.keys.rotation_keys.items():
+                if ge not in galois_elts:
+                    continue
                 transform_and_flatten_key_switch(
                     context,
                     f"gk_{pt}_{ge}",
@@ -117,6 +145,8 @@ def extract_metadata_polys(context: hpd.FHEContext) -> hpd.MetadataPolynomials:
         transform_and_flatten_key_switch(context, "rlk", keys.relin_key, meta_polys.metadata.sym_poly_map)
         # - rotation
         for ge, rk in keys.rotation_keys.items():
+            if ge not in galois_elts:
+                continue
             transform_and_flatten_key_switch(
                 context,
                 f"gk_{ge}",
@@ -139,9 +169,10 @@ def extract_metadata_polys(context: hpd.FHEContext) -> hpd.MetadataPolynomials:
     return meta_polys
 
 
-def extract_metadata_twiddles(context: hpd.FHEContext) -> hpd.MetadataTwiddles:
+def extract_metadata_twiddles(context: hpd.FHEContext, galois_elts: set | None = None) -> hpd.MetadataTwiddles:
     """
-    Extract symbol/value map of all twiddles as needed to build (after swizzling & replicating) memory images or DMA downloads
+    Extract symbol/value map of all twiddles as needed to build (after swizzling & replicating) memory images or DMA downloads.
+    Rotation-specific twiddles are generated only for `galois_elts`, by default all galois elements of the context
     """
     N = context.N
     q_i = context.q_i
@@ -154,16 +185,16 @@ def extract_metadata_twiddles(context: hpd.FHEContext) -> hpd.MetadataTwiddles:
 
     twiddles = hpd.MetadataTwiddles()
     twiddles.only_power_of_two = False
+    # omega_inv is an N-th root of unity, so a single table of its N powers serves the default as well as
+    # all galois_element-specific versions below via index lookup
+    omega_inv_pows = [_montgomery_pow_table(o, q, N) for o, q in zip(omega_inv, q_i, strict=False)]
     # "normal" twiddles
     for i in range(nQ):
-        twiddles.twiddles_ntt["default"].rns_polys.add().coeffs.extend(
-            hud.convert_to_montgomery(pow(omega[i], j, q_i[i]), q_i[i]) for j in range(N // 2)
-        )
-        twiddles.twiddles_intt["default"].rns_polys.add().coeffs.extend(
-            hud.convert_to_montgomery(pow(omega_inv[i], j, q_i[i]), q_i[i]) for j in range(N // 2)
-        )
+        twiddles.twiddles_ntt["default"].rns_polys.add().coeffs.extend(_montgomery_pow_table(omega[i], q_i[i], N // 2))
+        twiddles.twiddles_intt["default"].rns_polys.add().coeffs.extend(omega_inv_pows[i][: N // 2])
     # rotation related twiddles
-    galois_elts = galois_elements_from_context(context)
+    if galois_elts is None:
+        galois_elts = galois_elements_from_context(context)
     for ge in galois_elts:
         exp_scale = pow(ge, -1, 2 * N)
         for i in range(nQ):
@@ -174,9 +205,7 @@ def extract_metadata_twiddles(context: hpd.FHEContext) -> hpd.MetadataTwiddles:
             #     exp_scale = 1
             # else:
             #     exp_scale = inv_ge
-            twiddles.twiddles_intt[str(ge)].rns_polys.add().coeffs.extend(
-                hud.convert_to_montgomery(pow(omega_inv[i], exp_scale * j, q_i[i]), q_i[i]) for j in range(N // 2)
-            )
+            twiddles.twiddles_intt[str(ge)].rns_polys.add().coeffs.extend([omega_inv_pows[i][exp_scale * j % N] for j in range(N // 2)])
             # NOTE we need only rotation-specific intt twiddles, not ntt ones but to keep logic in psim & step1
             #   simple and uniform, we still create a separate version
             # twiddles.twiddles_ntt[str(ge)].rns_polys.add().coeffs.extend(
@@ -207,7 +236,7 @@ def extract_metadata_immediates(context: hpd.FHEContext) -> hpd.MetadataImmediat
         sizeP = nQ - sizeQ
 
         for i, q in enumerate(q_i):
-            immediates.sym_immediate_map[f"R2_{i}"] = hud.montgomery_R**2 % q
+            immediates.sym_immediate_map[f"R2_{i}"] = hud.montgomery_r**2 % q
             immediates.sym_immediate_map[f"iN_{i}"] = hud.convert_to_montgomery(pow(N, -1, q), q)
 
         # Global Metadata
@@ -305,7 +334,7 @@ def extract_metadata_immediates(context: hpd.FHEContext) -> hpd.MetadataImmediat
 
     else:  # SCHEME_BGV
         for i, q in enumerate(q_i):
-            immediates.sym_immediate_map[f"R2_{i}"] = hud.montgomery_R**2 % q
+            immediates.sym_immediate_map[f"R2_{i}"] = hud.montgomery_r**2 % q
             immediates.sym_immediate_map[f"iN_{i}"] = hud.convert_to_montgomery(pow(N, -1, q), q)
             for j in range(i):
                 immediates.sym_immediate_map[f"inv_q_i_{i}_mod_q_j_{j}"] = hud.convert_to_montgomery(pow(q, -1, q_i[j]), q_i[j])
@@ -342,22 +371,19 @@ def extract_metadata_immediates(context: hpd.FHEContext) -> hpd.MetadataImmediat
         # As we have to "universalize" that for all l's, we add an additional indirection and map to above
         # in map_immediate_sym
 
-        # below is 1-1 translated code from export_metadata_bootstrap_dot_product in serialize.cpp,
-        # with additional outer loop make universal
+        # below is translated code from export_metadata_bootstrap_dot_product in serialize.cpp,
+        # with additional outer loop make universal. The values depend only on (i, j), not on l, so they are
+        # computed (and converted to montgomery form) once and then replicated for every l. Similarly, the
+        # punctured products q/q_i are computed once, exactly as big ints, and only reduced per entry
+        q_over_qi = [math.prod(q_i[:nQ]) // q for q in q_i[:nQ]]
+        # qhat_mod_qi = q/qi (mod qi)
+        base_change_matrix = [[hud.convert_to_montgomery(q_over_qi[i] % q_i[j], q_i[j]) for j in range(nQ)] for i in range(nQ - 1)]
+        inv_punctured_prod = [hud.convert_to_montgomery(pow(q_over_qi[i] % q_i[i], -1, q_i[i]), q_i[i]) for i in range(nQ - 1)]
         for l in range(nQ - 1):  # noqa E741
-            for j in range(nQ):
-                for i in range(l + 1):
-                    q_over_qi_mod_qj = 1
-                    # UNUSED? inv_q_over_qi_mod_qi = 1
-                    for k in range(nQ):
-                        # qhat_mod_qi = q/qi (mod qi)
-                        if k != i:
-                            q_over_qi_mod_qj = (q_over_qi_mod_qj * q_i[k]) % q_i[j]
-                    immediates.sym_immediate_map[f"base_change_matrix_{l}_{i}_{j}"] = hud.convert_to_montgomery(q_over_qi_mod_qj, q_i[j])
-                    if i == j:
-                        immediates.sym_immediate_map[f"inv_punctured_prod_{l}_{i}"] = hud.convert_to_montgomery(
-                            pow(q_over_qi_mod_qj, -1, q_i[i]), q_i[i]
-                        )
+            for i in range(l + 1):
+                for j in range(nQ):
+                    immediates.sym_immediate_map[f"base_change_matrix_{l}_{i}_{j}"] = base_change_matrix[i][j]
+                immediates.sym_immediate_map[f"inv_punctured_prod_{l}_{i}"] = inv_punctured_prod[i]
 
     return immediates
 
@@ -421,7 +447,8 @@ def transform_and_flatten_poly(
     sym_poly_map: dict[str, hpd.RNSPolynomial],
 ):
     # print(f"DEBUG (TRACE): transform_and_flatten_poly(...{prefix}...)", file=sys.stderr)
-    for r, rns in enumerate(poly.rns_polys):
-        rns_poly = sym_poly_map[f"{prefix}_{r}"]
-        rns_poly.coeffs.extend(hud.convert_to_montgomery(coeff, rns.modulus) for coeff in rns.coeffs)
-        hud.poly_bit_reverse_inplace(rns_poly)
+    rns_coeffs = hud.convert_to_montgomery_rows(
+        [rns.coeffs for rns in poly.rns_polys], [rns.modulus for rns in poly.rns_polys], bit_reverse=True
+    )
+    for r, coeffs in enumerate(rns_coeffs):
+        sym_poly_map[f"{prefix}_{r}"].coeffs.extend(coeffs)
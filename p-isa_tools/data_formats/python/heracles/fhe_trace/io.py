@@ -4,7 +4,23 @@
 
 # TODO: create also C++ variants of below; given how simple and stable these functions should be just in replicated form, not shared code
 
-from heracles.proto.fhe_trace_pb2 import Trace
+from collections.abc import Iterable, Iterator
+
+from heracles.proto.fhe_trace_pb2 import Instruction, Trace
+from heracles.util.io import (
+    WIRE_TYPE_I32,
+    WIRE_TYPE_I64,
+    WIRE_TYPE_LEN,
+    WIRE_TYPE_VARINT,
+    decode_varint,
+    encode_varint,
+    mapped_file,
+    parse_from_file,
+)
+
+# field key of a `Trace.instructions` entry
+_INSTRUCTION_KEY = (Trace.INSTRUCTIONS_FIELD_NUMBER << 3) | WIRE_TYPE_LEN
+_INSTRUCTION_KEY_BYTES = encode_varint(_INSTRUCTION_KEY)
 
 # load & store functions
 # ===============================
@@ -25,6 +41,57 @@ def load_trace(filename: str) -> Trace:
     Prefix can contain directory paths, although they must all be existing directories
     """
     trace = Trace()
-    with open(filename, "rb") as f:
-        trace.ParseFromString(f.read())
+    parse_from_file(trace, filename)
     return trace
+
+
+def store_trace_stream(filename: str, header: Trace, instructions: Iterable[Instruction]):
+    """
+    Serialize and store a HEC trace incrementally, one instruction at a time, so the complete trace never has to be
+    held in memory. `header` provides the non-instruction fields (scheme, N, ...). The result is a regular serialized
+    `Trace`, i.e., it can be read back with `load_trace` as well as `load_trace_stream`. `header` must not contain
+    instructions itself, as they would be stored in addition to `instructions`
+    """
+    if header.instructions:
+        raise ValueError("Trace header passed to store_trace_stream must not contain instructions")
+    with open(filename, "wb") as f:
+        f.write(header.SerializeToString())
+        for instruction in instructions:
+            buf = instruction.SerializeToString()
+            f.write(_INSTRUCTION_KEY_BYTES + encode_varint(len(buf)))
+            f.write(buf)
+
+
+def load_trace_stream(filename: str, header: Trace | None = None) -> Iterator[Instruction]:
+    """
+    Lazily load the instructions of a serialized HEC trace one at a time, without materializing the complete trace.
+    All other fields are merged into `header`, if given. As protobuf does not fix the order of fields, `header` is only
+    guaranteed to be complete once the iterator is exhausted
+    """
+    with mapped_file(filename) as view:
+        pos = 0
+        while pos < len(view):
+            start = pos
+            key, pos = decode_varint(view, pos)
+            wire_type = key & 0x7
+            if wire_type == WIRE_TYPE_VARINT:
+                _, pos = decode_varint(view, pos)
+            elif wire_type == WIRE_TYPE_I64:
+                pos += 8
+            elif wire_type == WIRE_TYPE_I32:
+                pos += 4
+            elif wire_type == WIRE_TYPE_LEN:
+                length, pos = decode_varint(view, pos)
+                pos += length
+            else:
+                raise ValueError(f"Unsupported protobuf wire type {wire_type} in trace '{filename}'")
+            if pos > len(view):
+                raise ValueError(f"Truncated field in trace '{filename}'")
+            if key == _INSTRUCTION_KEY:
+                instruction = Instruction()
+                with view[pos - length : pos] as record:
+                    instruction.ParseFromString(record)
+                yield instruction
+            elif header is not None:
+                with view[start:pos] as field:
+                    header.MergeFromString(field)
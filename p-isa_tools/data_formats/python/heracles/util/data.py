@@ -1,7 +1,11 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
+import functools
+from collections.abc import Sequence
+
 import heracles.proto.data_pb2 as hpd
+import numpy as np
 
 # - montgomery transform
 montgomery_r_bits = 32
@@ -12,11 +16,44 @@ def convert_to_montgomery(num: int, modulus: int) -> int:
     return (num << montgomery_r_bits) % modulus
 
 
+def convert_to_montgomery_rows(rows: Sequence[Sequence[int]], moduli: Sequence[int], bit_reverse: bool = False) -> list[list[int]]:
+    # struct-of-arrays version of convert_to_montgomery for all rns terms of a polynomial at once: the (equal-length)
+    # rows are stacked into a single matrix and row r is reduced modulo moduli[r] in one vectorized pass. As both
+    # coefficients and moduli are 32-bit, the shifted values still fit into uint64.
+    # With `bit_reverse`, the rows are also bit-reversed while still staged in the matrix, so the result can be
+    # written to protobuf as is
+    if not rows:
+        return []
+    mat = np.array(rows, dtype=np.uint64)
+    mat = (mat << np.uint64(montgomery_r_bits)) % np.array(moduli, dtype=np.uint64)[:, None]
+    if bit_reverse:
+        mat = mat[:, _bit_reverse_index(mat.shape[1])]
+    return mat.tolist()
+
+
+# - coefficient arrays
+def rns_coeffs_as_array(a: hpd.RNSPolynomial) -> np.ndarray:
+    # copy of the (uint32) coefficients as a contiguous array, converted from the repeated field in a single pass so
+    # that further work avoids per-element protobuf accessors. uint64 leaves room for products/shifts of residues
+    return np.array(a.coeffs, dtype=np.uint64)
+
+
+def set_rns_coeffs(a: hpd.RNSPolynomial, coeffs: np.ndarray):
+    # counterpart of rns_coeffs_as_array, replaces all coefficients at once
+    a.coeffs[:] = coeffs.tolist()
+
+
 # - bit-reversal
-def poly_bit_reverse_inplace(a: hpd.RNSPolynomial):
-    a_in = hpd.RNSPolynomial()
-    a_in.CopyFrom(a)
-    n = len(a.coeffs)
+def _is_power_of_two(n: int) -> bool:
+    return n > 0 and n & (n - 1) == 0
+
+
+@functools.lru_cache
+def bit_reverse_permutation(n: int) -> tuple[int, ...]:
+    # source index for each position of a bit-reversed sequence of length n, computed once per n
+    if _is_power_of_two(n):
+        return tuple(_bit_reverse_index(n).tolist())
+    perm = list(range(n))
     j = 0
     for i in range(1, n):
         b = n >> 1
@@ -25,4 +62,32 @@ def poly_bit_reverse_inplace(a: hpd.RNSPolynomial):
             b >>= 1
         j += b
         if j > i:
-            a.coeffs[i], a.coeffs[j] = a_in.coeffs[j], a_in.coeffs[i]
+            perm[i], perm[j] = perm[j], perm[i]
+    return tuple(perm)
+
+
+@functools.lru_cache
+def _bit_reverse_index(n: int) -> np.ndarray:
+    if _is_power_of_two(n):
+        # vectorized instead of a per-index python loop: the permutation for 2m follows from the one for m, as
+        # prepending a bit to the indices appends it to their reversal
+        index = np.zeros(1, dtype=np.intp)
+        while len(index) < n:
+            index <<= 1
+            index = np.concatenate((index, index | 1))
+    else:
+        index = np.array(bit_reverse_permutation(n), dtype=np.intp)
+    index.flags.writeable = False
+    return index
+
+
+def bit_reverse_inplace(a: list[int]):
+    # plain-list version of poly_bit_reverse_inplace, allows to bit-reverse coefficients before they are written
+    # (once) to a protobuf repeated field instead of swapping element-wise inside the field
+    a[:] = [a[k] for k in bit_reverse_permutation(len(a))]
+
+
+def poly_bit_reverse_inplace(a: hpd.RNSPolynomial):
+    # single vectorized gather of the coefficients, written back to the repeated field at once
+    coeffs = rns_coeffs_as_array(a)
+    set_rns_coeffs(a, coeffs[_bit_reverse_index(len(coeffs))])
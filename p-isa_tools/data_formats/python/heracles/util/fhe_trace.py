@@ -5,25 +5,16 @@ import heracles.proto.fhe_trace_pb2 as hpf
 
 
 def get_all_symbols(trace: hpf.Trace, get_intermediates: bool = False):
-    syms_input = set()
-    syms_output = set()
+    # set comprehensions instead of a set.add() call per operand
+    args = [instruction.args for instruction in trace.instructions if not instruction.op.startswith("bk_")]
+    syms_input = {src.symbol_name for arg in args for src in arg.srcs}
+    syms_output = {dest.symbol_name for arg in args for dest in arg.dests}
     syms_intermediate = set()
-    for instruction in trace.instructions:
-        if instruction.op.startswith("bk_"):
-            continue
-
-        for src in instruction.args.srcs:
-            syms_input.add(src.symbol_name)
-        for dest in instruction.args.dests:
-            syms_output.add(dest.symbol_name)
 
     if get_intermediates:
-        # get pure inputs
-        syms_input_exclusive = syms_input - syms_output
-        # get intermediates
-        syms_intermediate = syms_input - syms_input_exclusive
-        # get pure outputs
-        syms_output = syms_output - syms_intermediate
-        syms_input = syms_input_exclusive
+        # intermediates are both read and written; pure inputs and outputs are the rest
+        syms_intermediate = syms_input & syms_output
+        syms_input -= syms_intermediate
+        syms_output -= syms_intermediate
 
     return [syms_input, syms_output, syms_intermediate]
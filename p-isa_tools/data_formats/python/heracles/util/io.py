@@ -0,0 +1,65 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import contextlib
+import mmap
+import os
+from collections.abc import Iterator
+
+from google.protobuf.message import Message
+
+# protobuf wire types (see https://protobuf.dev/programming-guides/encoding/#structure)
+WIRE_TYPE_VARINT = 0
+WIRE_TYPE_I64 = 1
+WIRE_TYPE_LEN = 2
+WIRE_TYPE_I32 = 5
+
+
+@contextlib.contextmanager
+def mapped_file(filename: str) -> Iterator[memoryview]:
+    """
+    Provide the content of a file as a read-only memoryview over a memory map of the file, avoiding an intermediate
+    `bytes` copy. Slices taken from the view must not outlive the context
+    """
+    with open(filename, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # empty files cannot be mapped
+            yield memoryview(b"")
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            yield view
+
+
+def parse_from_file(message: Message, filename: str):
+    """
+    Deserialize `message` from a file, parsing directly from a read-only memory map of the file instead of first
+    reading it into an intermediate `bytes` copy. This avoids doubling peak memory for large (multi-GB) traces
+    """
+    with mapped_file(filename) as view:
+        # note: an empty file is a valid (all-default) serialization
+        message.ParseFromString(view)
+
+
+def encode_varint(value: int) -> bytes:
+    """Encode a non-negative integer as protobuf base-128 varint"""
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def decode_varint(buf: memoryview, pos: int) -> tuple[int, int]:
+    """Decode a protobuf base-128 varint starting at `pos` in `buf`, returning the value and the position after it"""
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(buf):
+            raise ValueError("Truncated varint in protobuf stream")
+        byte = buf[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
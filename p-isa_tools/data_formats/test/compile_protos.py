@@ -7,12 +7,20 @@ Compile Protocol Buffer files to Python modules.
 This script can be run standalone without CMake/C++ dependencies.
 """
 
+import re
 import sys
 from pathlib import Path
 
 from grpc_tools import protoc
 
 
+def _is_stale(proto_file: Path, output_dir: Path, newest_proto_mtime: float) -> bool:
+    """Check whether the generated module of a .proto file is missing or older than any .proto file,
+    as a change to an imported .proto file also affects the modules generated from its importers."""
+    py_file = output_dir / f"{proto_file.stem}_pb2.py"
+    return not py_file.exists() or py_file.stat().st_mtime < newest_proto_mtime
+
+
 def compile_protos():
     """Compile all .proto files to Python modules."""
 
@@ -47,8 +55,16 @@ def compile_protos():
         print(f"No .proto files found in {proto_dir}")
         return 1
 
-    print(f"Found {len(proto_files)} proto files to compile:")
-    for proto_file in proto_files:
+    # Only recompile protos whose generated module is missing or older than any of the sources
+    newest_proto_mtime = max(proto_file.stat().st_mtime for proto_file in proto_files)
+    stale_proto_files = [proto_file for proto_file in proto_files if _is_stale(proto_file, output_dir, newest_proto_mtime)]
+
+    if not stale_proto_files:
+        print(f"All {len(proto_files)} generated proto modules in {output_dir} are up to date")
+        return 0
+
+    print(f"Found {len(stale_proto_files)} of {len(proto_files)} proto files to compile:")
+    for proto_file in stale_proto_files:
         print(f"  - {proto_file.name}")
 
     # Find the grpcio_tools package to get the google protobuf includes
@@ -57,8 +73,8 @@ def compile_protos():
     grpc_tools_path = Path(grpc_tools.__file__).parent
     proto_include = grpc_tools_path / "_proto"
 
-    # Compile all proto files at once to handle dependencies
-    print("Compiling all proto files...")
+    # Compile all stale proto files at once to handle dependencies
+    print("Compiling proto files...")
 
     # protoc arguments - compile all files together
     args = [
@@ -66,7 +82,7 @@ def compile_protos():
         f"-I{proto_include}",  # Include path for google/protobuf/*.proto
         f"--proto_path={proto_dir}",
         f"--python_out={output_dir}",
-    ] + [str(proto_file) for proto_file in proto_files]
+    ] + [str(proto_file) for proto_file in stale_proto_files]
 
     # Run protoc
     result = protoc.main(args)
@@ -75,21 +91,24 @@ def compile_protos():
         print("Error compiling proto files")
         return result
 
-    print(f"\nSuccessfully compiled {len(proto_files)} proto files to {output_dir}")
+    print(f"\nSuccessfully compiled {len(stale_proto_files)} proto files to {output_dir}")
 
     # Fix imports in generated files to use relative imports
     print("\nFixing imports in generated files...")
-    for py_file in output_dir.glob("*_pb2.py"):
+    # One pass per file over an alternation of all local module names
+    import_pattern = re.compile(
+        r"^import (" + "|".join(re.escape(proto_file.stem) for proto_file in proto_files) + r")_pb2\b",
+        re.MULTILINE,
+    )
+    for py_file in (output_dir / f"{proto_file.stem}_pb2.py" for proto_file in stale_proto_files):
         content = py_file.read_text()
 
         # Replace absolute imports with relative imports for local proto files
-        for proto_file in proto_files:
-            module_name = proto_file.stem
-            old_import = f"import {module_name}_pb2"
-            new_import = f"from . import {module_name}_pb2"
-            content = content.replace(old_import, new_import)
+        fixed_content = import_pattern.sub(r"from . import \1_pb2", content)
+        if fixed_content == content:
+            continue
 
-        py_file.write_text(content)
+        py_file.write_text(fixed_content)
         print(f"  Fixed imports in {py_file.name}")
 
     print("\nProto compilation complete!")
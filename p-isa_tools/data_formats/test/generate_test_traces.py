@@ -82,34 +82,23 @@ def generate_data_trace():
     # Add some basic BGV-specific information
     bgv_spec = context.bgv_info
 
-    # Add a plaintext specification (index 2 as used in the trace)
-    pt_spec = bgv_spec.plaintext_specific.add()
-    pt_spec.plaintext_modulus = 65537
-    pt_spec = bgv_spec.plaintext_specific.add()
-    pt_spec.plaintext_modulus = 65537
-    pt_spec = bgv_spec.plaintext_specific.add()  # Index 2
-    pt_spec.plaintext_modulus = 65537
+    # Add plaintext specifications (index 2 as used in the trace)
+    bgv_spec.plaintext_specific.extend(hpd.BGVPlaintextSpecific(plaintext_modulus=65537) for _ in range(3))
 
     # Create TestVector with some sample data
     testvector = hpd.TestVector()
 
+    # All symbols share the same data layout: a simple DCRTPoly (the Data message only has dcrtpoly field)
+    # with 2 polynomials for a ciphertext, each with empty RNS polynomials (5 moduli as specified in trace)
+    template = hpd.Data()
+    template.dcrtpoly.in_ntt_form = True
+    template.dcrtpoly.polys.extend(
+        hpd.Polynomial(in_OpenFHE_EVALUATION=False, rns_polys=[hpd.RNSPolynomial() for _ in range(5)]) for _ in range(2)
+    )
+
     # Add data for symbols used in the trace
     for symbol in ["in1", "in2", "t1", "out1", "output_0_1_2"]:
-        data = testvector.sym_data_map[symbol]
-
-        # Add a simple DCRTPoly (the Data message only has dcrtpoly field)
-        dcrt = data.dcrtpoly
-        dcrt.in_ntt_form = True
-
-        # Add polynomial data (2 for ciphertext order)
-        for _ in range(2):  # 2 polynomials for a ciphertext
-            poly = dcrt.polys.add()
-            poly.in_OpenFHE_EVALUATION = False
-
-            # Add RNS polynomials (5 moduli as specified in trace)
-            for _ in range(5):
-                poly.rns_polys.add()
-                # Just create empty RNS polynomial structure
+        testvector.sym_data_map[symbol].CopyFrom(template)
 
     # Save the data trace
     hdi.store_data_trace("test.data_trace", context, testvector)
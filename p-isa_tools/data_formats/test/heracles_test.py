@@ -2,6 +2,8 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
+import argparse
+import json
 import os
 import sys
 from pathlib import Path
@@ -40,9 +42,13 @@ import heracles.data.io as hdi  # noqa: E402
 import heracles.data.naming as hdn  # noqa: E402
 import heracles.fhe_trace.io as hfi  # noqa: E402
 import heracles.proto.common_pb2 as hpc  # noqa: E402
+import heracles.proto.fhe_trace_pb2 as hpf  # noqa: E402
 
+# scheme enum values by number, resolved once rather than per lookup
+_SCHEME_NAMES = {v.number: v for v in hpc.Scheme.DESCRIPTOR.values}
 
-def test():
+
+def test(verbose: bool = False):
     # simulate interaction of program mapper with this library ....
     # Test data is already generated at module import time
     trace = hfi.load_trace("test.program_trace")
@@ -70,16 +76,31 @@ def test():
             f" with '{universal_mem_sym_prefix}' and immediate symbol-prefix '{immediate_sym}' with '{universal_immediate_sym}'"
         )
 
-    # complete dump ...
-    print(trace)
-    print(gpj.MessageToJson(trace))
-    print(gpj.MessageToDict(trace))
+    # streamed instruction-by-instruction access yields the same trace ...
+    header = hpf.Trace()
+    assert list(hfi.load_trace_stream("test.program_trace", header)) == list(trace.instructions)
+    hfi.store_trace_stream("test.program_trace_stream", header, trace.instructions)
+    assert hfi.load_trace("test.program_trace_stream") == trace
+    os.remove("test.program_trace_stream")
+    # ... while a header which still has instructions is rejected rather than storing them twice
+    try:
+        hfi.store_trace_stream("test.program_trace_stream", trace, trace.instructions)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("store_trace_stream accepted a header with instructions")
+    assert not os.path.exists("test.program_trace_stream")
+
+    # complete dump ... (MessageToJson would rebuild the same dict, so serialize it once)
+    if verbose:
+        print(trace)
+    trace_dict = gpj.MessageToDict(trace, preserving_proto_field_name=True)
+    print(json.dumps(trace_dict, indent=2))
 
     # selective access to trace information ...
+    scheme = _SCHEME_NAMES[trace.scheme]
     print(
-        f"scheme num={trace.scheme} / "
-        f"default-string={hpc.Scheme.DESCRIPTOR.values_by_number[trace.scheme].name} / "
-        f"friendly-string={hpc.Scheme.DESCRIPTOR.values_by_number[trace.scheme].GetOptions()}"
+        f"scheme num={trace.scheme} / default-string={scheme.name} / friendly-string={scheme.GetOptions()}"
     )  # TODO: extract heracles.instruction.string_name extension
     first_instr = trace.instructions[0]
     src1 = first_instr.args.srcs[0].symbol_name
@@ -97,4 +118,7 @@ def test():
 
 
 if __name__ == "__main__":
-    test()
+    parser = argparse.ArgumentParser(description="Exercise the HERACLES data-formats python library")
+    parser.add_argument("-v", "--verbose", action="store_true", help="also dump the trace in protobuf text format")
+    args = parser.parse_args()
+    test(verbose=args.verbose)
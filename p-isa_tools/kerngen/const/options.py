@@ -20,7 +20,7 @@ class LoopKey(Enum):
         """Convert a string to a LoopKey enum"""
         if value is None:
             raise ValueError("LoopKey cannot be None")
-        try:
-            return cls[value.upper()]
-        except KeyError:
-            raise ValueError(f"Invalid LoopKey: {value}") from None
+        member = cls.__members__.get(value.upper())
+        if member is None:
+            raise ValueError(f"Invalid LoopKey: {value}")
+        return member
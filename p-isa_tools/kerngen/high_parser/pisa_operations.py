@@ -12,12 +12,15 @@ from .config import Config
 class PIsaOp(ABC):
     """Abstract class for p-isa operation"""
 
+    # Kernels can hold many thousands of ops; no per-instance __dict__
+    __slots__ = ()
+
     @abstractmethod
     def __str__(self) -> str:
         """Return the p-isa instructions of the operation"""
 
 
-@dataclass
+@dataclass(slots=True)
 class UnaryOp:
     """Class representing the p-isa common unary operation"""
 
@@ -32,7 +35,7 @@ class UnaryOp:
         return f"{self.label}, {op}, {self.output}, {self.input0}, {self.q}"
 
 
-@dataclass
+@dataclass(slots=True)
 class BinaryOp:
     """Class representing the p-isa common binary operation"""
 
@@ -48,7 +51,7 @@ class BinaryOp:
         return f"{self.label}, {op}, {self.output}, {self.input0}, {self.input1}, {self.q}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Copy(PIsaOp):
     """Class representing the p-isa movement operation"""
 
@@ -62,7 +65,7 @@ class Copy(PIsaOp):
         return f"{self.label}, copy, {self.output}, {self.input0}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Mov(PIsaOp):
     """Class representing the p-isa movement operation"""
 
@@ -79,6 +82,8 @@ class Mov(PIsaOp):
 class Add(BinaryOp, PIsaOp):
     """Class representing the p-isa addition operation"""
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         """Return the p-isa instructions of an addition"""
         return self._op_str("add")
@@ -87,6 +92,8 @@ class Add(BinaryOp, PIsaOp):
 class Sub(BinaryOp, PIsaOp):
     """Class representing the p-isa subtraction operation"""
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         """Return the p-isa instructions of an subtraction"""
         return self._op_str("sub")
@@ -95,6 +102,8 @@ class Sub(BinaryOp, PIsaOp):
 class Mul(BinaryOp, PIsaOp):
     """Class representing the p-isa multiplication operation"""
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         """Return the p-isa instructions of an multiplication"""
         return self._op_str("mul")
@@ -103,6 +112,8 @@ class Mul(BinaryOp, PIsaOp):
 class Muli(BinaryOp, PIsaOp):
     """Class representing the p-isa multiplication operation with immediates"""
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         """Return the p-isa instructions of an multiplication with immediates"""
         return self._op_str("muli")
@@ -111,6 +122,8 @@ class Muli(BinaryOp, PIsaOp):
 class Mac(BinaryOp, PIsaOp):
     """Class representing the p-isa multiplication and accumulate operation"""
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         """Return the p-isa instructions of an multiplication and accumulate"""
         return self._op_str("mac")
@@ -119,12 +132,14 @@ class Mac(BinaryOp, PIsaOp):
 class Maci(BinaryOp, PIsaOp):
     """Class representing the p-isa multiplication and accumulate operation with immediates"""
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         """Return the p-isa instructions of an multiply and accumulate with immediates"""
         return self._op_str("maci")
 
 
-@dataclass
+@dataclass(slots=True)
 class Butterfly:
     """Common arguments for butterfly operations"""
 
@@ -150,6 +165,8 @@ class Butterfly:
 class NTT(Butterfly, PIsaOp):
     """Class representing the p-isa NTT operation"""
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         """Return the p-isa instructions of an NTT"""
         return self._op_str("ntt")
@@ -158,12 +175,14 @@ class NTT(Butterfly, PIsaOp):
 class INTT(Butterfly, PIsaOp):
     """Class representing the p-isa INTT operation"""
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         """Return the p-isa instructions of an inverse NTT"""
         return self._op_str("intt")
 
 
-@dataclass
+@dataclass(slots=True)
 class Comment(PIsaOp):
     """Comment. These may help with kernel writing. Break up composite kernels."""
 
@@ -10,11 +10,37 @@ This module provides functionality to determine primary and secondary loop order
 based on scheme, kernel type, polynomial order, and RNS parameters.
 """
 
+import functools
 import json
 from pathlib import Path
 
 LOOP_ORDER_CONFIG = str(Path(__file__).parent.parent.absolute() / "kernel_optimization/loop_order_config.json")
 
+VALID_SCHEMES = frozenset({"bgv", "ckks"})
+VALID_KERNELS = frozenset({"add", "mul", "muli", "copy", "sub", "square", "ntt", "intt", "mod", "modup", "relin", "rotate", "rescale"})
+VALID_POLYORDERS = frozenset({16384, 32768, 65536})
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config(config_file: str) -> dict:
+    """
+    Load and parse the loop order configuration once per configuration file.
+    The returned dict is shared between calls and must not be modified.
+
+    Args:
+        config_file (str): Path to configuration file
+
+    Returns:
+        dict: The complete configuration structure
+    """
+    try:
+        with open(config_file, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Configuration file not found: {config_file}") from e
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in configuration file: {e}") from e
+
 
 def _parse_range(range_str: str) -> tuple[int, int]:
     """
@@ -34,19 +60,25 @@ def _parse_range(range_str: str) -> tuple[int, int]:
         return val, val
 
 
-def _value_in_range(value: int, range_str: str) -> bool:
+@functools.cache
+def _max_rns_ranges(config_file: str, scheme: str, kernel: str, polyorder: int) -> tuple[tuple[int, int, tuple[str, str]], ...]:
     """
-    Check if a value falls within a range string.
+    Preparse the max_rns ranges of a configuration entry, in configuration order.
 
     Args:
-        value (int): Value to check
-        range_str (str): Range string like '1-5' or '3'
+        config_file (str): Path to configuration file
+        scheme (str): Encryption scheme
+        kernel (str): Kernel type
+        polyorder (int): Polynomial order
 
     Returns:
-        bool: True if value is in range
+        Tuple of (min_value, max_value, loop_order) entries, ranges inclusive
+
+    Raises:
+        KeyError: If scheme, kernel or polyorder are not found in configuration
     """
-    min_val, max_val = _parse_range(range_str)
-    return min_val <= value <= max_val
+    polyorder_config = _load_config(config_file)[scheme][kernel][str(polyorder)]
+    return tuple((*_parse_range(max_rns_range), tuple(order_config)) for max_rns_range, order_config in polyorder_config.items())
 
 
 def get_loop_order(
@@ -76,51 +108,29 @@ def get_loop_order(
         KeyError: If the specified parameters are not found in configuration
         ValueError: If parameters are invalid
     """
-    # Validate inputs
-    valid_schemes = {"bgv", "ckks"}
-    valid_kernels = {"add", "mul", "muli", "copy", "sub", "square", "ntt", "intt", "mod", "modup", "relin", "rotate", "rescale"}
-    valid_polyorders = {16384, 32768, 65536}
-
     scheme = scheme.lower()
     kernel = kernel.lower()
 
-    if scheme not in valid_schemes:
-        raise ValueError(f"Invalid scheme '{scheme}'. Must be one of {valid_schemes}")
+    if scheme not in VALID_SCHEMES:
+        raise ValueError(f"Invalid scheme '{scheme}'. Must be one of {set(VALID_SCHEMES)}")
 
-    if kernel not in valid_kernels:
-        raise ValueError(f"Invalid kernel '{kernel}'. Must be one of {valid_kernels}")
+    if kernel not in VALID_KERNELS:
+        raise ValueError(f"Invalid kernel '{kernel}'. Must be one of {set(VALID_KERNELS)}")
 
-    if polyorder not in valid_polyorders:
-        raise ValueError(f"Invalid polyorder '{polyorder}'. Must be one of {valid_polyorders}")
+    if polyorder not in VALID_POLYORDERS:
+        raise ValueError(f"Invalid polyorder '{polyorder}'. Must be one of {set(VALID_POLYORDERS)}")
 
     if max_rns < 1:
         raise ValueError(f"Invalid RNS value: max_rns={max_rns}")
 
-    try:
-        with open(LOOP_ORDER_CONFIG, encoding="utf-8") as f:
-            config = json.load(f)
-    except FileNotFoundError as e:
-        raise FileNotFoundError(f"Configuration file not found: {LOOP_ORDER_CONFIG}") from e
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in configuration file: {e}") from e
-
     # Lookup configuration with range support
     try:
-        scheme_config = config[scheme]
-        kernel_config = scheme_config[kernel]
-        polyorder_config = kernel_config[str(polyorder)]
-
-        # Find matching max_rns range
-        loop_order = None
-        for max_rns_range, order_config in polyorder_config.items():
-            if _value_in_range(max_rns, max_rns_range):
-                loop_order = order_config
-                break
-
-        if loop_order is None:
-            raise KeyError(f"max_rns={max_rns}")
+        # Find first matching max_rns range
+        for min_val, max_val, loop_order in _max_rns_ranges(LOOP_ORDER_CONFIG, scheme, kernel, polyorder):
+            if min_val <= max_rns <= max_val:
+                return loop_order
 
-        return tuple(loop_order)
+        raise KeyError(f"max_rns={max_rns}")
 
     except KeyError as e:
         raise KeyError(
@@ -5,11 +5,39 @@
 
 """Module for loop interchange optimization in P-ISA operations"""
 
+import operator
 import re
 
 from const.options import LoopKey
 from high_parser.pisa_operations import NTT, BinaryOp, Comment, PIsaOp
 
+_PART_RE = re.compile(r"_(\d+)_")
+_UNIT_RE = re.compile(r"_(\d+),")
+
+
+def _rns_value(pisa: PIsaOp, _pisa_str: str) -> int:
+    """Sort value for LoopKey.RNS"""
+    return pisa.q
+
+
+def _part_value(_pisa: PIsaOp, pisa_str: str) -> int:
+    """Sort value for LoopKey.PART"""
+    match = _PART_RE.search(pisa_str)
+    return int(match[1]) if match else 0
+
+
+def _unit_value(_pisa: PIsaOp, pisa_str: str) -> int:
+    """Sort value for LoopKey.UNIT"""
+    match = _UNIT_RE.search(pisa_str)
+    return int(match[1]) if match else 0
+
+
+_SORT_VALUE_GETTERS = {
+    LoopKey.RNS: _rns_value,
+    LoopKey.PART: _part_value,
+    LoopKey.UNIT: _unit_value,
+}
+
 
 class PIsaOpGroup:
     """A group of PIsaOp instructions with reorderable flag.
@@ -118,14 +146,18 @@ def split_by_reorderable(pisa_list: list[PIsaOp]) -> list[PIsaOpGroup]:
         # if the pisa is a comment and it contains <reorderable> tag,
         # treat the following pisa as reorderable until a </reorderable> tag is found.
         if isinstance(pisa, Comment):
-            if "<reorderable>" in pisa.line:
+            line = pisa.line
+            # Both tags end in "reorderable>", so plain comments cost a single scan
+            if "reorderable>" not in line:
+                continue
+            if "<reorderable>" in line:
                 # If current group has instructions, append it to groups first
                 if current_group.pisa_list:
                     groups.append(current_group)
                 # Create a new reorderable group
                 current_group = PIsaOpGroup([], is_reorderable=True)
                 no_reoderable_group = False
-            elif "</reorderable>" in pisa.line:
+            elif "</reorderable>" in line:
                 # End reorderable section, append current group to groups
                 if current_group.pisa_list:
                     groups.append(current_group)
@@ -146,6 +178,53 @@ def split_by_reorderable(pisa_list: list[PIsaOp]) -> list[PIsaOpGroup]:
     return groups
 
 
+def _sort_key_function(primary_key: LoopKey | None, secondary_key: LoopKey | None):
+    """Build the sort key function for a primary and optional secondary key.
+
+    Args:
+        primary_key: Primary sort criterion from SortKey enum
+        secondary_key: Optional secondary sort criterion from SortKey enum
+
+    Returns:
+        Function mapping a PIsaOp instruction to its sort key
+
+    Raises:
+        ValueError: If invalid sort key values provided
+    """
+    sort_keys = (primary_key,) if not secondary_key else (primary_key, secondary_key)
+    needs_str = LoopKey.PART in sort_keys or LoopKey.UNIT in sort_keys
+
+    # Resolve the key dispatch once per call rather than once per op
+    getters = []
+    for key in sort_keys:
+        if key not in _SORT_VALUE_GETTERS:
+            raise ValueError(f"Invalid sort key value: {key}")
+        getters.append(_SORT_VALUE_GETTERS[key])
+
+    # RNS-only orders reduce to q alone, which a C-level attrgetter extracts
+    # without a Python call per op
+    if all(key is LoopKey.RNS for key in sort_keys):
+        return operator.attrgetter("q")
+
+    # A single key sorts on the bare value; no 1-tuple per op
+    if len(getters) == 1:
+        (getter,) = getters
+
+        def get_single_sort_key(pisa: PIsaOp) -> int:
+            return getter(pisa, str(pisa))
+
+        return get_single_sort_key
+
+    primary_getter, secondary_getter = getters
+
+    def get_sort_key(pisa: PIsaOp) -> tuple[int, int]:
+        # Format the op at most once, however many keys need to parse it
+        pisa_str = str(pisa) if needs_str else ""
+        return primary_getter(pisa, pisa_str), secondary_getter(pisa, pisa_str)
+
+    return get_sort_key
+
+
 def loop_interchange(
     pisa_list: list[PIsaOp],
     primary_key: LoopKey | None = LoopKey.PART,
@@ -167,28 +246,42 @@ def loop_interchange(
     if primary_key is None and secondary_key is None:
         return pisa_list
 
-    def get_sort_value(pisa: PIsaOp, key: LoopKey) -> int:
-        match key:
-            case LoopKey.RNS:
-                return pisa.q
-            case LoopKey.PART:
-                match = re.search(r"_(\d+)_", str(pisa))
-                return int(match[1]) if match else 0
-            case LoopKey.UNIT:
-                match = re.search(r"_(\d+),", str(pisa))
-                return int(match[1]) if match else 0
-            case _:
-                raise ValueError(f"Invalid sort key value: {key}")
-
-    def get_sort_key(pisa: PIsaOp) -> tuple:
-        primary_value = get_sort_value(pisa, primary_key)
-        if secondary_key:
-            secondary_value = get_sort_value(pisa, secondary_key)
-            return (primary_value, secondary_value)
-        return (primary_value,)
+    get_sort_key = _sort_key_function(primary_key, secondary_key)
 
     # Filter out comments
     pisa_list_wo_comments = remove_comments(pisa_list)
-    # Sort based on primary and optional secondary keys
+    # Sort based on primary and optional secondary keys; list.sort computes
+    # each op's key exactly once before comparing
     pisa_list_wo_comments.sort(key=get_sort_key)
     return pisa_list_wo_comments
+
+
+def interchange_groups(
+    groups: list[PIsaOpGroup],
+    primary_key: LoopKey | None = LoopKey.PART,
+    secondary_key: LoopKey | None = LoopKey.RNS,
+) -> list[PIsaOpGroup]:
+    """Sort the reorderable groups by primary and optional secondary keys, in place.
+
+    Groups from split_by_reorderable hold no comments, so unlike loop_interchange
+    no filtering pass or list copy is needed.
+
+    Args:
+        groups: List of PIsaOpGroup objects as returned by split_by_reorderable
+        primary_key: Primary sort criterion from SortKey enum
+        secondary_key: Optional secondary sort criterion from SortKey enum
+
+    Returns:
+        The same list of groups, with reorderable groups sorted
+
+    Raises:
+        ValueError: If invalid sort key values provided
+    """
+    if primary_key is None and secondary_key is None:
+        return groups
+
+    get_sort_key = _sort_key_function(primary_key, secondary_key)
+    for group in groups:
+        if group.is_reorderable:
+            group.pisa_list.sort(key=get_sort_key)
+    return groups
@@ -30,18 +30,27 @@ Example:
 """
 
 import argparse
+import contextlib
+import functools
+import io
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 
 from const.options import LoopKey
 from high_parser.config import Config
 from kernel_optimization.loop_ordering_lookup import get_loop_order
-from kernel_optimization.loops import loop_interchange, reuse_rns_label, split_by_reorderable
+from kernel_optimization.loops import interchange_groups, remove_comments, reuse_rns_label, split_by_reorderable
 from kernel_parser.parser import KernelParser
 from pisa_generators.basic import mixed_to_pisa_ops
 
+# Map loop order configuration values to LoopKey enum
+_LOOP_KEY_MAPPING = {"part": LoopKey.PART, "rns": LoopKey.RNS, "null": None}
 
-def parse_args():
-    """Parse arguments from the commandline"""
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the commandline parser; it is not modified by parsing, so it is built once"""
     parser = argparse.ArgumentParser(description="Kernel Graph Parser")
     parser.add_argument("-d", "--debug", action="store_true", help="Enable Debug Print")
     parser.add_argument("-l", "--legacy", action="store_true", help="Enable Legacy Mode")
@@ -75,10 +84,24 @@ def parse_args():
         action="store_true",
         help="Use optimal primary and secondary loop order based on kernel configuration (overrides -p and -s)",
     )
-    parsed_args = parser.parse_args()
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes used to generate kernels (default: 1)",
+    )
+    return parser
+
+
+def parse_args(argv=None):
+    """Parse arguments from the commandline, or from `argv` if given"""
+    parsed_args = _build_parser().parse_args(argv)
     # verify that primary and secondary keys are  not the same
     if not parsed_args.optimal and parsed_args.primary == parsed_args.secondary:
         raise ValueError("Primary and secondary keys cannot be the same.")
+    if parsed_args.jobs < 1:
+        raise ValueError("Number of jobs must be at least 1.")
     return parsed_args
 
 
@@ -96,16 +119,15 @@ def get_optimal_loop_order(kernel, debug=False):
     try:
         # Extract kernel properties
         scheme = getattr(kernel.context, "scheme", "bgv").lower()
-        kernel_name = str(kernel).split("(")[0].lower()
+        # Same as the prefix of the dataclass repr, without formatting the whole kernel
+        kernel_name = type(kernel).__name__.lower()
         polyorder = getattr(kernel.context, "poly_order", 16384)
         max_rns = getattr(kernel.context, "max_rns", 3)
         # Get optimal loop order from configuration
         primary_str, secondary_str = get_loop_order(scheme, kernel_name, polyorder, max_rns)
         # Map string values to LoopKey enum
-        loop_key_mapping = {"part": LoopKey.PART, "rns": LoopKey.RNS, "null": None}
-
-        primary_key = loop_key_mapping.get(primary_str)
-        secondary_key = loop_key_mapping.get(secondary_str)
+        primary_key = _LOOP_KEY_MAPPING.get(primary_str)
+        secondary_key = _LOOP_KEY_MAPPING.get(secondary_str)
 
         if debug:
             print(
@@ -144,33 +166,68 @@ def process_kernel_with_reordering(kernel, args):
         primary_key = args.primary
         secondary_key = args.secondary
 
-    groups = split_by_reorderable(kernel.to_pisa())
+    if primary_key is None and secondary_key is None:
+        # Nothing to interchange; the split would only drop the comments
+        write_pisa(remove_comments(kernel.to_pisa()))
+        return
+
+    reuse_rns = ("mod" in args.target) and (primary_key is not None and secondary_key is not None)
+
+    # Reorderable groups are sorted in place; groups carry no comments
+    groups = interchange_groups(split_by_reorderable(kernel.to_pisa()), primary_key, secondary_key)
     processed_kernel = []
     for group in groups:
-        if group.is_reorderable:
-            interchanged_pisa = loop_interchange(group.pisa_list, primary_key=primary_key, secondary_key=secondary_key)
-
-            if ("mod" in args.target) and (primary_key is not None and secondary_key is not None):
-                for pisa in mixed_to_pisa_ops(interchanged_pisa):
-                    processed_kernel.append(reuse_rns_label(pisa, kernel.context.current_rns))
-            else:
-                processed_kernel.append(interchanged_pisa)
+        if group.is_reorderable and reuse_rns:
+            for pisa in group.pisa_list:
+                processed_kernel.append(reuse_rns_label(pisa, kernel.context.current_rns))
         else:
             processed_kernel.append(group.pisa_list)
 
-    for pisa in mixed_to_pisa_ops(processed_kernel):
-        print(pisa)
+    write_pisa(mixed_to_pisa_ops(processed_kernel))
+
+
+@functools.cache
+def _target_pattern(targets: tuple[str, ...]) -> re.Pattern:
+    """Compile a case-insensitive pattern matching any of the target names."""
+    return re.compile("|".join(map(re.escape, targets)), re.IGNORECASE)
+
+
+def write_pisa(pisa_ops):
+    """Write p-isa ops to stdout, one per line, in a single write call."""
+    # One write per kernel; writelines pays the text layer's overhead per line
+    sys.stdout.write("".join([f"{pisa}\n" for pisa in pisa_ops]))
 
 
 def should_apply_reordering(kernel, targets):
     """Check if reordering should be applied to this kernel."""
-    return targets and any(target.lower() in str(kernel).lower() for target in targets)
+    return bool(targets) and _target_pattern(tuple(targets)).search(str(kernel)) is not None
+
+
+def process_kernel(kernel, args):
+    """Write the p-isa ops of a kernel, reordered if it is targeted."""
+    if should_apply_reordering(kernel, args.target):
+        process_kernel_with_reordering(kernel, args)
+    else:
+        write_pisa(kernel.to_pisa())
+
+
+def _init_worker(legacy):
+    """Set up the global configuration of a worker process."""
+    Config.legacy_mode = legacy
+
+
+def _render_kernel(kernel, args):
+    """Return everything process_kernel writes for a kernel as a string."""
+    with io.StringIO() as buf, contextlib.redirect_stdout(buf):
+        process_kernel(kernel, args)
+        return buf.getvalue()
 
 
 def main(args):
     """Main function to read input and parse each line with KernelParser."""
-    input_lines = sys.stdin.read().strip().splitlines()
     Config.legacy_mode = args.legacy
+    # Stream stdin rather than reading it whole; blank lines carry no kernel
+    input_lines = (line.rstrip("\r\n") for line in sys.stdin if not line.isspace())
 
     valid_kernels = parse_kernels(input_lines, args.debug)
 
@@ -184,12 +241,15 @@ def main(args):
         else:
             print(f"# Reordered targets {args.target} with primary key {args.primary} and secondary key {args.secondary}")
 
-    for kernel in valid_kernels:
-        if should_apply_reordering(kernel, args.target):
-            process_kernel_with_reordering(kernel, args)
-        else:
-            for pisa in kernel.to_pisa():
-                print(pisa)
+    if args.jobs == 1:
+        for kernel in valid_kernels:
+            process_kernel(kernel, args)
+        return
+
+    # Kernels are independent; each worker renders whole kernels and the
+    # results are written in input order, so the output is unchanged
+    with ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_worker, initargs=(args.legacy,)) as executor:
+        sys.stdout.writelines(executor.map(_render_kernel, valid_kernels, [args] * len(valid_kernels), chunksize=16))
 
 
 if __name__ == "__main__":
@@ -9,7 +9,7 @@ import high_parser.pisa_operations as pisa_op
 from high_parser import HighOp, Immediate, KernelContext, Polys
 from high_parser.pisa_operations import Comment, PIsaOp
 
-from .basic import Muli, mixed_to_pisa_ops
+from .basic import Muli
 from .ntt import INTT, NTT
 
 
@@ -32,55 +32,46 @@ class DigitDecompExtend(HighOp):
         r2 = Immediate(name="R2", rns=self.context.key_rns)
 
         ls: list[pisa_op] = []
-        for input_rns_index in range(self.input0.start_rns, self.input0.rns):
-            # muli for 0-current_rns
-            ls.extend(
-                pisa_op.Muli(
-                    self.context.label,
-                    self.output(part, pq, unit),
-                    rns_poly(part, input_rns_index, unit),
-                    r2(part, pq, unit),
-                    pq,
+        label = self.context.label
+        input_rns_indices = range(self.input0.start_rns, self.input0.rns)
+        parts = range(self.input0.start_parts, self.input0.parts)
+        units = range(self.context.units)
+        # Destination and immediate operands do not depend on the input rns
+        # index, so expand them once: muli for 0-current_rns, then for krns
+        muli_operands = (
+            [
+                (part, unit, self.output(part, pq, unit), r2(part, pq, unit), pq)
+                for part, pq, unit in it.chain(
+                    it.product(parts, range(self.context.current_rns), units),
+                    it.product(parts, range(self.context.max_rns, self.context.key_rns), units),
                 )
-                for part, pq, unit in it.product(
-                    range(self.input0.start_parts, self.input0.parts),
-                    range(self.context.current_rns),
-                    range(self.context.units),
-                )
-            )
-            # muli for krns
-            ls.extend(
-                pisa_op.Muli(
-                    self.context.label,
-                    self.output(part, pq, unit),
-                    rns_poly(part, input_rns_index, unit),
-                    r2(part, pq, unit),
-                    pq,
-                )
-                for part, pq, unit in it.product(
-                    range(self.input0.start_parts, self.input0.parts),
-                    range(self.context.max_rns, self.context.key_rns),
-                    range(self.context.units),
-                )
-            )
+            ]
+            if input_rns_indices
+            else []
+        )
+        # NTT inputs are the same for every input rns index
+        output_split = Polys.from_polys(self.output)
+        output_split.rns = self.context.current_rns
+        output_split_krns = Polys.from_polys(self.output)
+        output_split_krns.rns = self.context.key_rns
+        output_split_krns.start_rns = self.context.max_rns
+        for input_rns_index in input_rns_indices:
+            sources = {(part, unit): rns_poly(part, input_rns_index, unit) for part, unit in it.product(parts, units)}
+            ls += [pisa_op.Muli(label, output, sources[part, unit], immediate, pq) for part, unit, output, immediate, pq in muli_operands]
 
             output_tmp = Polys.from_polys(self.output)
             output_tmp.name += f"_tmp{input_rns_index}"
-            output_split = Polys.from_polys(self.output)
-            output_split.rns = self.context.current_rns
             # ntt for 0-current_rns
             ls.extend(NTT(self.context, output_tmp, output_split).to_pisa())
-
-            output_split = Polys.from_polys(self.output)
-            output_split.rns = self.context.key_rns
-            output_split.start_rns = self.context.max_rns
             # ntt for krns
-            ls.extend(NTT(self.context, output_tmp, output_split).to_pisa())
+            ls.extend(NTT(self.context, output_tmp, output_split_krns).to_pisa())
 
-        return mixed_to_pisa_ops(
-            INTT(self.context, rns_poly, self.input0),
-            Muli(self.context, rns_poly, rns_poly, one),
+        # ls is already flat p-isa ops; splice it in directly rather than
+        # walking it again through mixed_to_pisa_ops
+        return [
+            *INTT(self.context, rns_poly, self.input0).to_pisa(),
+            *Muli(self.context, rns_poly, rns_poly, one).to_pisa(),
             Comment("<reorderable>"),
-            ls,
+            *ls,
             Comment("</reorderable>"),
-        )
+        ]
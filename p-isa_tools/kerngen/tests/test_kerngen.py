@@ -3,9 +3,14 @@
 
 """Test the expected behaviour of the kerngen script"""
 
+import importlib.util
+import io
+import sys
+import traceback
 from enum import Enum
 from pathlib import Path
 from subprocess import run
+from types import ModuleType
 
 import pytest
 from high_parser.parser import ParseResults
@@ -32,117 +37,117 @@ def execute_process(cmd: list[str], data_in=None):
     )
 
 
-@pytest.mark.parametrize("gen_op_data", ["ADD", "MUL"], indirect=True)
-def test_op(kerngen_path, gen_op_data):
-    """Test kerngen outputs correct data based on input for various operations"""
-    input_string, expected_out = gen_op_data
+def test_script(kerngen_path):
+    """Test the kerngen script runs end-to-end as a process"""
+    input_string = "CONTEXT BGV 16384 4 3\nData a 2\nData b 2\nData c 2\nADD a b c\n"
     result = execute_process(
         [kerngen_path],
         data_in=input_string,
     )
-    assert expected_out in result.stdout
+    assert "0, add, a_0_0_0, b_0_0_0, c_0_0_0, 0" in result.stdout
     assert not result.stderr
     assert result.returncode == 0
 
 
-def test_missing_context(kerngen_path):
+@pytest.mark.parametrize("gen_op_data", ["ADD", "MUL"], indirect=True)
+def test_op(run_kerngen, gen_op_data):
+    """Test kerngen outputs correct data based on input for various operations"""
+    input_string, expected_out = gen_op_data
+    out, err = run_kerngen(input_string)
+    assert expected_out in out
+    assert not err
+
+
+def test_missing_context(run_kerngen, capsys):
     """Test kerngen raises an exception when context is not the first line of
     input"""
     input_string = "ADD a b c\nCONTEXT BGV 16384 4 3\n"
-    result = execute_process(
-        [kerngen_path],
-        data_in=input_string,
-    )
-    assert not result.stdout
-    assert "RuntimeError: No `CONTEXT` provided before `ADD a b c`" in result.stderr
-    assert result.returncode != 0
+    with pytest.raises(SystemExit) as e:
+        run_kerngen(input_string)
+    out, err = capsys.readouterr()
+    assert not out
+    assert "RuntimeError: No `CONTEXT` provided before `ADD a b c`" in err
+    assert e.value.code != 0
 
 
-def test_multiple_contexts(kerngen_path):
+def test_multiple_contexts(run_kerngen, capsys):
     """Test kerngen raises an exception when more than one context is given"""
     input_string = "CONTEXT BGV 16384 4 2\nData a 2\nCONTEXT BGV 16384 4 2\n"
-    result = execute_process(
-        [kerngen_path],
-        data_in=input_string,
-    )
-    assert not result.stdout
-    assert "RuntimeError: Second context given" in result.stderr
-    assert result.returncode != 0
+    with pytest.raises(SystemExit) as e:
+        run_kerngen(input_string)
+    out, err = capsys.readouterr()
+    assert not out
+    assert "RuntimeError: Second context given" in err
+    assert e.value.code != 0
 
 
-def test_context_options_without_key(kerngen_path):
+def test_context_options_without_key(run_kerngen, capsys):
     """Test kerngen raises an exception when more than one context is given"""
     input_string = "CONTEXT BGV 16384 3 2 1\nData a 2\n"
-    result = execute_process(
-        [kerngen_path],
-        data_in=input_string,
-    )
-    assert not result.stdout
-    assert "ValueError: Options must be key/value pairs (e.g. num_digits=3): '1'" in result.stderr
-    assert result.returncode != 0
+    with pytest.raises(SystemExit) as e:
+        run_kerngen(input_string)
+    out, err = capsys.readouterr()
+    assert not out
+    assert "ValueError: Options must be key/value pairs (e.g. num_digits=3): '1'" in err
+    assert e.value.code != 0
 
 
-def test_context_unsupported_options_variable(kerngen_path):
+def test_context_unsupported_options_variable(run_kerngen, capsys):
     """Test kerngen raises an exception when more than one context is given"""
     input_string = "CONTEXT BGV 16384 3 2 test=3\nData a 2\n"
-    result = execute_process(
-        [kerngen_path],
-        data_in=input_string,
-    )
-    assert not result.stdout
-    assert "Invalid options name: 'test'" in result.stderr
-    assert result.returncode != 0
+    with pytest.raises(SystemExit) as e:
+        run_kerngen(input_string)
+    out, err = capsys.readouterr()
+    assert not out
+    assert "Invalid options name: 'test'" in err
+    assert e.value.code != 0
 
 
 @pytest.mark.parametrize("invalid", [-1, 256, 0.1, "str"])
-def test_context_option_invalid_values(kerngen_path, invalid):
+def test_context_option_invalid_values(run_kerngen, capsys, invalid):
     """Test kerngen raises an exception if value is out of range for correct key"""
     input_string = f"CONTEXT BGV 16384 3 2 num_digits={invalid}\nData a 2\n"
-    result = execute_process(
-        [kerngen_path],
-        data_in=input_string,
-    )
-    assert not result.stdout
-    assert f"ValueError: Options must be key/value pairs (e.g. num_digits=3): 'num_digits={invalid}'" in result.stderr
-    assert result.returncode != 0
+    with pytest.raises(SystemExit) as e:
+        run_kerngen(input_string)
+    out, err = capsys.readouterr()
+    assert not out
+    assert f"ValueError: Options must be key/value pairs (e.g. num_digits=3): 'num_digits={invalid}'" in err
+    assert e.value.code != 0
 
 
-def test_unrecognised_opname(kerngen_path):
+def test_unrecognised_opname(run_kerngen, capsys):
     """Test kerngen raises an exception when receiving an unrecognised
     opname"""
     input_string = "CONTEXT BGV 16384 3 2\nOPERATION a b c\n"
-    result = execute_process(
-        [kerngen_path],
-        data_in=input_string,
-    )
-    assert not result.stdout
-    assert "GeneratorError: Op not found in available pisa ops: OPERATION" in result.stderr
-    assert result.returncode != 0
+    with pytest.raises(SystemExit) as e:
+        run_kerngen(input_string)
+    out, err = capsys.readouterr()
+    assert not out
+    assert "GeneratorError: Op not found in available pisa ops: OPERATION" in err
+    assert e.value.code != 0
 
 
-def test_invalid_scheme(kerngen_path):
+def test_invalid_scheme(run_kerngen, capsys):
     """Test kerngen raises an exception when receiving an invalid scheme"""
     input_string = "CONTEXT SCHEME 16384 4 3\nADD a b c\n"
-    result = execute_process(
-        [kerngen_path],
-        data_in=input_string,
-    )
-    assert not result.stdout
-    assert "GeneratorError: Scheme `SCHEME` not found in manifest file" in result.stderr
-    assert result.returncode != 0
+    with pytest.raises(SystemExit) as e:
+        run_kerngen(input_string)
+    out, err = capsys.readouterr()
+    assert not out
+    assert "GeneratorError: Scheme `SCHEME` not found in manifest file" in err
+    assert e.value.code != 0
 
 
 @pytest.mark.parametrize("invalid_poly", [16000, 2**12, 2**13, 2**18])
-def test_invalid_poly_order(kerngen_path, invalid_poly):
+def test_invalid_poly_order(run_kerngen, capsys, invalid_poly):
     """Poly order should be powers of two >= 2^14 and <= 2^17"""
     input_string = "CONTEXT BGV " + str(invalid_poly) + " 4 3\nADD a b c\n"
-    result = execute_process(
-        [kerngen_path],
-        data_in=input_string,
-    )
-    assert not result.stdout
-    assert "ValueError: Poly order `" + str(invalid_poly) + "` must be power of two >=" in result.stderr
-    assert result.returncode != 0
+    with pytest.raises(SystemExit) as e:
+        run_kerngen(input_string)
+    out, err = capsys.readouterr()
+    assert not out
+    assert "ValueError: Poly order `" + str(invalid_poly) + "` must be power of two >=" in err
+    assert e.value.code != 0
 
 
 def test_parse_results_missing_context():
@@ -186,3 +191,34 @@ def fixture_gen_op_data(request):
 def fixture_kerngen_path() -> Path:
     """Returns the absolute path to the `kerngen.py` script"""
     return Path(__file__).resolve().parent.parent / "kerngen.py"
+
+
+@pytest.fixture(name="kerngen_script")
+def fixture_kerngen_script(kerngen_path) -> ModuleType:
+    """Returns the `kerngen.py` script loaded as a module. It is loaded from its
+    path under a distinct name as `kerngen` also names the package directory"""
+    spec = importlib.util.spec_from_file_location("kerngen_script", kerngen_path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(name="run_kerngen")
+def fixture_run_kerngen(kerngen_script, monkeypatch, capsys):
+    """Returns a function running kerngen's main in-process on the given input,
+    which returns the captured stdout and stderr. As with the script run as a
+    process, an uncaught exception prints its traceback to stderr and exits
+    with a non-zero code"""
+
+    def _run(data_in: str) -> tuple[str, str]:
+        monkeypatch.setattr(sys, "argv", ["kerngen.py"])
+        monkeypatch.setattr(sys, "stdin", io.StringIO(data_in))
+        try:
+            kerngen_script.main(kerngen_script.parse_args())
+        except Exception as e:
+            traceback.print_exc()
+            raise SystemExit(1) from e
+        return capsys.readouterr()
+
+    return _run
@@ -4,17 +4,20 @@
 # generative artificial intelligence solutions.
 
 """
-Unit tests for the `parse_args` function from the `kerngraph` module.
+Unit tests for the `parse_args` function from the `kerngraph` module, and for
+running the `kerngraph.py` script with several worker processes.
 
 These tests verify the correct parsing of command-line arguments, including:
 - Default argument values.
 - Handling of the debug flag.
 - Parsing multiple target arguments.
 - Valid and invalid combinations of primary and secondary loop keys.
+- Parsing the number of worker processes.
 - Error handling for invalid argument values.
 
-Helper:
-- `run_parse_args_with_args`: Temporarily sets `sys.argv` to simulate command-line input for testing.
+Helpers:
+- `run_parse_args_with_args`: Parses the given command-line arguments with `parse_args`.
+- `run_script`: Runs a script of this directory as a process on the given input.
 
 Test Cases:
 - `test_parse_args_defaults`: Checks default argument values.
@@ -23,10 +26,16 @@ Test Cases:
 - `test_parse_args_primary_secondary_valid`: Checks valid primary and secondary loop key combinations.
 - `test_parse_args_primary_secondary_same`: Ensures error is raised if primary and secondary keys are the same.
 - `test_parse_args_invalid_primary_secondary`: Ensures error is raised for invalid primary or secondary key values.
+- `test_parse_args_jobs`: Checks parsing the number of worker processes.
+- `test_parse_args_jobs_invalid`: Ensures error is raised for a non-positive number of worker processes.
+- `test_kerngraph_jobs_output_identical`: Checks output with several worker processes matches the sequential run.
+- `test_kerngraph_jobs_zero`: Ensures the script rejects a non-positive number of worker processes.
 """
 
 import sys
 from argparse import Namespace
+from pathlib import Path
+from subprocess import run
 
 import pytest
 from const.options import LoopKey
@@ -34,13 +43,20 @@ from kerngraph import parse_args
 
 
 def run_parse_args_with_args(args):
-    """Helper to run parse_args with specific sys.argv"""
-    sys_argv_backup = sys.argv
-    sys.argv = ["kerngraph.py"] + args
-    try:
-        return parse_args()
-    finally:
-        sys.argv = sys_argv_backup
+    """Helper to run parse_args with specific commandline arguments"""
+    return parse_args(args)
+
+
+def run_script(script, args, data_in):
+    """Helper to run a script of this directory with specific commandline
+    arguments on `data_in`. NOTE: the returncode is not checked"""
+    return run(  # noqa: S603
+        [sys.executable, str(Path(__file__).resolve().parent.parent / script), *args],
+        input=data_in,
+        capture_output=True,
+        check=False,
+        encoding="utf-8",
+    )
 
 
 def test_parse_args_defaults():
@@ -50,6 +66,7 @@ def test_parse_args_defaults():
     assert args.debug is False
     assert args.target == []
     assert args.primary == LoopKey.PART
+    assert args.jobs == 1
 
 
 def test_parse_args_debug_flag():
@@ -73,11 +90,8 @@ def test_parse_args_primary_secondary_valid():
 
 def test_parse_args_primary_secondary_same():
     """Test that primary and secondary keys cannot be the same."""
-    sys_argv_backup = sys.argv
-    sys.argv = ["kerngraph.py", "-p", "rns", "-s", "rns"]
     with pytest.raises(ValueError, match="Primary and secondary keys cannot be the same."):
-        parse_args()
-    sys.argv = sys_argv_backup
+        run_parse_args_with_args(["-p", "rns", "-s", "rns"])
 
 
 def test_parse_args_invalid_primary_secondary():
@@ -86,3 +100,45 @@ def test_parse_args_invalid_primary_secondary():
         with pytest.raises(SystemExit) as excinfo:
             run_parse_args_with_args([flag, "invalid"])
         assert excinfo.value.code != 0  # Ensure the exit code indicates an error
+
+
+def test_parse_args_jobs():
+    """Test parsing the number of worker processes."""
+    args = run_parse_args_with_args(["-j", "4"])
+    assert args.jobs == 4
+
+
+def test_parse_args_jobs_invalid():
+    """Test that a non-positive number of worker processes raises an error."""
+    with pytest.raises(ValueError, match="Number of jobs must be at least 1."):
+        run_parse_args_with_args(["--jobs", "0"])
+
+
+@pytest.mark.parametrize("targets", [[], ["-t", "add", "mul"]])
+def test_kerngraph_jobs_output_identical(kernel_strings, targets):
+    """Test that kerngraph writes the same output with several worker processes
+    as it does sequentially."""
+    sequential = run_script("kerngraph.py", [*targets, "-j", "1"], kernel_strings)
+    parallel = run_script("kerngraph.py", [*targets, "-j", "2"], kernel_strings)
+    assert sequential.returncode == 0
+    assert parallel.returncode == 0
+    assert parallel.stdout == sequential.stdout
+
+
+def test_kerngraph_jobs_zero(kernel_strings):
+    """Test that the kerngraph script rejects zero worker processes."""
+    result = run_script("kerngraph.py", ["--jobs", "0"], kernel_strings)
+    assert not result.stdout
+    assert "ValueError: Number of jobs must be at least 1." in result.stderr
+    assert result.returncode != 0
+
+
+@pytest.fixture(name="kernel_strings", scope="module")
+def fixture_kernel_strings():
+    """Returns kerngen output for more kernels than one chunk of work handed
+    to a kerngraph worker process"""
+    in_lines = ["CONTEXT BGV 16384 4 3", "Data a 2", "Data b 2", "Data c 2"]
+    in_lines += ["ADD c a b", "MUL c a b"] * 20
+    result = run_script("kerngen.py", [], "\n".join(in_lines))
+    assert result.returncode == 0
+    return result.stdout